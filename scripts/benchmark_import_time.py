@@ -0,0 +1,47 @@
+"""Measure how long importing the package and its entry points takes.
+
+Each module is imported in a fresh interpreter, so nothing is already loaded, and the best of
+several runs is kept. Also reports whether pandas got imported along the way:
+
+    uv run python scripts/benchmark_import_time.py --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+MODULES = ("psr.lakehouse.__main__", "psr.lakehouse", "psr.lakehouse.client")
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started, "pandas" in sys.modules)
+"""
+
+
+def time_import(module: str) -> tuple[float, bool]:
+    """Seconds taken to import `module` in a new interpreter, and whether pandas was imported."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), output[1] == "True"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=MODULES, help="modules to import (default: entry points)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed imports per module; the best is kept")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        runs = [time_import(module) for _ in range(args.repeat)]
+        seconds = min(seconds for seconds, _ in runs)
+        pandas = "imports pandas" if runs[0][1] else "no pandas"
+        print(f"{module:>24}: {seconds * 1000:7.1f} ms  ({pandas})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare how fast each JSON decoder reads a page of query results.
+
+Builds a synthetic columnar page shaped like the wide tables (e.g. 33 columns of
+aneel_distributed_generation_projects) and times every installed decoder on it:
+
+    uv run python scripts/benchmark_json_decode.py --rows 10000 --columns 33
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+
+from psr.lakehouse.decoders import JSON_DECODERS, get_json_decoder
+from psr.lakehouse.exceptions import LakehouseError
+
+
+def make_page(rows: int, columns: int) -> bytes:
+    """A /query/ response in the columnar format, with text, numeric, null and date-time cells."""
+    rng = random.Random(0)
+    names = [f"Model.column_{i}" for i in range(columns)]
+
+    def cell(i: int):
+        kind = i % 4
+        if kind == 0:
+            return f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00-03:00"
+        if kind == 1:
+            return rng.random() * 1000
+        if kind == 2:
+            return rng.choice(["NORTE", "NORDESTE", "SUDESTE", "SUL", None])
+        return rng.randint(0, 10**6)
+
+    document = {
+        "data": {"columns": names, "rows": [[cell(i) for i in range(columns)] for _ in range(rows)]},
+        "pagination": {"page": 1, "page_size": rows, "has_next": True, "has_prev": False},
+    }
+    return json.dumps(document).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="rows per page (default: 10000)")
+    parser.add_argument("--columns", type=int, default=33, help="columns per row (default: 33)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per decoder; the best is kept")
+    args = parser.parse_args()
+
+    page = make_page(args.rows, args.columns)
+    print(f"page: {args.rows} rows x {args.columns} columns, {len(page) / 1024**2:.1f} MiB")
+
+    baseline = None
+    for name in reversed(JSON_DECODERS):
+        try:
+            decode = get_json_decoder(name)
+        except LakehouseError:
+            print(f"{name:>8}: not installed")
+            continue
+        seconds = min(timeit.repeat(lambda: decode(page), number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(f"{name:>8}: {seconds * 1000:8.1f} ms per page  ({baseline / seconds:.1f}x json)")
+
+
+if __name__ == "__main__":
+    main()
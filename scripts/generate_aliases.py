@@ -1,27 +1,28 @@
+"""Generate src/psr/lakehouse/aliases.py, the offline fallback of the client's table aliases.
+
+Works from a single OpenAPI document: downloaded once from the API in LAKEHOUSE_API_URL, or
+read from a file with --spec, which needs no network (e.g. in CI):
+
+    uv run python scripts/generate_aliases.py --spec openapi.json
+"""
+
 from __future__ import annotations
 
-import re
+import argparse
+import json
 import textwrap
 from pathlib import Path
 
 import dotenv
 
 from psr.lakehouse import client
+from psr.lakehouse.metadata import INTERNAL_COLUMNS, SKIP_TABLES, to_snake
+from psr.lakehouse.openapi import openapi_spec
 
 dotenv.load_dotenv()
 
 OUTPUT_PATH = Path(__file__).resolve().parent.parent / "src" / "psr" / "lakehouse" / "aliases.py"
 
-INTERNAL_COLUMNS = {"id", "updated_at", "deleted_at"}
-
-SKIP_TABLES = {"ceg", "ceg_data", "generator", "generator_generator_unit", "generator_unit"}
-
-
-def to_snake(s: str) -> str:
-    s = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", s)
-    s = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", s)
-    return s.lower()
-
 
 def generate_method(table_name: str, schema: dict) -> str:
     columns = [col for col in schema if col not in INTERNAL_COLUMNS]
@@ -45,22 +46,36 @@ def generate_register_function(method_names: list[str]) -> str:
     return "\n".join(lines) + "\n"
 
 
+def load_schemas(spec: Path | None) -> dict:
+    """The component schemas of the OpenAPI document in `spec`, or of the API's if not given."""
+    if spec is None:
+        print("Downloading the OpenAPI document from the API...")
+        return openapi_spec.schemas()
+    print(f"Reading the OpenAPI document from {spec}...")
+    return json.loads(spec.read_bytes())["components"]["schemas"]
+
+
 def main():
-    print("Discovering tables from API...")
-    model_names = client.list_tables()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spec", type=Path, help="OpenAPI document to read instead of downloading it")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help=f"file to write (default: {OUTPUT_PATH})")
+    args = parser.parse_args()
+
+    # Every table schema is built from this one document, its enum references included.
+    schemas = load_schemas(args.spec)
+    model_names = client._find_table_names(schemas)
     print(f"Found {len(model_names)} tables")
 
     methods = []
     method_names = []
 
     for model_name in model_names:
-        schema = client.get_schema(model_name)
-
         table_name = to_snake(model_name)
         if table_name in SKIP_TABLES:
             print(f"  Skipping {table_name}")
             continue
 
+        schema = client._build_table_schema(schemas, model_name)
         print(f"  {table_name} ({len(schema)} columns)")
         methods.append(generate_method(table_name, schema))
         method_names.append(table_name)
@@ -69,6 +84,9 @@ def main():
     header = textwrap.dedent("""\
     \"\"\"Auto-generated table aliases methods for the PSR Lakehouse Client.
 
+    The client resolves aliases from the API's OpenAPI document; these are only used when that
+    document cannot be loaded.
+
     DO NOT EDIT — regenerate with: make generate-aliases
     \"\"\"
 
@@ -81,8 +99,8 @@ def main():
         output += "\n" + method_src + "\n"
     output += "\n" + generate_register_function(method_names)
 
-    OUTPUT_PATH.write_text(output, encoding="utf-8")
-    print(f"\nGenerated {len(method_names)} aliases methods -> {OUTPUT_PATH}")
+    args.output.write_text(output, encoding="utf-8")
+    print(f"\nGenerated {len(method_names)} aliases methods -> {args.output}")
 
 
 if __name__ == "__main__":
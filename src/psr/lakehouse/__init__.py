@@ -1,5 +1,15 @@
-from .aliases import register_aliases
-from .client import client
+"""PSR Lakehouse client.
+
+Importing the package is cheap: the query client, the result cache and the asyncio client are
+imported on first use (PEP 562), so pandas is only loaded by code that builds DataFrames and the
+command line tools start without it.
+"""
+
+import sys
+from importlib import import_module
+from types import ModuleType
+
+from .aliases import register_aliases as register_aliases
 from .connector import connector as connector
 from .metadata import get_model_name
 
@@ -7,13 +17,51 @@ initialize = connector.initialize
 login = connector.login
 logout = connector.logout
 
-register_aliases()
+# Attributes imported on first access, and the module each comes from.
+_LAZY = {
+    "AsyncClient": "async_client",
+    "AsyncConnector": "async_connector",
+    "TableStore": "sync",
+    "client": "client",
+    "local_mirror": "local",
+    "result_cache": "cache",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+class _Package(ModuleType):
+    def __setattr__(self, name: str, value) -> None:
+        # Importing the `client` submodule binds it on the package, over the `client` instance
+        # that `psr.lakehouse.client` has always meant.
+        if name == "client" and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
 
 __all__ = [
+    "AsyncClient",
+    "AsyncConnector",
+    "TableStore",
     "client",
     "connector",
     "initialize",
     "login",
+    "local_mirror",
     "logout",
+    "result_cache",
     "get_model_name",
 ]
@@ -1,5 +1,8 @@
 """Auto-generated table aliases methods for the PSR Lakehouse Client.
 
+The client resolves aliases from the API's OpenAPI document; these are only used when that
+document cannot be loaded.
+
 DO NOT EDIT — regenerate with: make generate-aliases
 """
 
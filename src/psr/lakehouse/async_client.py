@@ -0,0 +1,152 @@
+"""asyncio counterpart of `psr.lakehouse.client`.
+
+Queries and schemas are built and parsed by the synchronous `client` — only the transport
+differs — so the two always send the same request bodies and return the same DataFrames.
+"""
+
+from collections.abc import AsyncIterator
+
+import pandas as pd
+
+from psr.lakehouse.async_connector import AsyncConnector
+from psr.lakehouse.client import _concat_frames, _DateColumns, client
+
+
+class AsyncClient:
+    """Query the lakehouse from asyncio code without blocking the event loop.
+
+    Use it as an async context manager, so its connections are closed with it:
+
+        async with AsyncClient() as lakehouse:
+            prices, load = await asyncio.gather(
+                lakehouse.fetch_dataframe("ccee_spot_price", start_reference_date="2024-01-01"),
+                lakehouse.fetch_dataframe("ons_energy_load_daily", start_reference_date="2024-01-01"),
+            )
+    """
+
+    def __init__(
+        self, base_url: str | None = None, max_connections: int = 100, connector: AsyncConnector | None = None
+    ):
+        """
+        Args:
+            base_url: API base URL. Defaults to LAKEHOUSE_API_URL environment variable.
+            max_connections: Most connections kept open to the API at once (default: 100)
+            connector: Optional connector to use instead of creating one
+        """
+        self._connector = connector or AsyncConnector(base_url, max_connections=max_connections)
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections held open to the API."""
+        await self._connector.aclose()
+
+    async def fetch_dataframe(
+        self,
+        table_name: str,
+        data_columns: list[str] | None = None,
+        filters: dict | None = None,
+        start_reference_date: str | None = None,
+        end_reference_date: str | None = None,
+        group_by: list[str] | None = None,
+        datetime_granularity: str | None = None,
+        order_by: list[dict] | None = None,
+        aggregation_method: str | None = None,
+        joins: list[dict] | None = None,
+        latest_only: bool = True,
+        output_timezone: str = "America/Sao_Paulo",
+        page_size: int = 10000,
+        timeout: int = 600,
+    ) -> pd.DataFrame:
+        """
+        Fetch data from the API and return as a pandas DataFrame.
+
+        Takes the same arguments as `Client.fetch_dataframe`.
+
+        Returns:
+            pandas DataFrame with the query results
+        """
+        json_body = client._build_query_body(
+            table_name,
+            data_columns=data_columns,
+            filters=filters,
+            start_reference_date=start_reference_date,
+            end_reference_date=end_reference_date,
+            group_by=group_by,
+            datetime_granularity=datetime_granularity,
+            order_by=order_by,
+            aggregation_method=aggregation_method,
+            joins=joins,
+            latest_only=latest_only,
+            output_timezone=output_timezone,
+        )
+        return await self.fetch_dataframe_from_query(json_body, page_size=page_size, timeout=timeout)
+
+    async def fetch_dataframe_from_query(
+        self, json_body: dict, page_size: int = 10000, timeout: int | None = 600
+    ) -> pd.DataFrame:
+        """
+        Fetch data from the API using a custom query JSON body and return as a pandas DataFrame.
+
+        Args:
+            json_body: JSON request body for the query
+            page_size: Number of records per page for API pagination (default: 10000)
+            timeout: Timeout in seconds for API requests (default: 600)
+
+        Returns:
+            pandas DataFrame with the query results
+        """
+        columns = None
+        frames = []
+        timezone = json_body.get("output_timezone")
+        dates = _DateColumns()
+
+        async for response in self._iter_pages(json_body, page_size=page_size, timeout=timeout):
+            data = response["data"]
+            if isinstance(data, list):
+                rows = data
+            else:
+                columns = data["columns"]
+                rows = data["rows"]
+            if rows:
+                frames.append(client._build_dataframe(columns, rows, timezone=timezone, dates=dates))
+
+        if not frames:
+            return client._build_dataframe(columns, [], timezone=timezone)
+        return _concat_frames(frames, "pandas")
+
+    async def _iter_pages(self, json_body: dict, page_size: int, timeout: int | None) -> AsyncIterator[dict]:
+        """Yield the response for every page of results, in page order."""
+        page = 1
+        while True:
+            response = await self._connector.post(
+                "/query/",
+                json_body,
+                params={"page": page, "page_size": page_size, "response_format": "columnar"},
+                timeout=timeout,
+            )
+            yield response
+            if not response["pagination"]["has_next"]:
+                return
+            page += 1
+
+    async def _fetch_openapi_schema(self) -> dict:
+        """Fetch OpenAPI schema from the API."""
+        return (await self._connector.get("/openapi.json"))["components"]["schemas"]
+
+    async def get_schema(self, table_name: str) -> dict:
+        """Get clean schema for a given table."""
+        return client._build_table_schema(await self._fetch_openapi_schema(), table_name)
+
+    async def list_tables(self) -> list[str]:
+        """List all available tables in Lakehouse."""
+        return client._find_table_names(await self._fetch_openapi_schema())
+
+    async def get_table_columns(self, table_name: str) -> list[str]:
+        """Get list of columns for a given table."""
+        schema = await self.get_schema(table_name)
+        return list(schema.keys())
@@ -0,0 +1,266 @@
+"""asyncio counterpart of `psr.lakehouse.connector`, on top of `httpx`.
+
+Unlike `Connector` this is not a process-wide singleton: an `httpx.AsyncClient` belongs to the
+event loop it was created on, so each `AsyncClient` owns its connector and closes it with
+itself. Everything else is shared with the synchronous side — the cached session from
+`auth.load_session`, the recognition of a bounce to the identity provider, and the browser
+login, which runs in a worker thread so the loop keeps serving the other requests meanwhile.
+"""
+
+import asyncio
+import os
+
+import requests
+
+from psr.lakehouse import auth
+from psr.lakehouse.connector import health_check_skipped
+from psr.lakehouse.decoders import decode_json
+from psr.lakehouse.exceptions import LakehouseAuthError, LakehouseError
+from psr.lakehouse.transfer import Transfer, TransferStats, httpx_accept_encoding
+
+# Mirrors the `Retry` that `Connector._create_session` mounts: three retries of transient
+# gateway errors, backing off 1, 2 and 4 seconds.
+_RETRY_STATUSES = {502, 503, 504}
+_RETRIES = 3
+_BACKOFF_FACTOR = 1
+
+
+class AsyncConnector:
+    _base_url: str | None
+
+    def __init__(self, base_url: str | None = None, max_connections: int = 100, transport=None):
+        """
+        Args:
+            base_url: API base URL. Defaults to LAKEHOUSE_API_URL environment variable.
+            max_connections: Most connections kept open to the API at once; requests beyond that
+                wait for a free one (default: 100).
+            transport: Optional `httpx` transport, mainly for tests.
+        """
+        self._base_url = base_url
+        self._max_connections = max_connections
+        self._transport = transport
+        self._client = None
+        self._is_initialized = False
+        self._reachable = False
+        self._init_lock = asyncio.Lock()
+        self._login_lock = asyncio.Lock()
+        self._logins = 0
+        self.transfer_stats = TransferStats()
+
+        # The cookie store is a `requests` session's jar, for two reasons: it is what
+        # `auth.load_session` and `auth.login` know how to fill, and `httpx` adopts a `CookieJar`
+        # it is given rather than copying it, so a login completed on the session is seen by
+        # every request that follows.
+        self._session = requests.Session()
+
+    async def __aenter__(self) -> "AsyncConnector":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections held open to the API."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._is_initialized = False
+
+    def _create_client(self):
+        """Create an HTTP client sharing the session's cookies, with keep-alive and compressed responses."""
+        try:
+            import httpx
+        except ImportError as e:
+            raise LakehouseError(
+                "The asyncio client needs httpx. Install it with: pip install 'psr-lakehouse[async]'"
+            ) from e
+
+        return httpx.AsyncClient(
+            cookies=self._session.cookies,
+            headers={"Accept-Encoding": httpx_accept_encoding()},
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self._max_connections),
+            transport=self._transport,
+        )
+
+    async def initialize(self, base_url: str | None = None, check: bool | None = None) -> None:
+        """
+        Initialize the connector with API URL.
+
+        Args:
+            base_url: API base URL. Defaults to the one given to the constructor, then to the
+                LAKEHOUSE_API_URL environment variable.
+            check: Whether to check that the API is reachable now; see `Connector.initialize`.
+                Defaults to True, unless the LAKEHOUSE_SKIP_HEALTHCHECK environment variable is set.
+        """
+        async with self._init_lock:
+            self._base_url = base_url or self._base_url or os.getenv("LAKEHOUSE_API_URL")
+            if not self._base_url:
+                raise LakehouseError(
+                    "API base URL not provided. Set LAKEHOUSE_API_URL environment variable or pass base_url parameter."
+                )
+            self._base_url = self._base_url.rstrip("/")
+
+            if self._client is None:
+                self._client = self._create_client()
+
+            auth.load_session(self._base_url, self._session)
+
+            if check is None:
+                check = not health_check_skipped()
+            if check:
+                try:
+                    response = await self._client.get(f"{self._base_url}/health-check", timeout=10)
+                    if not response.json():
+                        raise LakehouseError("Health check failed: API returned a non-truthy response.")
+                except LakehouseError:
+                    raise
+                except Exception as e:
+                    raise LakehouseError(
+                        f"Health check failed: Unable to connect to API at {self._base_url}. {e}"
+                    ) from e
+
+            self._reachable = check
+            self._is_initialized = True
+
+    async def _request(self, method: str, url: str, **kwargs):
+        """Send a request, retrying transient gateway and transport errors with backoff."""
+        import httpx
+
+        for attempt in range(_RETRIES + 1):
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt == _RETRIES:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt == _RETRIES:
+                    return response
+            await asyncio.sleep(_BACKOFF_FACTOR * 2**attempt)
+
+    async def _login(self, logins_seen: int) -> None:
+        """Log in because a request was bounced, unless a concurrent request already did."""
+        async with self._login_lock:
+            if self._logins != logins_seen:
+                return
+            await asyncio.to_thread(auth.ensure_login, self._session, self._base_url)
+            self._logins += 1
+
+    async def _send(self, method: str, url: str, **kwargs) -> dict:
+        """Send a request, logging in and retrying once if it was bounced to the login page.
+
+        See `Connector._send`. Many requests are usually in flight at once, so when a stale
+        session bounces all of them only the first logs in; the rest wait for it and retry.
+        """
+        logins_seen = self._logins
+        response = await self._request(method, url, **kwargs)
+        self._reachable = True
+
+        if auth.bounced_to_idp(response, self._base_url):
+            await self._login(logins_seen)
+            response = await self._request(method, url, **kwargs)
+            if auth.bounced_to_idp(response, self._base_url):
+                raise LakehouseAuthError(
+                    f"Still being redirected to the login page after logging in, requesting {url}."
+                )
+
+        if response.status_code == 403:
+            raise LakehouseAuthError(
+                f"{self._base_url} rejected this account (HTTP 403). Access requires a verified "
+                "@psr-inc.com email; run `psr-lakehouse login` to sign in as a different user."
+            )
+
+        if response.is_error:
+            raise LakehouseError(self._format_http_error(response, url))
+        content = response.content
+        self.transfer_stats.record(
+            Transfer(
+                url,
+                response.headers.get("Content-Encoding"),
+                response.num_bytes_downloaded or len(content),
+                len(content),
+            )
+        )
+        try:
+            return decode_json(content)
+        except ValueError as e:
+            raise LakehouseError(f"Invalid JSON in the response from {url}: {e}") from e
+
+    async def post(self, endpoint: str, json_body: dict, params: dict | None = None, timeout: int = 600) -> dict:
+        """
+        Make a POST request to the API.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/query/")
+            json_body: JSON request body
+            params: Optional query parameters
+            timeout: Request timeout in seconds (default: 600)
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            LakehouseError: If the request fails
+        """
+        if not self._is_initialized:
+            await self.initialize()
+
+        url = f"{self._base_url}{endpoint}"
+
+        try:
+            return await self._send("POST", url, json=json_body, params=params, timeout=timeout)
+        except LakehouseError:
+            raise
+        except Exception as e:
+            raise LakehouseError(self._format_request_error(e, url)) from e
+
+    async def get(self, endpoint: str, params: dict | None = None) -> dict:
+        """
+        Make a GET request to the API.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/openapi.json")
+            params: Optional query parameters
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            LakehouseError: If the request fails
+        """
+        if not self._is_initialized:
+            await self.initialize()
+
+        url = f"{self._base_url}{endpoint}"
+
+        try:
+            return await self._send("GET", url, params=params, timeout=60)
+        except LakehouseError:
+            raise
+        except Exception as e:
+            raise LakehouseError(self._format_request_error(e, url)) from e
+
+    def _format_request_error(self, error: Exception, url: str) -> str:
+        """Format a request that got no response, as the health check would have if it was skipped."""
+        import httpx
+
+        if not self._reachable and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return f"Unable to connect to API at {self._base_url}. {error}"
+        return f"Request to {url} failed: {error}"
+
+    @staticmethod
+    def _format_http_error(response, url: str) -> str:
+        """Format an HTTP error response into a concise, readable message."""
+        status_code = response.status_code
+        reason = response.reason_phrase
+
+        # Try to extract a JSON error detail from the response
+        try:
+            detail = response.json()
+            if isinstance(detail, dict) and "detail" in detail:
+                detail = detail["detail"]
+            return f"HTTP {status_code} {reason} for {url}: {detail}"
+        except Exception:
+            pass
+
+        return f"HTTP {status_code} {reason} for {url}"
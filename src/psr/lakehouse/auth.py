@@ -251,9 +251,10 @@ def bounced_to_idp(response: requests.Response, base_url: str) -> bool:
 
     `requests` follows the ALB's redirect for us, so an unauthenticated request quietly ends up
     on the Cognito domain with a `200` and a page of HTML. Comparing the host of the *final* URL
-    is what tells the two apart — the status code alone does not.
+    is what tells the two apart — the status code alone does not. The `str` is for the async
+    connector, whose `httpx` responses carry a URL object rather than a string.
     """
-    return _host(response.url) != _host(base_url)
+    return _host(str(response.url)) != _host(base_url)
 
 
 # --------------------------------------------------------------------------- #
@@ -0,0 +1,374 @@
+"""On-disk cache of query results, keyed by the query itself.
+
+A result is stored as one Parquet file named after the SHA-256 of the canonical JSON of the
+query body and the API it was sent to. The body holds everything else that shapes the result —
+table, columns, filters, date window, `latest_only` and `output_timezone` — while what merely
+shapes the transfer, such as the page size, stays out of the key.
+
+There is no index to keep consistent: a file's modification time is when the result was
+fetched, which drives expiry, and its access time is bumped on every hit, which drives the
+least-recently-used eviction once the directory grows past its size budget. The rows the
+incremental `range_cache` holds for a query share that budget, evicted as a whole.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from psr.lakehouse.exceptions import LakehouseError
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+# Only `fetch_dataframe` knows which table and date window a query is about.
+TABLE_CACHE_MODES = (*CACHE_MODES, "incremental")
+
+_DEFAULT_TTL = 24 * 3600
+_DEFAULT_MAX_BYTES = 2 * 1024**3
+
+# Subdirectory of the result cache holding `RangeCache`, one directory per key.
+_RANGES = "ranges"
+
+
+def query_key(json_body: dict) -> str:
+    """Hash a query body into a cache key that does not depend on the order of its keys."""
+    canonical = json.dumps(json_body, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def check_cache_mode(cache: str, modes: tuple[str, ...] = CACHE_MODES) -> None:
+    """Reject anything but the given cache modes."""
+    if cache not in modes:
+        supported = ", ".join(f"'{mode}'" for mode in modes)
+        raise LakehouseError(f"Unsupported cache mode '{cache}'. Supported: {supported}.")
+
+
+class ResultCache:
+    _instance = None
+
+    _directory: Path | None = None
+    _ttl: float | None = None
+    _max_bytes: int | None = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def configure(
+        self,
+        directory: str | os.PathLike | None = None,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Configure where results are cached and for how long.
+
+        Args:
+            directory: Cache directory. Defaults to LAKEHOUSE_CACHE_DIR, then to
+                ~/.psr-lakehouse/cache.
+            ttl: Seconds a result stays valid; 0 keeps results until they are evicted. Defaults
+                to LAKEHOUSE_CACHE_TTL, then to one day.
+            max_bytes: Size budget of the directory, the incremental cache's ranges included;
+                the least recently used results are evicted beyond it. Defaults to
+                LAKEHOUSE_CACHE_MAX_BYTES, then to 2 GiB.
+        """
+        self._directory = Path(directory).expanduser() if directory is not None else None
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is not None:
+            return self._directory
+        override = os.getenv("LAKEHOUSE_CACHE_DIR")
+        if override:
+            return Path(override).expanduser()
+        return Path.home() / ".psr-lakehouse" / "cache"
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return float(os.getenv("LAKEHOUSE_CACHE_TTL", _DEFAULT_TTL))
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return int(os.getenv("LAKEHOUSE_CACHE_MAX_BYTES", _DEFAULT_MAX_BYTES))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.parquet"
+
+    def get(self, key: str, backend: str = "pandas") -> pd.DataFrame | None:
+        """Return the cached result for `key`, or None when there is no fresh one.
+
+        With `backend="polars"` the result is read back as a polars DataFrame.
+        """
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        now = time.time()
+        if self.ttl and now - stat.st_mtime > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            if backend == "polars":
+                import polars as pl
+
+                df = pl.read_parquet(path)
+            else:
+                df = pd.read_parquet(path)
+        except ImportError as e:
+            raise LakehouseError(
+                "Caching results needs pyarrow. Install it with: pip install 'psr-lakehouse[arrow]'"
+            ) from e
+        except Exception:
+            # A truncated or otherwise unreadable file is a miss, not a failed query.
+            path.unlink(missing_ok=True)
+            return None
+
+        # The access time is the recency used for eviction; the modification time, which
+        # records when the result was fetched, is left alone.
+        try:
+            os.utime(path, (now, stat.st_mtime))
+        except OSError:
+            pass
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """Store the result for `key`, then evict old results beyond the size budget.
+
+        `df` may also be a polars DataFrame, which is written by polars itself.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written to a sibling private to this thread and renamed, so neither a concurrent
+        # writer nor an interrupted write can leave a half-written file under the real name.
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if isinstance(df, pd.DataFrame):
+                df.to_parquet(tmp, index=False)
+            else:
+                df.write_parquet(tmp)
+        except ImportError as e:
+            raise LakehouseError(
+                "Caching results needs pyarrow. Install it with: pip install 'psr-lakehouse[arrow]'"
+            ) from e
+        except Exception:
+            # Not every DataFrame survives Parquet (e.g. an object column of mixed types). The
+            # result itself is fine, so it is returned uncached rather than failing the query.
+            tmp.unlink(missing_ok=True)
+            return
+        tmp.replace(path)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+
+        # The segments of a range key only make sense together, so the key goes as a whole; its
+        # index is read on every use, which makes its access time the key's recency.
+        for index in self.directory.glob(f"{_RANGES}/*/index.json"):
+            try:
+                used = index.stat().st_atime
+                size = sum(path.stat().st_size for path in index.parent.iterdir())
+            except OSError:
+                continue
+            entries.append((used, size, index.parent))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached result, the incremental cache's ranges included."""
+        for path in self.directory.glob("*.parquet"):
+            path.unlink(missing_ok=True)
+        shutil.rmtree(self.directory / _RANGES, ignore_errors=True)
+
+
+result_cache = ResultCache()
+
+
+class RangeCache:
+    """Rows of a time series cached by the reference-date intervals they cover.
+
+    Where `ResultCache` only recognises a query it has seen verbatim, this one is keyed by the
+    query *without* its date window and records which days it holds, so a window that slid
+    forward is answered from disk except for the days it has not seen. Those gaps are fetched
+    and stored as segments — a Parquet file each, listed with the interval it covers in an
+    `index.json` per key — and a segment that continues the one before it is merged into it,
+    so a daily refresh does not leave a file per day behind.
+
+    Recent data is still being revised upstream, so the last `settle_days` days are never
+    recorded as covered: they are fetched again every time, and only stored once they settle.
+    Days are those of the reference date in the query's output timezone.
+
+    The segments count towards the size budget of `result_cache`, which evicts the least
+    recently used keys whole, and `result_cache.clear()` removes them too.
+    """
+
+    _instance = None
+
+    _settle_days: int | None = None
+
+    # Merging stops once a segment holds this many rows, bounding what one merge rewrites.
+    _SEGMENT_ROWS = 1_000_000
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def configure(self, settle_days: int | None = None) -> None:
+        """
+        Configure the incremental cache. It lives in the `ranges` directory of `result_cache`.
+
+        Args:
+            settle_days: Number of most recent days that are always fetched again rather than
+                cached. Defaults to LAKEHOUSE_CACHE_SETTLE_DAYS, then to 3.
+        """
+        self._settle_days = settle_days
+
+    @property
+    def directory(self) -> Path:
+        return result_cache.directory / _RANGES
+
+    @property
+    def settle_days(self) -> int:
+        if self._settle_days is not None:
+            return self._settle_days
+        return int(os.getenv("LAKEHOUSE_CACHE_SETTLE_DAYS", 3))
+
+    def _index_path(self, key: str) -> Path:
+        return self.directory / key / "index.json"
+
+    def _segments(self, key: str) -> list[dict]:
+        path = self._index_path(key)
+        try:
+            segments = json.loads(path.read_text(encoding="utf-8"))
+            # The access time is the recency `result_cache` evicts by, bumped where atime is not kept.
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        except (OSError, ValueError):
+            return []
+        if not isinstance(segments, list):
+            return []
+        return sorted(segments, key=lambda segment: segment["start"])
+
+    def _write_segments(self, key: str, segments: list[dict]) -> None:
+        path = self._index_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(segments, indent=2), encoding="utf-8")
+        tmp.replace(path)
+
+    def missing(self, key: str, start: date, end: date) -> list[tuple[date, date]]:
+        """Return the intervals of [start, end] (inclusive) that are not cached, in order."""
+        gaps = []
+        cursor = start
+        for segment in self._segments(key):
+            segment_start = date.fromisoformat(segment["start"])
+            segment_end = date.fromisoformat(segment["end"])
+            if segment_end < cursor:
+                continue
+            if segment_start > end:
+                break
+            if segment_start > cursor:
+                gaps.append((cursor, segment_start - timedelta(days=1)))
+            cursor = segment_end + timedelta(days=1)
+            if cursor > end:
+                break
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def read(self, key: str, start: date, end: date, date_column: str) -> list[tuple[date, pd.DataFrame]]:
+        """Return the cached rows within [start, end] as (first day, rows) pieces, in order."""
+        pieces = []
+        for segment in self._segments(key):
+            lo = max(start, date.fromisoformat(segment["start"]))
+            hi = min(end, date.fromisoformat(segment["end"]))
+            if lo > hi:
+                continue
+            df = pd.read_parquet(self.directory / key / segment["file"])
+            pieces.append((lo, _between(df, date_column, lo, hi)))
+        return pieces
+
+    def add(self, key: str, start: date, end: date, df: pd.DataFrame, date_column: str) -> None:
+        """Store the rows fetched for [start, end], keeping only the days that have settled."""
+        end = min(end, date.today() - timedelta(days=self.settle_days))
+        if end < start:
+            return
+        df = _between(df, date_column, start, end)
+
+        with self._lock:
+            directory = self.directory / key
+            directory.mkdir(parents=True, exist_ok=True)
+            segments = self._segments(key)
+
+            previous = next(
+                (s for s in segments if date.fromisoformat(s["end"]) == start - timedelta(days=1)),
+                None,
+            )
+            if previous is not None and previous["rows"] + len(df) <= self._SEGMENT_ROWS:
+                segments.remove(previous)
+                df = pd.concat([pd.read_parquet(directory / previous["file"]), df], ignore_index=True)
+                start = date.fromisoformat(previous["start"])
+            else:
+                previous = None
+
+            name = f"{start.isoformat()}_{end.isoformat()}.parquet"
+            try:
+                df.to_parquet(directory / name, index=False)
+            except ImportError as e:
+                raise LakehouseError(
+                    "Caching results needs pyarrow. Install it with: pip install 'psr-lakehouse[arrow]'"
+                ) from e
+
+            segments.append({"start": start.isoformat(), "end": end.isoformat(), "file": name, "rows": len(df)})
+            self._write_segments(key, segments)
+            if previous is not None and previous["file"] != name:
+                (directory / previous["file"]).unlink(missing_ok=True)
+
+        result_cache._evict()
+
+    def clear(self) -> None:
+        """Remove every cached interval."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _between(df: pd.DataFrame, date_column: str, start: date, end: date) -> pd.DataFrame:
+    """Rows whose reference date falls on a day in [start, end], read as a wall-clock date."""
+    dates = df[date_column]
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    mask = (dates >= pd.Timestamp(start)) & (dates < pd.Timestamp(end + timedelta(days=1)))
+    return df[mask.to_numpy()].reset_index(drop=True)
+
+
+range_cache = RangeCache()
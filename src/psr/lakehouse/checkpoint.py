@@ -0,0 +1,122 @@
+"""Page-level checkpoints, so that a long fetch that fails can resume where it stopped.
+
+With checkpointing on, every page of a query is written to a spill directory as soon as it
+arrives, under the hash of the query, the API and the page size. Running the same query again serves the
+pages already there from disk and fetches only from the first one missing, so a failure on page
+180 of 200 costs 20 pages rather than 200. A query's directory is removed once its last page has
+been read, and a checkpoint older than `max_age` is discarded rather than resumed, so a stale
+partial download is never mixed with fresh pages.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from psr.lakehouse.cache import query_key, result_cache
+from psr.lakehouse.connector import connector
+
+_DEFAULT_MAX_AGE = 24 * 3600
+
+
+class Checkpoint:
+    """The pages of one query saved so far."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _path(self, page: int) -> Path:
+        return self.directory / f"page-{page:06d}.json"
+
+    def load(self, page: int) -> dict | None:
+        """Return the saved response for `page`, or None if it was not saved."""
+        try:
+            return json.loads(self._path(page).read_bytes())
+        except (OSError, ValueError):
+            # A page cut short by the crash being recovered from is just a missing page.
+            return None
+
+    def save(self, page: int, response: dict) -> None:
+        """Save the response for `page`."""
+        path = self._path(page)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(response, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(path)
+
+    def pages(self) -> list[int]:
+        """The page numbers saved, in order."""
+        return sorted(int(path.stem.removeprefix("page-")) for path in self.directory.glob("page-*.json"))
+
+    def clear(self) -> None:
+        """Remove the saved pages, once they are no longer needed."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class PageCheckpoints:
+    _instance = None
+
+    _directory: Path | None = None
+    _max_age: float | None = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def configure(self, directory: str | os.PathLike | None = None, max_age: float | None = None) -> None:
+        """
+        Configure where checkpoints are kept and for how long they can be resumed.
+
+        Args:
+            directory: Spill directory. Defaults to LAKEHOUSE_CHECKPOINT_DIR, then to the
+                `checkpoints` directory of `result_cache`.
+            max_age: Seconds after which an unfinished checkpoint is started over instead of
+                resumed. Defaults to LAKEHOUSE_CHECKPOINT_MAX_AGE, then to one day.
+        """
+        self._directory = Path(directory).expanduser() if directory is not None else None
+        self._max_age = max_age
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is not None:
+            return self._directory
+        override = os.getenv("LAKEHOUSE_CHECKPOINT_DIR")
+        if override:
+            return Path(override).expanduser()
+        return result_cache.directory / "checkpoints"
+
+    @property
+    def max_age(self) -> float:
+        if self._max_age is not None:
+            return self._max_age
+        return float(os.getenv("LAKEHOUSE_CHECKPOINT_MAX_AGE", _DEFAULT_MAX_AGE))
+
+    def open(self, json_body: dict, page_size: int) -> Checkpoint:
+        """Return the checkpoint of a query, resuming it unless it is too old."""
+        # Page n covers different rows at another page size, or on another API, so both are part
+        # of the key.
+        key = query_key({"api": connector.base_url, "query": json_body, "page_size": page_size})
+        checkpoint = Checkpoint(self.directory / key)
+
+        marker = checkpoint.directory / "started"
+        try:
+            started = marker.stat().st_mtime
+        except OSError:
+            started = None
+        if started is not None and time.time() - started > self.max_age:
+            checkpoint.clear()
+            started = None
+
+        if started is None:
+            checkpoint.directory.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        return checkpoint
+
+    def clear(self) -> None:
+        """Remove every checkpoint."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+page_checkpoints = PageCheckpoints()
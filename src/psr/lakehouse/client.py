@@ -1,21 +1,342 @@
+import os
 import re
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import MethodType
+from typing import TYPE_CHECKING
 
 import pandas as pd
+import requests
 
+from psr.lakehouse import aliases
+from psr.lakehouse.cache import TABLE_CACHE_MODES, check_cache_mode, query_key, range_cache, result_cache
+from psr.lakehouse.checkpoint import page_checkpoints
 from psr.lakehouse.connector import connector
-from psr.lakehouse.exceptions import LakehouseError
-from psr.lakehouse.metadata import get_model_name
+from psr.lakehouse.dedup import latest_versions
+from psr.lakehouse.dtypes import DATETIME_VALUE, parse_datetimes, polars_series, typed_array
+from psr.lakehouse.exceptions import LakehouseBatchError, LakehouseError
+from psr.lakehouse.metadata import INTERNAL_COLUMNS, SKIP_TABLES, get_model_name, to_snake
+from psr.lakehouse.openapi import openapi_spec
+from psr.lakehouse.singleflight import SingleFlight
+from psr.lakehouse.sync import TableStore
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+BACKENDS = ("pandas", "polars")
+
+SHARD_PERIODS = ("week", "month", "year")
+
+# The datetime granularities whose groups never straddle two shards of each period.
+_SHARD_NESTED = {
+    "week": ("hour", "day", "week"),
+    "month": ("hour", "day", "month"),
+    "year": ("hour", "day", "month", "year"),
+}
+_SHARD_ATTEMPTS = 3
+
+# page_size="auto": the first page's size, the bounds every later one stays within, and the
+# response size and time each page is sized to reach.
+_AUTO_PAGE_START = 8192
+_AUTO_PAGE_MIN = 256
+_AUTO_PAGE_MAX = 262144
+_AUTO_PAGE_BYTES = 16 * 1024**2
+_AUTO_PAGE_SECONDS = 20.0
+
+# Fetches running in fetch_dataframe_from_query, by result key.
+_in_flight = SingleFlight()
+
+# What a table name, and so an alias, looks like (see `to_snake`).
+_TABLE_NAME = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+def _import_pyarrow():
+    """Import pyarrow, which the Arrow and Parquet results need but the package does not."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise LakehouseError(
+            "Arrow and Parquet results need pyarrow. Install it with: pip install 'psr-lakehouse[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def _check_page_size(page_size: int | str, max_workers: int, checkpoint: bool = False) -> None:
+    """Reject page sizes other than a positive number or "auto", and "auto" where it cannot work."""
+    if page_size == "auto":
+        if max_workers > 1:
+            raise LakehouseError("page_size='auto' sizes each page from the last one, so it needs max_workers=1.")
+        if checkpoint:
+            raise LakehouseError("Checkpoints are saved page by page, so they need a fixed page_size.")
+        return
+    if isinstance(page_size, str) or page_size < 1:
+        raise LakehouseError(f"'page_size' must be a positive number of rows or 'auto', got {page_size!r}.")
+
+
+def _is_overload(error: LakehouseError) -> bool:
+    """Whether a failed request looks like the page was too big: a timeout, dropped connection or 5xx."""
+    cause = error.__cause__
+    if isinstance(cause, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    if isinstance(cause, requests.exceptions.RetryError):
+        # urllib3 gave up retrying 502/503/504.
+        return True
+    if isinstance(cause, requests.exceptions.HTTPError) and cause.response is not None:
+        return cause.response.status_code >= 500
+    return False
+
+
+def _floor_power_of_two(n: int) -> int:
+    """The largest power of two not above `n` (which must be at least 1)."""
+    return 1 << (n.bit_length() - 1)
+
+
+def _next_page_size(size: int, rows: int, body_bytes: int | None, elapsed: float, ceiling: int) -> int:
+    """Size the next page so it lands near the byte and time budgets, changing at most fourfold."""
+    wanted = []
+    if body_bytes:
+        wanted.append(_AUTO_PAGE_BYTES * rows / body_bytes)
+    if elapsed > 0:
+        wanted.append(_AUTO_PAGE_SECONDS * rows / elapsed)
+    target = min(wanted) if wanted else size
+    target = min(max(target, size / 4), size * 4)
+    return min(max(_floor_power_of_two(max(int(target), 1)), _AUTO_PAGE_MIN), ceiling)
+
+
+def _shard_dates(start: date, end: date, shard_by: str) -> list[tuple[date, date]]:
+    """Split the inclusive window [start, end] at calendar week (Monday), month or year boundaries."""
+    shards = []
+    shard_start = start
+    while shard_start <= end:
+        if shard_by == "week":
+            next_start = shard_start + timedelta(days=7 - shard_start.weekday())
+        elif shard_by == "month":
+            next_start = (shard_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            next_start = shard_start.replace(year=shard_start.year + 1, month=1, day=1)
+        shards.append((shard_start, min(next_start - timedelta(days=1), end)))
+        shard_start = next_start
+    return shards
+
+
+def _concat_frames(frames: list, backend: str) -> "pd.DataFrame | pl.DataFrame":
+    """Concatenate consecutive chunks of one result."""
+    if len(frames) == 1:
+        return frames[0]
+    if backend == "polars":
+        import polars as pl
+
+        # Relaxed, so a page whose integers turned out fractional widens the column to Float64.
+        return pl.concat(frames, how="vertical_relaxed")
+
+    # A date column null throughout a page is left as objects there; it takes the dtype the
+    # other pages parsed it into, as Arrow promotes a null column.
+    dates = {
+        i: dtype
+        for frame in frames
+        for i, dtype in enumerate(frame.dtypes)
+        if pd.api.types.is_datetime64_any_dtype(dtype)
+    }
+    promoted = []
+    for frame in frames:
+        for i, dtype in dates.items():
+            if frame.dtypes.iloc[i] == object and frame.iloc[:, i].isna().all():
+                frame = frame.copy(deep=False)
+                frame.isetitem(i, frame.iloc[:, i].astype(dtype))
+        promoted.append(frame)
+    return pd.concat(promoted, ignore_index=True)
+
+
+def _first_present(values) -> object:
+    """The first value of a list, Series or Arrow array that is not missing, or None."""
+    if isinstance(values, pd.Series):
+        index = values.first_valid_index()
+        return None if index is None else values[index]
+    if isinstance(values, list):
+        # pandas holds missing text as NaN, which is not equal to itself.
+        return next((value for value in values if value is not None and value == value), None)
+    present = values.drop_null()
+    return present[0].as_py() if len(present) else None
+
+
+class _DateColumns:
+    """Which text columns of one query's result hold dates, decided once for all its pages.
+
+    A column is told by the first value it shows: date-times by their look, and reference dates
+    whatever they hold. Each page is built on its own, and keeping to the first decision means a
+    column is not parsed on one page and left as text on the next. A column whose values turn
+    out not to parse is left as text from then on, unless it is a reference date.
+    """
+
+    def __init__(self):
+        # By position, as a join may return two columns under one name.
+        self._kinds: dict[int, str | None] = {}
+
+    def kind(self, i: int, column: str, values) -> str | None:
+        """How column `i` is to be parsed, "date-time" or "date", or None to leave it as it is."""
+        if i in self._kinds:
+            return self._kinds[i]
+        first = _first_present(values)
+        if first is None:
+            # Nothing to tell it by on this page.
+            return None
+        if not isinstance(first, str):
+            kind = None
+        elif DATETIME_VALUE.match(first):
+            kind = "date-time"
+        else:
+            kind = "date" if column.endswith("reference_date") else None
+        self._kinds[i] = kind
+        return kind
+
+    def reject(self, i: int) -> None:
+        """Leave column `i` as text from now on, its values not being dates after all."""
+        self._kinds[i] = None
+
+    def parse(self, i: int, column: str, values, timezone: str | None):
+        """Parse column `i` into datetimes in `timezone`, or return None if it holds none."""
+        kind = self.kind(i, column, values)
+        if kind is None:
+            return None
+        if isinstance(values, pd.Series):
+            values = values.tolist()
+        try:
+            if kind == "date-time":
+                return parse_datetimes(values, timezone)
+            return pd.to_datetime(pd.Series(values, dtype=object), format="ISO8601").array
+        except (TypeError, ValueError):
+            if column.endswith("reference_date"):
+                raise
+            self.reject(i)
+            return None
+
+
+def _generated_alias(name: str):
+    """The generated alias of a table, e.g. `ccee_spot_price`, or None if there is none by that name."""
+    if name == "register_aliases":
+        return None
+    alias = getattr(aliases, name, None)
+    return alias if callable(alias) else None
+
+
+def _table_alias(table_name: str):
+    """An alias method fetching the data columns the OpenAPI document lists for `table_name`."""
+
+    def alias(self, **kwargs):
+        try:
+            data_columns = self._alias_columns().get(table_name)
+        except LakehouseError:
+            generated = _generated_alias(table_name)
+            if generated is None:
+                raise
+            return generated(self, **kwargs)
+        if data_columns is None:
+            raise LakehouseError(f"Table '{table_name}' is no longer listed by the API.")
+        return self.fetch_dataframe(table_name=table_name, data_columns=data_columns, **kwargs)
+
+    alias.__name__ = alias.__qualname__ = table_name
+    alias.__doc__ = f"Fetch {table_name}; takes the arguments of `fetch_dataframe` apart from `data_columns`."
+    return alias
+
+
+def _check_backend(backend: str) -> None:
+    """Reject unknown DataFrame backends, and polars when it is not installed."""
+    if backend not in BACKENDS:
+        supported = ", ".join(f"'{name}'" for name in BACKENDS)
+        raise LakehouseError(f"Unsupported backend '{backend}'. Supported: {supported}.")
+    if backend == "polars":
+        try:
+            import polars  # noqa: F401
+        except ImportError as e:
+            raise LakehouseError(
+                "The polars backend needs polars. Install it with: pip install 'psr-lakehouse[polars]'"
+            ) from e
 
 
 class Client:
     _instance = None
 
+    # The OpenAPI document the alias columns were last worked out from, and those columns.
+    _spec_aliases: tuple[dict | None, dict[str, list[str]]] = (None, {})
+    # When the document last failed to load for an alias.
+    _spec_failure: float | None = None
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    def __getattr__(self, name: str):
+        # Table aliases, e.g. client.ccee_spot_price(...), are resolved on first use.
+        alias = self._resolve_alias(name)
+        if alias is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return alias
+
+    def __dir__(self) -> list[str]:
+        names = {name for name in vars(aliases) if _generated_alias(name)} | set(self._spec_aliases[1])
+        return sorted(set(super().__dir__()) | names)
+
+    def _resolve_alias(self, name: str):
+        """Return the alias method of table `name`, or None if there is no such table.
+
+        Tables are taken from the OpenAPI document (see `openapi_spec`), so a table added to the
+        API has its alias straight away; the generated `aliases` module only stands in when the
+        document cannot be loaded. An alias found in the document is bound to the class, so it
+        is looked up once.
+
+        Only names that could be tables are looked up, and once a document has been loaded only
+        those it or the generated aliases list, so `hasattr` or a typo does not set up the
+        connector or download the document.
+        """
+        if not _TABLE_NAME.match(name):
+            return None
+        cached_document, tables = self._spec_aliases
+        if cached_document is not None and name not in tables and _generated_alias(name) is None:
+            return None
+        try:
+            tables = self._alias_columns()
+        except LakehouseError:
+            alias = _generated_alias(name)
+            return MethodType(alias, self) if alias is not None else None
+        if name not in tables:
+            return None
+        setattr(type(self), name, _table_alias(name))
+        return getattr(self, name)
+
+    def _alias_columns(self) -> dict[str, list[str]]:
+        """The data columns of each table alias, by table name, as the OpenAPI document lists them.
+
+        Worked out once per version of the document, so each lookup is a dictionary access. A
+        document that fails to load, or an API that cannot be reached to ask for it, is not tried
+        again for `openapi_spec.max_age` seconds, so aliases used offline fall back to the
+        generated ones at once rather than after retries.
+        """
+        failed_at = self._spec_failure
+        if failed_at is not None and time.monotonic() - failed_at < openapi_spec.max_age:
+            raise LakehouseError("The OpenAPI document could not be loaded.")
+        try:
+            document = openapi_spec.document()
+        except LakehouseError:
+            Client._spec_failure = time.monotonic()
+            raise
+        cached_document, columns = self._spec_aliases
+        if cached_document is not document:
+            schemas = document["components"]["schemas"]
+            columns = {}
+            for model_name in self._find_table_names(schemas):
+                table_name = to_snake(model_name)
+                if table_name not in SKIP_TABLES:
+                    properties = schemas[model_name]["properties"]
+                    columns[table_name] = [column for column in properties if column not in INTERNAL_COLUMNS]
+            Client._spec_aliases = (document, columns)
+        return columns
+
     def _build_query_data(self, model_name: str, columns: list[str]) -> list[str]:
         """Build query_data list with Model.column format."""
         return [f"{model_name}.{col}" for col in columns]
@@ -118,41 +439,262 @@ class Client:
 
         return joins
 
-    def _fetch_all_pages(
-        self, json_body: dict, page_size: int = 10000, timeout: int = 600
-    ) -> tuple[list[str] | None, list]:
-        """Fetch all pages of results.
+    def _fetch_page(self, json_body: dict, page: int, page_size: int, timeout: int | None) -> dict:
+        """Fetch a single page of results in the columnar response format."""
+        return connector.post(
+            "/query/",
+            json_body,
+            params={"page": page, "page_size": page_size, "response_format": "columnar"},
+            timeout=timeout,
+        )
 
-        Requests the columnar response format and returns (columns, rows). When the
-        server predates the columnar format and returns records, columns is None and
-        rows is the list of record dicts.
+    def _iter_pages(
+        self,
+        json_body: dict,
+        page_size: int | str = 10000,
+        timeout: int | None = 600,
+        max_workers: int = 1,
+        checkpoint: bool = False,
+    ) -> Iterator[dict]:
+        """Yield the response for every page of results, in page order.
+
+        With `checkpoint`, each page is saved as it arrives and served from the save on a later
+        run of the same query (see `psr.lakehouse.checkpoint`); the saves are removed once the
+        last page has been yielded.
+
+        The server only reports whether a next page exists, never how many there are, so with
+        `max_workers` above one the pages after the first are fetched speculatively: up to
+        `max_workers` requests are kept in flight ahead of the page being consumed, and the window
+        stops at the first page that reports no successor. The handful of requests already sent
+        past the end come back empty and are discarded.
+
+        `page_size="auto"` hands over to `_iter_pages_adaptive`.
         """
-        columns = None
-        all_rows = []
-        page = 1
+        _check_page_size(page_size, max_workers, checkpoint)
+        if page_size == "auto":
+            yield from self._iter_pages_adaptive(json_body, timeout)
+            return
+        if not checkpoint:
+            yield from self._iter_fixed_pages(json_body, page_size, timeout, max_workers, self._fetch_page)
+            return
+
+        saved = page_checkpoints.open(json_body, page_size)
+
+        def fetch_page(json_body: dict, page: int, page_size: int, timeout: int | None) -> dict:
+            response = saved.load(page)
+            if response is None:
+                response = self._fetch_page(json_body, page, page_size, timeout)
+                saved.save(page, response)
+            return response
+
+        yield from self._iter_fixed_pages(json_body, page_size, timeout, max_workers, fetch_page)
+        saved.clear()
+
+    def _iter_fixed_pages(
+        self, json_body: dict, page_size: int, timeout: int | None, max_workers: int, fetch_page
+    ) -> Iterator[dict]:
+        """Yield every page of `page_size` rows got with `fetch_page`, in order; see `_iter_pages`."""
+        response = fetch_page(json_body, 1, page_size, timeout)
+        yield response
+        if not response["pagination"]["has_next"]:
+            return
+
+        if max_workers <= 1:
+            page = 2
+            while True:
+                response = fetch_page(json_body, page, page_size, timeout)
+                yield response
+                if not response["pagination"]["has_next"]:
+                    return
+                page += 1
+
+        # Every worker goes through the connector's one session, so the pages share its
+        # keep-alive connections and cookies.
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lakehouse-page")
+        in_flight = deque()
+        next_page = 2
+        try:
+            while True:
+                while len(in_flight) < max_workers:
+                    in_flight.append(pool.submit(fetch_page, json_body, next_page, page_size, timeout))
+                    next_page += 1
+                response = in_flight.popleft().result()
+                yield response
+                if not response["pagination"]["has_next"]:
+                    return
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_pages_adaptive(self, json_body: dict, timeout: int | None) -> Iterator[dict]:
+        """Yield every page of results, sizing each page from the ones before it.
+
+        Each page is sized so that the next one should come to about `_AUTO_PAGE_BYTES` of JSON
+        and take about `_AUTO_PAGE_SECONDS`, judged by the size and time of the last response,
+        changing at most fourfold per step. Sizes are powers of two, and a larger size is held to
+        the largest power of two dividing the row offset reached, so that the next page starts
+        exactly there: pages grow by doubling as the offset allows, rather than asking for rows
+        already fetched again. When the offset is not such a multiple (e.g. after the server
+        returned a shorter page than asked for), the page holding it is fetched and the rows
+        already seen are dropped.
+
+        A timeout, connection failure or 5xx makes the same rows be asked for again in pages a
+        quarter of the size, and the size never grows back past half the one that failed.
+        """
+        size = _AUTO_PAGE_START
+        ceiling = _AUTO_PAGE_MAX
+        offset = 0
 
         while True:
-            response = connector.post(
-                "/query/",
-                json_body,
-                params={"page": page, "page_size": page_size, "response_format": "columnar"},
-                timeout=timeout,
-            )
+            page = offset // size + 1
+            skip = offset - (page - 1) * size
+            seen = connector.transfer_stats.last
+            started = time.monotonic()
+            try:
+                response = self._fetch_page(json_body, page, size, timeout)
+            except LakehouseError as e:
+                if size <= _AUTO_PAGE_MIN or not _is_overload(e):
+                    raise
+                ceiling = max(size // 2, _AUTO_PAGE_MIN)
+                size = max(size // 4, _AUTO_PAGE_MIN)
+                continue
+            elapsed = time.monotonic() - started
+
             data = response["data"]
-            if isinstance(data, list):
-                all_rows.extend(data)
-            else:
-                if columns is None:
-                    columns = data["columns"]
-                all_rows.extend(data["rows"])
+            rows = data if isinstance(data, list) else data["rows"]
+            returned = len(rows)
+            if skip:
+                rows = rows[skip:]
+                data = rows if isinstance(data, list) else {**data, "rows": rows}
+                response = {**response, "data": data}
+            yield response
+            if not response["pagination"]["has_next"] or not returned:
+                return
+
+            if returned < size:
+                # A short page that is not the last one means the server caps the page size.
+                ceiling = min(ceiling, max(_floor_power_of_two(returned), _AUTO_PAGE_MIN))
+            offset = (page - 1) * size + returned
+
+            transfer = connector.transfer_stats.last
+            body_bytes = transfer.body_bytes if transfer is not None and transfer is not seen else None
+            size = _next_page_size(size, returned, body_bytes, elapsed, ceiling)
+            # Page numbers count from the first row, so a page only starts at the offset when its
+            # size divides it; a larger one would fetch rows already seen again.
+            aligned = offset & -offset
+            if aligned >= _AUTO_PAGE_MIN:
+                size = min(size, aligned)
+
+    def _build_dataframe(
+        self,
+        columns: list[str] | None,
+        rows: list,
+        fields: dict | None = None,
+        timezone: str | None = None,
+        dates: _DateColumns | None = None,
+    ) -> pd.DataFrame:
+        """Build a DataFrame from one batch of rows, parsing the date-time columns.
 
-            if not response["pagination"]["has_next"]:
-                break
-            page += 1
+        `columns` is None when the server predates the columnar format and `rows` are record
+        dicts. With `fields` (see `_column_fields`) each column is built directly with the dtype
+        of its schema field; columns without one are inferred by pandas as usual.
 
-        return columns, all_rows
+        Otherwise date-time columns are told by their values, so every one of them is parsed
+        (`updated_at` as much as `reference_date`) into datetimes in `timezone`. Pass the
+        `dates` of the query when building one of its pages, so that all of them agree.
+        """
+        if dates is None:
+            dates = _DateColumns()
+        if fields is not None:
+            return self._build_typed_dataframe(columns, rows, fields, timezone, dates)
 
-    def fetch_dataframe(
+        df = pd.DataFrame(rows, columns=columns) if columns is not None else pd.DataFrame(rows)
+
+        # By position, as a join may return two columns under one name.
+        for i, column in enumerate(df.columns):
+            if not pd.api.types.is_string_dtype(df.dtypes.iloc[i]):
+                continue
+            array = dates.parse(i, column, df.iloc[:, i], timezone)
+            if array is not None:
+                df.isetitem(i, array)
+
+        return df
+
+    def _build_typed_dataframe(
+        self, columns: list[str] | None, rows: list, fields: dict, timezone: str | None, dates: _DateColumns
+    ) -> pd.DataFrame:
+        """Build a DataFrame whose columns take their dtypes from their schema fields."""
+        if columns is None:
+            columns = list(rows[0]) if rows else []
+            values = [[row.get(column) for row in rows] for column in columns]
+        else:
+            values = [list(column) for column in zip(*rows)] if rows else [[] for _ in columns]
+
+        arrays = []
+        for i, (column, column_values) in enumerate(zip(columns, values)):
+            array = typed_array(column_values, fields.get(column), timezone)
+            if array is None:
+                array = dates.parse(i, column, column_values, timezone)
+                if array is None:
+                    array = pd.Series(column_values)
+            arrays.append(array)
+
+        # Assembled by position, as a join may return two columns under one name.
+        df = pd.DataFrame(dict(enumerate(arrays)))
+        df.columns = columns
+        return df
+
+    def _build_polars_frame(
+        self, columns: list[str] | None, rows: list, fields: dict, timezone: str | None
+    ) -> "pl.DataFrame":
+        """Build a polars DataFrame from one batch of rows, without going through pandas."""
+        import polars as pl
+
+        if columns is None:
+            columns = list(rows[0]) if rows else []
+            values = [[row.get(column) for row in rows] for column in columns]
+        else:
+            values = [list(column) for column in zip(*rows)] if rows else [[] for _ in columns]
+
+        return pl.DataFrame(
+            [
+                polars_series(column, column_values, fields.get(column), timezone)
+                for column, column_values in zip(columns, values)
+            ]
+        )
+
+    def _column_fields(self, columns: list[str]) -> dict:
+        """Map "Model.column" result columns to their fields in the (cached) table schemas.
+
+        Columns of unknown models or fields, such as aggregates renamed by the server, are left
+        out.
+        """
+        schemas = self._fetch_openapi_schema()
+        tables = {}
+        fields = {}
+        for column in columns:
+            model, _, name = column.rpartition(".")
+            if model not in tables:
+                known = "properties" in schemas.get(model, {})
+                tables[model] = self._build_table_schema(schemas, model) if known else {}
+            if name in tables[model]:
+                fields[column] = tables[model][name]
+        return fields
+
+    def _result_key(
+        self, json_body: dict, typed: bool, backend: str = "pandas", deduplicate: list[str] | None = None
+    ) -> str:
+        """Cache key of a query's result, which also depends on the API and on how and into what it is built."""
+        # The same query has other results on another API, e.g. staging rather than production.
+        scope = {"api": connector.base_url, "query": json_body}
+        if deduplicate:
+            scope.update(typed=typed, deduplicate=deduplicate)
+        elif backend != "pandas":
+            scope["backend"] = backend
+        elif typed:
+            scope["typed"] = True
+        return query_key(scope)
+
+    def _build_query_body(
         self,
         table_name: str,
         data_columns: list[str] | None = None,
@@ -166,38 +708,8 @@ class Client:
         joins: list[dict] | None = None,
         latest_only: bool = True,
         output_timezone: str = "America/Sao_Paulo",
-        page_size: int = 10000,
-        timeout: int = 600,
-    ) -> pd.DataFrame:
-        """
-        Fetch data from the API and return as a pandas DataFrame.
-
-        Args:
-            table_name: Name of the table to query (e.g., "ccee_spot_price")
-            data_columns: Optional columns to fetch. If not provided, all columns will be fetched.
-            filters: Optional dict of column: value filters. A scalar value filters by
-                equality; a list of values filters with an SQL IN clause
-                (e.g., {"subsystem": ["NORTH", "SOUTH"]})
-            start_reference_date: Optional start date filter (inclusive)
-            end_reference_date: Optional end date filter (exclusive)
-            group_by: Optional list of columns to group by
-            datetime_granularity: Optional datetime granularity for grouping (e.g., "day", "week", "month") - only applicable if group_by is set
-            order_by: Optional list of dicts with "column" and "direction" keys for ordering results (e.g., [{"column": "reference_date", "direction": "desc"}])
-            aggregation_method: Aggregation method (sum, avg, min, max) - required if group_by is set
-            joins: Optional list of dicts with "table", "on", and "type" keys for joining other tables
-            latest_only: If True (default), each table is deduplicated server-side to the latest
-                non-deleted version of each datapoint. Set to False to return the full version
-                history, including superseded and soft-deleted rows. Note: for tables whose
-                versioning constraint spans all data fields (ONS registry-source and
-                versioned-metadata tables), dedup is currently a no-op and duplicates may still
-                be returned (lakehouse_server issue #427).
-            output_timezone: Timezone for datetime output (default: "America/Sao_Paulo")
-            page_size: Number of records per page for API pagination (default: 10000)
-            timeout: Timeout in seconds for API requests (default: 600)
-
-        Returns:
-            pandas DataFrame with the query results
-        """
+    ) -> dict:
+        """Validate the high-level query arguments and build the /query/ JSON body."""
         # Validate group_by and aggregation_method
         if bool(group_by) ^ bool(aggregation_method is not None):
             raise LakehouseError("Both 'group_by' and 'aggregation_method' must be provided together.")
@@ -244,37 +756,1042 @@ class Client:
         if joins_clause:
             json_body["joins"] = joins_clause
 
-        return self.fetch_dataframe_from_query(json_body, page_size=page_size, timeout=timeout)
+        return json_body
+
+    def _plan_deduplication(
+        self, table_name: str, data_columns: list[str] | None, deduplicate: bool | list[str], unsupported: dict
+    ) -> tuple[list[str], list[dict], list[str], list[str]]:
+        """
+        Work out the query behind `deduplicate`.
+
+        Returns:
+            The columns to fetch, the order to fetch them in, the result columns of the natural
+            key, and the result columns fetched only for deduplication, to be dropped after
+        """
+        used = [name for name, value in unsupported.items() if value]
+        if used:
+            raise LakehouseError(f"deduplicate cannot be combined with {', '.join(used)}.")
+
+        model_name = get_model_name(table_name)
+        schema = None
+        if deduplicate is True or data_columns is None:
+            schema = openapi_spec.schemas().get(model_name)
+            if schema is None:
+                raise LakehouseError(f"Table '{table_name}' is not in the API schema.")
+        requested = list(data_columns) if data_columns is not None else list(schema["properties"])
+
+        if deduplicate is True:
+            # Tables may declare their natural key; otherwise a datapoint is every data column of
+            # the table, fetched or not, so rows differing only in a column left out stay apart.
+            properties = [c for c in schema["properties"] if c not in INTERNAL_COLUMNS]
+            key = list(schema.get("x-natural-key") or properties)
+        else:
+            key = list(deduplicate)
+        if not key:
+            raise LakehouseError(f"No natural key to deduplicate '{table_name}' by; pass its columns as deduplicate.")
+
+        columns = list(dict.fromkeys([*requested, *key, "updated_at", "deleted_at"]))
+        order_by = [{"column": column, "direction": "asc"} for column in [*key, "updated_at"]]
+        dropped = [f"{model_name}.{column}" for column in columns if column not in requested]
+        return columns, order_by, self._build_query_data(model_name, key), dropped
+
+    def fetch_dataframe(
+        self,
+        table_name: str,
+        data_columns: list[str] | None = None,
+        filters: dict | None = None,
+        start_reference_date: str | None = None,
+        end_reference_date: str | None = None,
+        group_by: list[str] | None = None,
+        datetime_granularity: str | None = None,
+        order_by: list[dict] | None = None,
+        aggregation_method: str | None = None,
+        joins: list[dict] | None = None,
+        latest_only: bool = True,
+        output_timezone: str = "America/Sao_Paulo",
+        page_size: int | str = 10000,
+        timeout: int = 600,
+        max_workers: int = 1,
+        cache: str = "bypass",
+        typed: bool = False,
+        backend: str = "pandas",
+        shard_by: str | None = None,
+        checkpoint: bool = False,
+        deduplicate: bool | list[str] = False,
+    ) -> "pd.DataFrame | pl.DataFrame":
+        """
+        Fetch data from the API and return as a pandas DataFrame.
+
+        Args:
+            table_name: Name of the table to query (e.g., "ccee_spot_price")
+            data_columns: Optional columns to fetch. If not provided, all columns will be fetched.
+            filters: Optional dict of column: value filters. A scalar value filters by
+                equality; a list of values filters with an SQL IN clause
+                (e.g., {"subsystem": ["NORTH", "SOUTH"]})
+            start_reference_date: Optional start date filter (inclusive)
+            end_reference_date: Optional end date filter (exclusive)
+            group_by: Optional list of columns to group by
+            datetime_granularity: Optional datetime granularity for grouping (e.g., "day", "week", "month") - only applicable if group_by is set
+            order_by: Optional list of dicts with "column" and "direction" keys for ordering results (e.g., [{"column": "reference_date", "direction": "desc"}])
+            aggregation_method: Aggregation method (sum, avg, min, max) - required if group_by is set
+            joins: Optional list of dicts with "table", "on", and "type" keys for joining other tables
+            latest_only: If True (default), each table is deduplicated server-side to the latest
+                non-deleted version of each datapoint. Set to False to return the full version
+                history, including superseded and soft-deleted rows. Note: for tables whose
+                versioning constraint spans all data fields (ONS registry-source and
+                versioned-metadata tables), dedup is currently a no-op and duplicates may still
+                be returned (lakehouse_server issue #427).
+            output_timezone: Timezone for datetime output (default: "America/Sao_Paulo")
+            page_size: Number of records per page for API pagination (default: 10000), or "auto"
+                to size each page from how large and slow the previous one was, so narrow tables
+                take few round trips and wide ones stay well within the timeout. "auto" fetches
+                one page after another, so it needs max_workers=1.
+            timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1, one page after another).
+                Rows are returned in page order regardless.
+            cache: How to use the on-disk result cache (see `psr.lakehouse.result_cache`):
+                "use" returns a fresh cached result of the same query if there is one and caches
+                what it fetches otherwise, "refresh" always fetches and caches the result, and
+                "bypass" (default) leaves the cache alone. "incremental" caches rows by the days
+                they cover (see `psr.lakehouse.cache.RangeCache`) and only fetches the days of
+                the window it does not hold yet; it needs both reference dates, and no group_by,
+                order_by or joins.
+            typed: If True, each column is built with the dtype of its field in the table
+                schema (see `get_schema`): nullable Int64/Float64/boolean, tz-aware datetimes for
+                every date-time field, categories for enums and Arrow-backed strings for text.
+                If False (default), dtypes are inferred by pandas and the date-time columns,
+                told by their values, are parsed into datetimes in `output_timezone`.
+            backend: "pandas" (default) or "polars". With "polars" a polars DataFrame is built
+                straight from the pages, always with the dtypes of the table schema, and pandas
+                is not involved. Call `.lazy()` on it for a LazyFrame.
+            shard_by: Optional "week", "month" or "year" to split the date window into calendar
+                periods queried independently, `max_workers` at a time, instead of paging deep
+                into a single query. Each shard is retried on its own after a timeout or server
+                error, and cached on its own with `cache`. Needs both reference dates; with
+                group_by, the datetime_granularity must nest within the shards.
+            checkpoint: If True, each page is saved to a spill directory as it arrives (see
+                `psr.lakehouse.checkpoint`), and running the same call again after a failure
+                resumes from the first page missing instead of page 1. Needs a fixed page_size.
+            deduplicate: If True, reduce the result client-side to the latest version of each
+                datapoint, leaving out those whose latest version is soft-deleted, for the tables
+                where `latest_only` leaves duplicates. A datapoint
+                is identified by the table's natural key: the "x-natural-key" its schema declares,
+                or else every data column of the table. A list of columns is used as the key
+                instead. Every version is fetched, with `latest_only=False` whatever it is set to,
+                and the result is ordered by the key; the key columns, `updated_at` and
+                `deleted_at` are fetched for the reduction and left out unless asked for. Not
+                available with group_by, order_by, joins, shard_by, cache="incremental" or
+                backend="polars".
+
+        Returns:
+            pandas DataFrame with the query results (polars DataFrame with backend="polars")
+        """
+        check_cache_mode(cache, TABLE_CACHE_MODES)
+        _check_backend(backend)
+        dedup_key = None
+        dropped = []
+        if deduplicate:
+            # Every version is asked for: the reduction needs deleted latest versions too, which
+            # latest_only leaves out.
+            latest_only = False
+            data_columns, order_by, dedup_key, dropped = self._plan_deduplication(
+                table_name,
+                data_columns,
+                deduplicate,
+                unsupported={
+                    "group_by": group_by,
+                    "order_by": order_by,
+                    "joins": joins,
+                    "shard_by": shard_by,
+                    "cache='incremental'": cache == "incremental",
+                    "backend='polars'": backend == "polars",
+                },
+            )
+        if shard_by is not None:
+            if cache == "incremental":
+                raise LakehouseError(
+                    "cache='incremental' already fetches by date and cannot be combined with shard_by."
+                )
+            return self._fetch_sharded(
+                table_name,
+                shard_by,
+                query={
+                    "data_columns": data_columns,
+                    "filters": filters,
+                    "group_by": group_by,
+                    "datetime_granularity": datetime_granularity,
+                    "order_by": order_by,
+                    "aggregation_method": aggregation_method,
+                    "joins": joins,
+                    "latest_only": latest_only,
+                    "output_timezone": output_timezone,
+                },
+                start_reference_date=start_reference_date,
+                end_reference_date=end_reference_date,
+                page_size=page_size,
+                timeout=timeout,
+                max_workers=max_workers,
+                cache=cache,
+                typed=typed,
+                backend=backend,
+                checkpoint=checkpoint,
+            )
+        if cache == "incremental":
+            if backend != "pandas":
+                raise LakehouseError("cache='incremental' only supports the pandas backend.")
+            return self._fetch_incremental(
+                table_name,
+                data_columns=data_columns,
+                filters=filters,
+                start_reference_date=start_reference_date,
+                end_reference_date=end_reference_date,
+                latest_only=latest_only,
+                output_timezone=output_timezone,
+                page_size=page_size,
+                timeout=timeout,
+                max_workers=max_workers,
+                typed=typed,
+                unsupported={"group_by": group_by, "order_by": order_by, "joins": joins},
+            )
+
+        json_body = self._build_query_body(
+            table_name,
+            data_columns=data_columns,
+            filters=filters,
+            start_reference_date=start_reference_date,
+            end_reference_date=end_reference_date,
+            group_by=group_by,
+            datetime_granularity=datetime_granularity,
+            order_by=order_by,
+            aggregation_method=aggregation_method,
+            joins=joins,
+            latest_only=latest_only,
+            output_timezone=output_timezone,
+        )
+        df = self.fetch_dataframe_from_query(
+            json_body,
+            page_size=page_size,
+            timeout=timeout,
+            max_workers=max_workers,
+            cache=cache,
+            typed=typed,
+            backend=backend,
+            checkpoint=checkpoint,
+            deduplicate=dedup_key,
+        )
+        return df.drop(columns=dropped) if dropped else df
 
     def fetch_dataframe_from_query(
-        self, json_body: dict, page_size: int = 10000, timeout: int | None = 600
-    ) -> pd.DataFrame:
+        self,
+        json_body: dict,
+        page_size: int | str = 10000,
+        timeout: int | None = 600,
+        max_workers: int = 1,
+        cache: str = "bypass",
+        typed: bool = False,
+        backend: str = "pandas",
+        checkpoint: bool = False,
+        deduplicate: list[str] | None = None,
+    ) -> "pd.DataFrame | pl.DataFrame":
         """
         Fetch data from the API using a custom query JSON body and return as a pandas DataFrame.
 
         Args:
             json_body: JSON request body for the query
-            page_size: Number of records per page for API pagination (default: 10000)
+            page_size: Number of records per page for API pagination (default: 10000), or "auto"
             timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1)
+            cache: "use", "refresh" or "bypass" (default); see `fetch_dataframe`
+            typed: If True, columns take the dtypes of the table schema (default: False); see
+                `fetch_dataframe`
+            backend: "pandas" (default) or "polars"; see `fetch_dataframe`
+            checkpoint: If True, save pages as they arrive and resume from them (default:
+                False); see `fetch_dataframe`
+            deduplicate: Optional result columns of a natural key (e.g. ["ONSGeneratorData.code"])
+                to reduce the result by to the latest version of each datapoint, unless deleted. The
+                query must have `latest_only` set to False, be ordered by the key, then by
+                `updated_at`, and return that model's `updated_at` and `deleted_at`; see
+                `fetch_dataframe`
 
         Returns:
-            pandas DataFrame with the query results
+            pandas DataFrame with the query results (polars DataFrame with backend="polars")
         """
-        columns, rows = self._fetch_all_pages(json_body, page_size=page_size, timeout=timeout)
-        df = pd.DataFrame(rows, columns=columns) if columns is not None else pd.DataFrame(rows)
+        check_cache_mode(cache)
+        _check_backend(backend)
+        key = self._result_key(json_body, typed, backend, deduplicate) if cache != "bypass" else None
+        if cache == "use":
+            cached = result_cache.get(key, backend=backend)
+            if cached is not None:
+                return cached
+
+        def fetch() -> "pd.DataFrame | pl.DataFrame":
+            frames = list(
+                self.iter_dataframes_from_query(
+                    json_body,
+                    page_size=page_size,
+                    timeout=timeout,
+                    max_workers=max_workers,
+                    typed=typed,
+                    backend=backend,
+                    checkpoint=checkpoint,
+                    deduplicate=deduplicate,
+                )
+            )
+            df = _concat_frames(frames, backend)
+            if key is not None:
+                result_cache.put(key, df)
+            return df
+
+        # Identical queries already in flight on other threads share that fetch rather than repeat it.
+        df, shared = _in_flight.do(key or self._result_key(json_body, typed, backend, deduplicate), fetch)
+        if shared:
+            # A frame of its own, so that changes by one caller leave the others' frames alone. A
+            # shallow pandas copy would share its data before pandas 3, which the package allows.
+            return df.clone() if backend == "polars" else df.copy()
+        return df
+
+    def fetch_many(
+        self,
+        queries: dict[str, dict],
+        max_concurrency: int = 4,
+        progress: Callable[[str, int, int], None] | None = None,
+    ) -> dict[str, "pd.DataFrame | pl.DataFrame"]:
+        """
+        Fetch several tables concurrently over the shared session.
+
+        Each entry runs as its own `fetch_dataframe` call, so the whole batch takes about as long
+        as its slowest query rather than the sum of all of them.
+
+        Args:
+            queries: Keyword arguments of each query by name. A name that is a table alias (e.g.
+                "ccee_spot_price") runs that alias with the arguments; any other name is taken as
+                the table name, unless the arguments give a `table_name` of their own.
+            max_concurrency: Number of queries run at the same time (default: 4)
+            progress: Called with the name of each query as it finishes, successfully or not,
+                followed by the number of queries finished and the total
+
+        Returns:
+            Dictionary of each query's DataFrame by name, in the order of `queries`
 
-        date_cols = [col for col in df.columns if col.endswith("reference_date")]
-        if date_cols:
-            df[date_cols] = df[date_cols].apply(pd.to_datetime, format="ISO8601")
+        Raises:
+            LakehouseBatchError: If any query failed, once all of them have finished. Its
+                `errors` holds the exception of each failed query and its `results` the
+                DataFrames of the others.
+        """
+        if max_concurrency < 1:
+            raise LakehouseError(f"'max_concurrency' must be at least 1, got {max_concurrency}.")
+
+        def fetch(name: str, kwargs: dict) -> "pd.DataFrame | pl.DataFrame":
+            if "table_name" in kwargs:
+                return self.fetch_dataframe(**kwargs)
+            alias = self._resolve_alias(name)
+            if alias is not None:
+                return alias(**kwargs)
+            return self.fetch_dataframe(table_name=name, **kwargs)
+
+        results = {}
+        errors = {}
+        pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="lakehouse-batch")
+        try:
+            futures = {pool.submit(fetch, name, kwargs): name for name, kwargs in queries.items()}
+            for done, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    errors[name] = e
+                if progress is not None:
+                    progress(name, done, len(futures))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        results = {name: results[name] for name in queries if name in results}
+        if errors:
+            raise LakehouseBatchError({name: errors[name] for name in queries if name in errors}, results)
+        return results
+
+    def _fetch_sharded(
+        self,
+        table_name: str,
+        shard_by: str,
+        query: dict,
+        start_reference_date: str | None,
+        end_reference_date: str | None,
+        page_size: int | str,
+        timeout: int,
+        max_workers: int,
+        cache: str,
+        typed: bool,
+        backend: str,
+        checkpoint: bool = False,
+    ) -> "pd.DataFrame | pl.DataFrame":
+        """Run a date-window query as one sub-query per calendar period, and concatenate them in order.
+
+        Each shard is a query of its own, so the server pages through one period at a time
+        rather than ever deeper into the whole window. The shards run `max_workers` at a time,
+        each paging serially; each is retried after a timeout or server error and cached on its
+        own.
+        """
+        if shard_by not in SHARD_PERIODS:
+            supported = ", ".join(f"'{period}'" for period in SHARD_PERIODS)
+            raise LakehouseError(f"Unsupported shard_by '{shard_by}'. Supported: {supported}.")
+        if not start_reference_date or not end_reference_date:
+            raise LakehouseError("shard_by needs both 'start_reference_date' and 'end_reference_date'.")
+        if max_workers < 1:
+            raise LakehouseError(f"'max_workers' must be at least 1, got {max_workers}.")
+
+        group_by = query["group_by"]
+        granularity = query["datetime_granularity"]
+        # Without reference_date among the keys a group spans the whole window, whatever the granularity.
+        if group_by and ("reference_date" not in group_by or granularity not in (None, *_SHARD_NESTED[shard_by])):
+            raise LakehouseError(
+                f"Groups must fall within one {shard_by} to be computed shard by shard; group by "
+                f"reference_date with a datetime_granularity of {', '.join(_SHARD_NESTED[shard_by])}, "
+                "or use no shard_by."
+            )
 
+        order_by = query["order_by"] or []
+        selected = (query["group_by"] or []) + (query["data_columns"] or [])
+        missing = [item["column"] for item in order_by if selected and item["column"] not in selected]
+        if missing:
+            raise LakehouseError(
+                f"Sharded results are ordered client-side, so the order_by columns must be fetched: {missing}."
+            )
+
+        # Validates the rest of the arguments once, before any shard is sent.
+        self._build_query_body(table_name, **query)
+
+        start = date.fromisoformat(start_reference_date)
+        end = date.fromisoformat(end_reference_date)
+        if start > end:
+            raise LakehouseError("'start_reference_date' must not be after 'end_reference_date'.")
+
+        def fetch_shard(bounds: tuple[date, date]) -> "pd.DataFrame | pl.DataFrame":
+            json_body = self._build_query_body(
+                table_name,
+                start_reference_date=bounds[0].isoformat(),
+                end_reference_date=bounds[1].isoformat(),
+                **query,
+            )
+            for attempt in range(_SHARD_ATTEMPTS):
+                try:
+                    return self.fetch_dataframe_from_query(
+                        json_body,
+                        page_size=page_size,
+                        timeout=timeout,
+                        cache=cache,
+                        typed=typed,
+                        backend=backend,
+                        checkpoint=checkpoint,
+                    )
+                except LakehouseError as e:
+                    if attempt == _SHARD_ATTEMPTS - 1 or not _is_overload(e):
+                        raise
+                    time.sleep(2**attempt)
+
+        shards = _shard_dates(start, end, shard_by)
+        if max_workers == 1 or len(shards) == 1:
+            frames = [fetch_shard(bounds) for bounds in shards]
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lakehouse-shard")
+            try:
+                frames = list(pool.map(fetch_shard, shards))
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        non_empty = [frame for frame in frames if len(frame)] or frames[:1]
+        df = _concat_frames(non_empty, backend)
+        if order_by and len(non_empty) > 1:
+            # Each shard came back ordered; across shards the order only holds for ascending dates.
+            model_name = get_model_name(table_name)
+            columns = [f"{model_name}.{item['column']}" for item in order_by]
+            descending = [item["direction"].lower() == "desc" for item in order_by]
+            if backend == "polars":
+                df = df.sort(columns, descending=descending, maintain_order=True)
+            else:
+                df = df.sort_values(columns, ascending=[not d for d in descending], kind="stable", ignore_index=True)
         return df
 
+    def _fetch_incremental(
+        self,
+        table_name: str,
+        data_columns: list[str] | None,
+        filters: dict | None,
+        start_reference_date: str | None,
+        end_reference_date: str | None,
+        latest_only: bool,
+        output_timezone: str,
+        page_size: int | str,
+        timeout: int,
+        max_workers: int,
+        typed: bool,
+        unsupported: dict,
+    ) -> pd.DataFrame:
+        """Answer a date-window query from `range_cache`, fetching only the days it lacks."""
+        used = [name for name, value in unsupported.items() if value]
+        if used:
+            raise LakehouseError(f"cache='incremental' cannot be combined with {', '.join(used)}.")
+        if not start_reference_date or not end_reference_date:
+            raise LakehouseError("cache='incremental' needs both 'start_reference_date' and 'end_reference_date'.")
+        if data_columns and "reference_date" not in data_columns:
+            raise LakehouseError("cache='incremental' needs 'reference_date' among the data columns.")
+
+        def body(start: str | None, end: str | None) -> dict:
+            return self._build_query_body(
+                table_name,
+                data_columns=data_columns,
+                filters=filters,
+                start_reference_date=start,
+                end_reference_date=end,
+                latest_only=latest_only,
+                output_timezone=output_timezone,
+            )
+
+        # Keyed by the query without its window, which is exactly what the cached days share.
+        key = self._result_key(body(None, None), typed)
+        date_column = f"{get_model_name(table_name)}.reference_date"
+        start = date.fromisoformat(start_reference_date)
+        end = date.fromisoformat(end_reference_date)
+        if start > end:
+            raise LakehouseError("'start_reference_date' must not be after 'end_reference_date'.")
+
+        pieces = range_cache.read(key, start, end, date_column)
+        for gap_start, gap_end in range_cache.missing(key, start, end):
+            df = self.fetch_dataframe_from_query(
+                body(gap_start.isoformat(), gap_end.isoformat()),
+                page_size=page_size,
+                timeout=timeout,
+                max_workers=max_workers,
+                typed=typed,
+            )
+            range_cache.add(key, gap_start, gap_end, df, date_column)
+            pieces.append((gap_start, df))
+
+        frames = [df for _, df in sorted(pieces, key=lambda piece: piece[0])]
+        non_empty = [df for df in frames if not df.empty]
+        if not non_empty:
+            return frames[0]
+        return non_empty[0] if len(non_empty) == 1 else pd.concat(non_empty, ignore_index=True)
+
+    def sync(
+        self,
+        table_name: str,
+        store: "TableStore | str | os.PathLike",
+        data_columns: list[str] | None = None,
+        filters: dict | None = None,
+        output_timezone: str = "America/Sao_Paulo",
+        page_size: int | str = 10000,
+        timeout: int = 600,
+        max_workers: int = 1,
+        full: bool = False,
+    ) -> int:
+        """
+        Bring a local mirror of a table up to date, fetching only the rows changed since the last sync.
+
+        The first sync of a table fetches all of it. Each later one asks for the rows whose
+        `updated_at` is past the table's watermark, with `latest_only=False` so that
+        soft-deletes come through, and applies them to the mirror: changed rows replace the
+        row of the same `id` and deleted rows drop out. Read the mirror with `store.read()`.
+
+        Pages are read by offset, so a row revised while a sync is paging through the changes can
+        be missed; `full=True` rebuilds the mirror from scratch.
+
+        Args:
+            table_name: Name of the table to mirror (e.g., "ons_power_plant_hourly_generation")
+            store: A `TableStore`, or the directory of one
+            data_columns: Optional columns to mirror. If not provided, every column of the table
+                schema is. `id`, `updated_at` and `deleted_at` are always included.
+            filters: Optional filters restricting the rows mirrored; see `fetch_dataframe`
+            output_timezone: Timezone for datetime output (default: "America/Sao_Paulo")
+            page_size: Number of records per page for API pagination (default: 10000), or "auto"
+            timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1)
+            full: If True, drop the mirror and fetch the whole table again (default: False)
+
+        Returns:
+            Number of changed rows applied
+        """
+        if not isinstance(store, TableStore):
+            store = TableStore(store)
+        if full:
+            store.clear(table_name)
+
+        model_name = get_model_name(table_name)
+        if data_columns is None:
+            schema = openapi_spec.schemas().get(model_name)
+            if schema is None:
+                raise LakehouseError(f"Table '{table_name}' is not in the API schema.")
+            data_columns = list(schema["properties"])
+        json_body = self._build_query_body(
+            table_name,
+            data_columns=list(dict.fromkeys([*data_columns, "id", "updated_at", "deleted_at"])),
+            filters=filters,
+            order_by=[{"column": "updated_at", "direction": "asc"}, {"column": "id", "direction": "asc"}],
+            latest_only=False,
+            output_timezone=output_timezone,
+        )
+
+        # A mirror only takes the changes of the query it was built from.
+        query = query_key(json_body)
+        synced = store.query(table_name)
+        if synced is not None and synced != query:
+            raise LakehouseError(
+                f"Table '{table_name}' was synced with other columns or filters; sync it with full=True to rebuild it."
+            )
+
+        watermark = store.watermark(table_name)
+        if watermark is not None:
+            json_body.setdefault("query_filters", []).append(
+                {"column": f"{model_name}.updated_at", "value": watermark, "operator": ">"}
+            )
+
+        changes = self.fetch_dataframe_from_query(
+            json_body, page_size=page_size, timeout=timeout, max_workers=max_workers
+        )
+        return store.apply(table_name, changes, query)
+
+    def iter_dataframes(
+        self,
+        table_name: str,
+        data_columns: list[str] | None = None,
+        filters: dict | None = None,
+        start_reference_date: str | None = None,
+        end_reference_date: str | None = None,
+        group_by: list[str] | None = None,
+        datetime_granularity: str | None = None,
+        order_by: list[dict] | None = None,
+        aggregation_method: str | None = None,
+        joins: list[dict] | None = None,
+        latest_only: bool = True,
+        output_timezone: str = "America/Sao_Paulo",
+        page_size: int | str = 10000,
+        timeout: int = 600,
+        max_workers: int = 1,
+        chunk_rows: int | None = None,
+        typed: bool = False,
+        backend: str = "pandas",
+        checkpoint: bool = False,
+        deduplicate: bool | list[str] = False,
+    ) -> "Iterator[pd.DataFrame | pl.DataFrame]":
+        """
+        Fetch data from the API as a stream of pandas DataFrames.
+
+        Takes the same arguments as `fetch_dataframe`, whose result is these DataFrames
+        concatenated. Only the chunk being yielded is held in memory, so a table of any size can
+        be written out piece by piece.
+
+        Args:
+            chunk_rows: Number of rows per yielded DataFrame; the last one may be shorter. If not
+                provided, one DataFrame is yielded per page of results. With deduplicate, chunks
+                shrink by the rows reduced away.
+
+        Yields:
+            pandas DataFrames with consecutive slices of the query results. An empty result
+            yields a single empty DataFrame.
+        """
+        dropped = []
+        dedup_key = None
+        if deduplicate:
+            # Every version is asked for: the reduction needs deleted latest versions too, which
+            # latest_only leaves out.
+            latest_only = False
+            data_columns, order_by, dedup_key, dropped = self._plan_deduplication(
+                table_name,
+                data_columns,
+                deduplicate,
+                unsupported={
+                    "group_by": group_by,
+                    "order_by": order_by,
+                    "joins": joins,
+                    "backend='polars'": backend == "polars",
+                },
+            )
+        json_body = self._build_query_body(
+            table_name,
+            data_columns=data_columns,
+            filters=filters,
+            start_reference_date=start_reference_date,
+            end_reference_date=end_reference_date,
+            group_by=group_by,
+            datetime_granularity=datetime_granularity,
+            order_by=order_by,
+            aggregation_method=aggregation_method,
+            joins=joins,
+            latest_only=latest_only,
+            output_timezone=output_timezone,
+        )
+        chunks = self.iter_dataframes_from_query(
+            json_body,
+            page_size=page_size,
+            timeout=timeout,
+            max_workers=max_workers,
+            chunk_rows=chunk_rows,
+            typed=typed,
+            backend=backend,
+            checkpoint=checkpoint,
+            deduplicate=dedup_key,
+        )
+        return (chunk.drop(columns=dropped) for chunk in chunks) if dropped else chunks
+
+    def iter_dataframes_from_query(
+        self,
+        json_body: dict,
+        page_size: int | str = 10000,
+        timeout: int | None = 600,
+        max_workers: int = 1,
+        chunk_rows: int | None = None,
+        typed: bool = False,
+        backend: str = "pandas",
+        checkpoint: bool = False,
+        deduplicate: list[str] | None = None,
+    ) -> "Iterator[pd.DataFrame | pl.DataFrame]":
+        """
+        Fetch data using a custom query JSON body as a stream of pandas DataFrames.
+
+        Args:
+            json_body: JSON request body for the query
+            page_size: Number of records per page for API pagination (default: 10000), or "auto"
+            timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1)
+            chunk_rows: Number of rows per yielded DataFrame; the last one may be shorter. If not
+                provided, one DataFrame is yielded per page of results.
+            typed: If True, columns take the dtypes of the table schema (default: False); see
+                `fetch_dataframe`
+            backend: "pandas" (default) or "polars"; see `fetch_dataframe`
+            checkpoint: If True, save pages as they arrive and resume from them (default:
+                False); see `fetch_dataframe`
+            deduplicate: Optional result columns of a natural key to reduce the stream by to the
+                latest version of each datapoint, unless deleted; see `fetch_dataframe_from_query`
+
+        Yields:
+            pandas DataFrames with consecutive slices of the query results
+        """
+        if max_workers < 1:
+            raise LakehouseError(f"'max_workers' must be at least 1, got {max_workers}.")
+        if chunk_rows is not None and chunk_rows < 1:
+            raise LakehouseError(f"'chunk_rows' must be at least 1, got {chunk_rows}.")
+        _check_page_size(page_size, max_workers, checkpoint)
+        _check_backend(backend)
+        if deduplicate and backend != "pandas":
+            raise LakehouseError("deduplicate only supports the pandas backend.")
+        if deduplicate and json_body.get("latest_only") is not False:
+            raise LakehouseError("deduplicate needs every version of the rows; set 'latest_only' to False.")
+
+        chunks = self._iter_chunks(json_body, page_size, timeout, max_workers, chunk_rows, typed, backend, checkpoint)
+        return latest_versions(chunks, deduplicate) if deduplicate else chunks
+
+    def _iter_chunks(
+        self,
+        json_body: dict,
+        page_size: int | str,
+        timeout: int | None,
+        max_workers: int,
+        chunk_rows: int | None,
+        typed: bool = False,
+        backend: str = "pandas",
+        checkpoint: bool = False,
+    ) -> "Iterator[pd.DataFrame | pl.DataFrame]":
+        """Regroup the pages of a query into DataFrames of `chunk_rows` rows (or one per page).
+
+        Kept apart from `iter_dataframes_from_query` so the argument checks there run when it is
+        called rather than on the first `next()`.
+        """
+        columns = None
+        buffered = []
+        yielded = False
+        fields = None
+        timezone = json_body.get("output_timezone")
+        dates = _DateColumns()
+
+        def build(rows: list) -> "pd.DataFrame | pl.DataFrame":
+            nonlocal fields
+            if (typed or backend == "polars") and fields is None:
+                # Resolved once per query, from the first page that names the columns.
+                names = columns if columns is not None else list(rows[0]) if rows else []
+                fields = self._column_fields(names)
+            if backend == "polars":
+                return self._build_polars_frame(columns, rows, fields, timezone)
+            return self._build_dataframe(columns, rows, fields, timezone, dates)
+
+        pages = self._iter_pages(
+            json_body, page_size=page_size, timeout=timeout, max_workers=max_workers, checkpoint=checkpoint
+        )
+        for response in pages:
+            data = response["data"]
+            if isinstance(data, list):
+                buffered.extend(data)
+            else:
+                columns = data["columns"]
+                buffered.extend(data["rows"])
+
+            if chunk_rows is None:
+                if buffered:
+                    yield build(buffered)
+                    yielded = True
+                    buffered = []
+                continue
+
+            while len(buffered) >= chunk_rows:
+                yield build(buffered[:chunk_rows])
+                yielded = True
+                buffered = buffered[chunk_rows:]
+
+        if buffered or not yielded:
+            yield build(buffered)
+
+    def fetch_arrow(
+        self,
+        table_name: str,
+        data_columns: list[str] | None = None,
+        filters: dict | None = None,
+        start_reference_date: str | None = None,
+        end_reference_date: str | None = None,
+        group_by: list[str] | None = None,
+        datetime_granularity: str | None = None,
+        order_by: list[dict] | None = None,
+        aggregation_method: str | None = None,
+        joins: list[dict] | None = None,
+        latest_only: bool = True,
+        output_timezone: str = "America/Sao_Paulo",
+        page_size: int | str = 10000,
+        timeout: int = 600,
+        max_workers: int = 1,
+    ) -> "pa.Table":
+        """
+        Fetch data from the API and return as a pyarrow Table.
+
+        Takes the same arguments as `fetch_dataframe`. Each page is turned into Arrow columns
+        directly, without building a pandas DataFrame, which saves time and memory on wide
+        tables. Date-time columns become timestamps in `output_timezone`. Needs pyarrow.
+
+        Returns:
+            pyarrow Table with the query results
+        """
+        json_body = self._build_query_body(
+            table_name,
+            data_columns=data_columns,
+            filters=filters,
+            start_reference_date=start_reference_date,
+            end_reference_date=end_reference_date,
+            group_by=group_by,
+            datetime_granularity=datetime_granularity,
+            order_by=order_by,
+            aggregation_method=aggregation_method,
+            joins=joins,
+            latest_only=latest_only,
+            output_timezone=output_timezone,
+        )
+        return self.fetch_arrow_from_query(json_body, page_size=page_size, timeout=timeout, max_workers=max_workers)
+
+    def fetch_arrow_from_query(
+        self,
+        json_body: dict,
+        page_size: int | str = 10000,
+        timeout: int | None = 600,
+        max_workers: int = 1,
+    ) -> "pa.Table":
+        """
+        Fetch data from the API using a custom query JSON body and return as a pyarrow Table.
+
+        Args:
+            json_body: JSON request body for the query
+            page_size: Number of records per page for API pagination (default: 10000), or "auto"
+            timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1)
+
+        Returns:
+            pyarrow Table with the query results
+        """
+        pa = _import_pyarrow()
+        tables = [
+            pa.Table.from_batches([batch])
+            for batch in self._iter_record_batches(json_body, page_size, timeout, max_workers)
+        ]
+        # A column that is all null on one page and typed on another is promoted to the typed one.
+        return tables[0] if len(tables) == 1 else pa.concat_tables(tables, promote_options="permissive")
+
+    def fetch_parquet(
+        self,
+        table_name: str,
+        path: str | os.PathLike,
+        data_columns: list[str] | None = None,
+        filters: dict | None = None,
+        start_reference_date: str | None = None,
+        end_reference_date: str | None = None,
+        group_by: list[str] | None = None,
+        datetime_granularity: str | None = None,
+        order_by: list[dict] | None = None,
+        aggregation_method: str | None = None,
+        joins: list[dict] | None = None,
+        latest_only: bool = True,
+        output_timezone: str = "America/Sao_Paulo",
+        page_size: int | str = 10000,
+        timeout: int = 600,
+        max_workers: int = 1,
+        schema: "pa.Schema | None" = None,
+    ) -> int:
+        """
+        Fetch data from the API straight into a Parquet file.
+
+        Takes the same arguments as `fetch_arrow`. Every page is written as it arrives, so only
+        one page is held in memory whatever the size of the result.
+
+        Args:
+            path: Parquet file to write; an existing file is overwritten
+            schema: Optional Arrow schema of the file. If not provided, it is taken from the
+                first page, which fails if a column holding only nulls there has values later.
+
+        Returns:
+            Number of rows written
+        """
+        json_body = self._build_query_body(
+            table_name,
+            data_columns=data_columns,
+            filters=filters,
+            start_reference_date=start_reference_date,
+            end_reference_date=end_reference_date,
+            group_by=group_by,
+            datetime_granularity=datetime_granularity,
+            order_by=order_by,
+            aggregation_method=aggregation_method,
+            joins=joins,
+            latest_only=latest_only,
+            output_timezone=output_timezone,
+        )
+        return self.fetch_parquet_from_query(
+            json_body, path, page_size=page_size, timeout=timeout, max_workers=max_workers, schema=schema
+        )
+
+    def fetch_parquet_from_query(
+        self,
+        json_body: dict,
+        path: str | os.PathLike,
+        page_size: int | str = 10000,
+        timeout: int | None = 600,
+        max_workers: int = 1,
+        schema: "pa.Schema | None" = None,
+    ) -> int:
+        """
+        Fetch data from the API using a custom query JSON body straight into a Parquet file.
+
+        Args:
+            json_body: JSON request body for the query
+            path: Parquet file to write; an existing file is overwritten
+            page_size: Number of records per page for API pagination (default: 10000), or "auto"
+            timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1)
+            schema: Optional Arrow schema of the file (see `fetch_parquet`)
+
+        Returns:
+            Number of rows written
+        """
+        pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        writer = None
+        rows = 0
+        try:
+            for batch in self._iter_record_batches(json_body, page_size, timeout, max_workers):
+                if writer is None:
+                    writer = pq.ParquetWriter(path, schema if schema is not None else batch.schema)
+                if batch.schema != writer.schema:
+                    try:
+                        batch = pa.Table.from_batches([batch]).cast(writer.schema)
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, ValueError) as e:
+                        raise LakehouseError(
+                            f"Page with schema {batch.schema} does not fit the file schema {writer.schema}; "
+                            "pass 'schema' to set the column types."
+                        ) from e
+                writer.write(batch)
+                rows += batch.num_rows
+        except BaseException:
+            # A file missing pages must not pass for a complete result.
+            if writer is not None:
+                writer.close()
+                Path(path).unlink(missing_ok=True)
+            raise
+        writer.close()
+        return rows
+
+    def _iter_record_batches(
+        self, json_body: dict, page_size: int | str, timeout: int | None, max_workers: int
+    ) -> Iterator["pa.RecordBatch"]:
+        """Yield one Arrow record batch per non-empty page, or a single empty one for no rows."""
+        if max_workers < 1:
+            raise LakehouseError(f"'max_workers' must be at least 1, got {max_workers}.")
+
+        columns = None
+        yielded = False
+        timezone = json_body.get("output_timezone")
+        dates = _DateColumns()
+        for response in self._iter_pages(json_body, page_size=page_size, timeout=timeout, max_workers=max_workers):
+            data = response["data"]
+            if isinstance(data, list):
+                if data:
+                    yield self._build_record_batch(None, data, timezone, dates)
+                    yielded = True
+                continue
+            columns = data["columns"]
+            if data["rows"]:
+                yield self._build_record_batch(columns, data["rows"], timezone, dates)
+                yielded = True
+
+        if not yielded:
+            yield self._build_record_batch(columns or [], [], timezone, dates)
+
+    def _build_record_batch(
+        self, columns: list[str] | None, rows: list, timezone: str | None, dates: _DateColumns
+    ) -> "pa.RecordBatch":
+        """Build an Arrow record batch from one page of rows, parsing the date-time columns.
+
+        Columnar rows are transposed into one Python sequence per column and converted by Arrow
+        in a single pass each; no per-row objects are built. `columns` is None when `rows` are
+        record dicts. Date-time columns are told by their values, as in `_build_dataframe`, and
+        `dates` keeps the pages of one query to the same decision.
+        """
+        pa = _import_pyarrow()
+
+        if columns is None:
+            batch = pa.RecordBatch.from_pylist(rows)
+        elif rows:
+            batch = pa.RecordBatch.from_arrays([pa.array(values) for values in zip(*rows)], names=columns)
+        else:
+            batch = pa.RecordBatch.from_arrays([pa.array([], pa.null()) for _ in columns], names=columns)
+
+        arrays = list(batch.columns)
+        for i, name in enumerate(batch.schema.names):
+            if not pa.types.is_string(arrays[i].type) or dates.kind(i, name, arrays[i]) is None:
+                continue
+            try:
+                arrays[i] = self._parse_arrow_timestamps(arrays[i], timezone)
+            except pa.ArrowInvalid:
+                if name.endswith("reference_date"):
+                    raise
+                dates.reject(i)
+        return pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+    def _parse_arrow_timestamps(self, values: "pa.Array", timezone: str | None) -> "pa.Array":
+        """Parse ISO 8601 strings into timestamps, shown in `timezone` when they carry an offset."""
+        pa = _import_pyarrow()
+        try:
+            parsed = values.cast(pa.timestamp("us", tz="UTC"))
+        except pa.ArrowInvalid:
+            # Dates and local times without an offset stay naive, as they do in pandas.
+            return values.cast(pa.timestamp("us"))
+        return parsed.cast(pa.timestamp("us", tz=timezone)) if timezone else parsed
+
     def _fetch_openapi_schema(self) -> dict:
-        """Fetch OpenAPI schema from the API."""
-        return connector.get("/openapi.json")["components"]["schemas"]
+        """Fetch OpenAPI schema from the API, or from the copy already held (see `openapi_spec`)."""
+        return openapi_spec.schemas()
 
-    def _get_enum_values(self, enum_reference: dict, defs: dict | None = None) -> list[str]:
-        """Get enum values from OpenAPI schema."""
+    def _get_enum_values(
+        self, enum_reference: dict, defs: dict | None = None, schemas: dict | None = None
+    ) -> list[str]:
+        """Get enum values from OpenAPI schema.
+
+        Component references are resolved against `schemas` when given, and against a freshly
+        fetched copy otherwise.
+        """
         ref = enum_reference["$ref"]
 
         # Handle local $defs references (e.g., #/$defs/Subsystem)
@@ -289,7 +1806,8 @@ class Client:
         schemas_match = re.findall(r"^#/components/schemas/(.+)$", ref)
         if not schemas_match:
             return []
-        schemas = self._fetch_openapi_schema()
+        if schemas is None:
+            schemas = self._fetch_openapi_schema()
         enum_name = schemas_match[0]
         if enum_name not in schemas or "enum" not in schemas[enum_name]:
             return []
@@ -297,8 +1815,11 @@ class Client:
 
     def get_schema(self, table_name: str) -> dict:
         """Get clean schema for a given table."""
+        return self._build_table_schema(self._fetch_openapi_schema(), table_name)
+
+    def _build_table_schema(self, schemas: dict, table_name: str) -> dict:
+        """Build the clean schema of a table from the OpenAPI component schemas."""
         table_name = get_model_name(table_name)
-        schemas = self._fetch_openapi_schema()
         model_schema = schemas[table_name]
         properties = model_schema["properties"]
         defs = model_schema.get("$defs", {})
@@ -326,16 +1847,16 @@ class Client:
             # Handle enum values
             enum_values = None
             if "$ref" in value:
-                enum_values = self._get_enum_values(value, defs)
+                enum_values = self._get_enum_values(value, defs, schemas)
             elif "anyOf" in value:
                 for item in value["anyOf"]:
                     if "$ref" in item:
-                        enum_values = self._get_enum_values(item, defs)
+                        enum_values = self._get_enum_values(item, defs, schemas)
                         break
             elif "allOf" in value:
                 for item in value["allOf"]:
                     if "$ref" in item:
-                        enum_values = self._get_enum_values(item, defs)
+                        enum_values = self._get_enum_values(item, defs, schemas)
                         break
 
             if enum_values:
@@ -366,8 +1887,10 @@ class Client:
 
     def list_tables(self) -> list[str]:
         """List all available tables in Lakehouse."""
-        schemas = self._fetch_openapi_schema()
+        return self._find_table_names(self._fetch_openapi_schema())
 
+    def _find_table_names(self, schemas: dict) -> list[str]:
+        """Pick the database models out of the OpenAPI component schemas."""
         # Filter out non-table schemas
         table_names = []
         for key, schema in schemas.items():
@@ -1,36 +1,79 @@
 import os
+import threading
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from psr.lakehouse import auth
+from psr.lakehouse.decoders import decode_json, set_json_decoder
 from psr.lakehouse.exceptions import LakehouseAuthError, LakehouseError
+from psr.lakehouse.transfer import Transfer, TransferStats, requests_accept_encoding
+
+# Connections kept open per host, and hosts kept in the pool. requests' own default of ten
+# connections would have concurrent page fetches beyond ten threads open and drop sockets.
+_DEFAULT_POOL_CONNECTIONS = 10
+_DEFAULT_POOL_MAXSIZE = 32
+
+
+def health_check_skipped() -> bool:
+    """Whether LAKEHOUSE_SKIP_HEALTHCHECK turns off the health check of `initialize`."""
+    return os.getenv("LAKEHOUSE_SKIP_HEALTHCHECK", "0").strip().lower() in ("1", "true", "yes")
 
 
 class Connector:
     _instance = None
 
     _is_initialized: bool = False
+    # Whether the API has answered yet, through the health check or a first request.
+    _reachable: bool = False
     _base_url: str
     _session: requests.Session
 
+    # Held while the session is set up or replaced and while logging in. Reentrant, as logging
+    # in may initialize first.
+    _lock = threading.RLock()
+    # Bumped by every login, so threads bounced by the same expired session log in only once.
+    _login_generation: int = 0
+
+    # Bytes received, as transferred and as decoded; see `TransferStats`.
+    transfer_stats = TransferStats()
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
     @staticmethod
-    def _create_session() -> requests.Session:
-        """Create a session with keep-alive and retries on transient server errors."""
+    def _create_session(pool_connections: int | None = None, pool_maxsize: int | None = None) -> requests.Session:
+        """Create a session with keep-alive, compressed responses and retries on transient server errors.
+
+        Every content coding urllib3 can decode is offered, best first: zstd and brotli when
+        their packages are installed (the `compression` extra), then gzip. urllib3 decompresses
+        the body chunk by chunk as it is read.
+
+        The session is shared by every thread: its connection pool hands each concurrent request
+        a keep-alive connection of its own, and its one cookie jar, which locks on access, holds
+        the login cookies for all of them.
+        """
+        if pool_connections is None:
+            pool_connections = int(os.getenv("LAKEHOUSE_POOL_CONNECTIONS", _DEFAULT_POOL_CONNECTIONS))
+        if pool_maxsize is None:
+            pool_maxsize = int(os.getenv("LAKEHOUSE_POOL_MAXSIZE", _DEFAULT_POOL_MAXSIZE))
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise LakehouseError("'pool_connections' and 'pool_maxsize' must be at least 1.")
+
         session = requests.Session()
+        session.headers["Accept-Encoding"] = requests_accept_encoding()
         adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
             max_retries=Retry(
                 total=3,
                 backoff_factor=1,
                 status_forcelist=[502, 503, 504],
                 allowed_methods=["GET", "POST"],
-            )
+            ),
         )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
@@ -39,37 +82,66 @@ class Connector:
     def initialize(
         self,
         base_url: str | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        check: bool | None = None,
     ):
         """
         Initialize the connector with API URL.
 
+        Safe to call from any thread: the new session only replaces the old one once it passed
+        the health check, and requests already sent finish on the session they started on.
+
+        The health check costs a round trip before the first query. Without it the API is first
+        contacted by that query, and an unreachable API is reported by it in the same terms.
+
         Args:
             base_url: API base URL. Defaults to LAKEHOUSE_API_URL environment variable.
+            pool_connections: Number of hosts whose connections are kept. Defaults to
+                LAKEHOUSE_POOL_CONNECTIONS, then to 10.
+            pool_maxsize: Connections kept open per host, which bounds the concurrent requests
+                reusing a keep-alive connection. Defaults to LAKEHOUSE_POOL_MAXSIZE, then to 32.
+            check: Whether to check that the API is reachable now. Defaults to True, unless the
+                LAKEHOUSE_SKIP_HEALTHCHECK environment variable is set.
         """
         # Get base URL from parameter or environment variable
-        self._base_url = base_url or os.getenv("LAKEHOUSE_API_URL")
-        if not self._base_url:
+        base_url = base_url or os.getenv("LAKEHOUSE_API_URL")
+        if not base_url:
             raise LakehouseError(
                 "API base URL not provided. Set LAKEHOUSE_API_URL environment variable or pass base_url parameter."
             )
-        self._base_url = self._base_url.rstrip("/")
-
-        self._session = self._create_session()
-
-        # A deployment behind the load balancer needs a session cookie on every request; the
-        # cached one is installed up front so a logged-in user is never asked again. The health
-        # check below is exempt from authentication, so it passes either way and cannot be used
-        # to tell whether we are logged in — that is discovered on the first real request.
-        auth.load_session(self._base_url, self._session)
-
-        try:
-            response = self._session.get(f"{self._base_url}/health-check", timeout=10)
-            if not response.json():
-                raise LakehouseError("Health check failed: API returned a non-truthy response.")
-        except requests.exceptions.RequestException as e:
-            raise LakehouseError(f"Health check failed: Unable to connect to API at {self._base_url}. {e}") from e
-
-        self._is_initialized = True
+        base_url = base_url.rstrip("/")
+
+        with self._lock:
+            session = self._create_session(pool_connections, pool_maxsize)
+
+            # A deployment behind the load balancer needs a session cookie on every request; the
+            # cached one is installed up front so a logged-in user is never asked again. The health
+            # check below is exempt from authentication, so it passes either way and cannot be used
+            # to tell whether we are logged in — that is discovered on the first real request.
+            auth.load_session(base_url, session)
+
+            if check is None:
+                check = not health_check_skipped()
+            if check:
+                try:
+                    response = session.get(f"{base_url}/health-check", timeout=10)
+                    if not response.json():
+                        raise LakehouseError("Health check failed: API returned a non-truthy response.")
+                except requests.exceptions.RequestException as e:
+                    raise LakehouseError(f"Health check failed: Unable to connect to API at {base_url}. {e}") from e
+
+            self._session = session
+            self._base_url = base_url
+            self._reachable = check
+            self._is_initialized = True
+
+    def _ensure_initialized(self) -> None:
+        """Initialize on first use, once, however many threads get here at the same time."""
+        if not self._is_initialized:
+            with self._lock:
+                if not self._is_initialized:
+                    self.initialize()
 
     def login(self, base_url: str | None = None) -> None:
         """Sign in in a browser and cache the session, replacing any session already cached.
@@ -79,9 +151,11 @@ class Connector:
                 being a singleton, it may well be pointing somewhere else already.
         """
         target = base_url.rstrip("/") if base_url else None
-        if not self._is_initialized or (target and target != getattr(self, "_base_url", None)):
-            self.initialize(target or base_url)
-        auth.login(self._base_url, session=self._session)
+        with self._lock:
+            if not self._is_initialized or (target and target != getattr(self, "_base_url", None)):
+                self.initialize(target or base_url)
+            auth.login(self._base_url, session=self._session)
+            self._login_generation += 1
 
     def logout(self, base_url: str | None = None) -> bool:
         """Forget the cached session for this API, in this process and on disk.
@@ -99,17 +173,32 @@ class Connector:
             auth._clear_alb_cookies(self._session)
         return auth.clear_session(target.rstrip("/"))
 
-    def _send(self, method: str, url: str, **kwargs) -> dict:
+    @property
+    def base_url(self) -> str:
+        """API base URL, initializing the connector first if need be."""
+        self._ensure_initialized()
+        return self._base_url
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
         """Send a request, logging in and retrying once if it was bounced to the login page.
 
         The load balancer answers an unauthenticated request with a redirect to Cognito, which
         `requests` follows — so what arrives here is a page of HTML from another host rather
         than an error status. `auth.bounced_to_idp` is what recognises that.
+
+        Threads bounced at the same time log in once between them: the first one logs in while
+        the others wait, then they all retry with the session cookie it obtained.
         """
+        generation = self._login_generation
         response = self._session.request(method, url, **kwargs)
+        self._reachable = True
 
         if auth.bounced_to_idp(response, self._base_url):
-            auth.ensure_login(self._session, self._base_url)
+            with self._lock:
+                # Unless another thread logged in since this request was sent.
+                if self._login_generation == generation:
+                    auth.ensure_login(self._session, self._base_url)
+                    self._login_generation += 1
             response = self._session.request(method, url, **kwargs)
             if auth.bounced_to_idp(response, self._base_url):
                 raise LakehouseAuthError(
@@ -125,7 +214,7 @@ class Connector:
             )
 
         response.raise_for_status()
-        return response.json()
+        return response
 
     def post(self, endpoint: str, json_body: dict, params: dict | None = None, timeout: int = 600) -> dict:
         """
@@ -143,17 +232,16 @@ class Connector:
         Raises:
             LakehouseError: If the request fails
         """
-        if not self._is_initialized:
-            self.initialize()
+        self._ensure_initialized()
 
         url = f"{self._base_url}{endpoint}"
 
         try:
-            return self._send("POST", url, json=json_body, params=params, timeout=timeout)
+            return self._decode(self._send("POST", url, json=json_body, params=params, timeout=timeout), url)
         except requests.exceptions.HTTPError as e:
             raise LakehouseError(self._format_http_error(e, url)) from e
         except requests.exceptions.RequestException as e:
-            raise LakehouseError(f"Request to {url} failed: {e}") from e
+            raise LakehouseError(self._format_request_error(e, url)) from e
 
     def get(self, endpoint: str, params: dict | None = None) -> dict:
         """
@@ -169,17 +257,79 @@ class Connector:
         Raises:
             LakehouseError: If the request fails
         """
-        if not self._is_initialized:
-            self.initialize()
+        self._ensure_initialized()
+
+        url = f"{self._base_url}{endpoint}"
+
+        try:
+            return self._decode(self._send("GET", url, params=params, timeout=60), url)
+        except requests.exceptions.HTTPError as e:
+            raise LakehouseError(self._format_http_error(e, url)) from e
+        except requests.exceptions.RequestException as e:
+            raise LakehouseError(self._format_request_error(e, url)) from e
+
+    def get_if_changed(self, endpoint: str, etag: str | None = None) -> tuple[dict | None, str | None]:
+        """
+        Make a conditional GET request, downloading the document only if it changed.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/openapi.json")
+            etag: ETag of the copy already held, sent as If-None-Match
+
+        Returns:
+            (document, etag): the JSON document and its ETag, or (None, etag) when the server
+            answered 304 Not Modified and the copy held is still current
+
+        Raises:
+            LakehouseError: If the request fails
+        """
+        self._ensure_initialized()
 
         url = f"{self._base_url}{endpoint}"
+        headers = {"If-None-Match": etag} if etag else None
 
         try:
-            return self._send("GET", url, params=params, timeout=60)
+            response = self._send("GET", url, headers=headers, timeout=60)
+            if response.status_code == 304:
+                return None, etag
+            return self._decode(response, url), response.headers.get("ETag")
         except requests.exceptions.HTTPError as e:
             raise LakehouseError(self._format_http_error(e, url)) from e
         except requests.exceptions.RequestException as e:
-            raise LakehouseError(f"Request to {url} failed: {e}") from e
+            raise LakehouseError(self._format_request_error(e, url)) from e
+
+    def _decode(self, response: requests.Response, url: str):
+        """Decode a JSON response body with the decoder chosen by `set_json_decoder`.
+
+        The body's size is recorded in `transfer_stats` on the way, both as it came over the
+        wire (what urllib3 read from the socket) and decompressed.
+        """
+        content = response.content
+        wire_bytes = response.raw.tell() if response.raw is not None else len(content)
+        self.transfer_stats.record(
+            Transfer(url, response.headers.get("Content-Encoding"), wire_bytes or len(content), len(content))
+        )
+        try:
+            return decode_json(content)
+        except ValueError as e:
+            raise LakehouseError(f"Invalid JSON in the response from {url}: {e}") from e
+
+    @staticmethod
+    def set_json_decoder(decoder=None) -> None:
+        """
+        Choose how API responses are decoded, for this connector and `AsyncConnector` alike.
+
+        Args:
+            decoder: "orjson", "msgspec", "json", any function decoding JSON from bytes, or None
+                (default) for the fastest one installed.
+        """
+        set_json_decoder(decoder)
+
+    def _format_request_error(self, error: requests.exceptions.RequestException, url: str) -> str:
+        """Format a request that got no response, as the health check would have if it was skipped."""
+        if not self._reachable and isinstance(error, requests.exceptions.ConnectionError):
+            return f"Unable to connect to API at {self._base_url}. {error}"
+        return f"Request to {url} failed: {error}"
 
     @staticmethod
     def _format_http_error(error: requests.exceptions.HTTPError, url: str) -> str:
@@ -0,0 +1,78 @@
+"""JSON decoders for API responses.
+
+A page of query results runs to several megabytes of JSON, and decoding it with the standard
+library takes a noticeable share of a fetch. orjson and msgspec decode the same documents several
+times faster (see scripts/benchmark_json_decode.py), so the fastest one installed is used unless
+another is chosen with `set_json_decoder`. They all return the same plain dicts and lists.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from psr.lakehouse.exceptions import LakehouseError
+
+JSON_DECODERS = ("orjson", "msgspec", "json")
+
+_decoder: Callable[[bytes], Any] | None = None
+
+
+def get_json_decoder(name: str | None = None) -> Callable[[bytes], Any]:
+    """
+    Return a function decoding a JSON document from bytes.
+
+    Args:
+        name: "orjson", "msgspec" or "json". If not provided, the first of them that is
+            installed, in that order.
+
+    Returns:
+        The decoding function
+    """
+    if name is not None and name not in JSON_DECODERS:
+        supported = ", ".join(f"'{decoder}'" for decoder in JSON_DECODERS)
+        raise LakehouseError(f"Unsupported JSON decoder '{name}'. Supported: {supported}.")
+
+    if name in (None, "orjson"):
+        try:
+            import orjson
+
+            return orjson.loads
+        except ImportError:
+            if name is not None:
+                raise LakehouseError(
+                    "The orjson decoder needs orjson. Install it with: pip install 'psr-lakehouse[fast-json]'"
+                ) from None
+
+    if name in (None, "msgspec"):
+        try:
+            import msgspec
+
+            # A Decoder built once skips the per-call setup of msgspec.json.decode.
+            return msgspec.json.Decoder().decode
+        except ImportError:
+            if name is not None:
+                raise LakehouseError(
+                    "The msgspec decoder needs msgspec. Install it with: pip install msgspec"
+                ) from None
+
+    return json.loads
+
+
+def set_json_decoder(decoder: str | Callable[[bytes], Any] | None = None) -> None:
+    """
+    Choose how API responses are decoded.
+
+    Args:
+        decoder: A name accepted by `get_json_decoder`, any function decoding JSON from bytes,
+            or None to go back to the fastest one installed.
+    """
+    global _decoder
+    _decoder = decoder if callable(decoder) else get_json_decoder(decoder) if decoder is not None else None
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON response body with the chosen decoder."""
+    global _decoder
+    if _decoder is None:
+        _decoder = get_json_decoder()
+    return _decoder(content)
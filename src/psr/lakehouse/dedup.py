@@ -0,0 +1,100 @@
+"""Client-side reduction of a version history to the latest version of each datapoint.
+
+The server's `latest_only` dedup does nothing on tables whose versioning constraint spans every
+data field (ONS registry-source and versioned-metadata tables, lakehouse_server issue #427), so
+their superseded versions come back alongside the current ones. `LatestVersions` removes them
+from a stream of DataFrames: it keeps, for each natural key, the row with the greatest
+`updated_at`, and drops the datapoint altogether when that row is soft-deleted.
+
+The query is ordered by the key, so the versions of a datapoint arrive together and each chunk
+can be reduced on its own with a sort over NumPy arrays. Only the last datapoint of a chunk may
+continue into the next one; its latest row, deleted or not, is held back and reduced with that
+chunk, so a deletion arriving there still takes it out.
+"""
+
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+
+
+class LatestVersions:
+    """Reduces chunks of a result ordered by `key` to the latest version per key, unless deleted."""
+
+    def __init__(self, key: list[str], updated_at: str, deleted_at: str):
+        """
+        Args:
+            key: Result columns identifying a datapoint (e.g. "ONSGeneratorData.code")
+            updated_at: Result column of the version timestamp
+            deleted_at: Result column of the soft-delete timestamp
+        """
+        self.key = key
+        self.updated_at = updated_at
+        self.deleted_at = deleted_at
+        self._carry: pd.DataFrame | None = None
+
+    def feed(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Reduce the next chunk, returning the datapoints it completes."""
+        if self._carry is not None:
+            df = pd.concat([self._carry, df], ignore_index=True)
+            self._carry = None
+
+        if df.empty:
+            return df.reset_index(drop=True)
+
+        # Grouped by key in order of appearance, and by version within each group.
+        codes = [pd.factorize(df[column])[0] for column in self.key]
+        versions = pd.factorize(df[self.updated_at], sort=True)[0]
+        order = np.lexsort([versions, *reversed(codes)])
+
+        # The last row of each group is its latest version.
+        last = np.ones(len(order), dtype=bool)
+        for column_codes in codes:
+            sorted_codes = column_codes[order]
+            last[:-1] &= sorted_codes[:-1] == sorted_codes[1:]
+        last[:-1] = ~last[:-1]
+        latest = order[last]
+
+        # The datapoint the chunk ends with may have more versions in the next one.
+        ending = [column_codes[-1] for column_codes in codes]
+        held = np.ones(len(latest), dtype=bool)
+        for column_codes, code in zip(codes, ending, strict=True):
+            held &= column_codes[latest] == code
+        self._carry = df.iloc[latest[held]]
+        done = df.iloc[latest[~held]]
+        return done[done[self.deleted_at].isna().to_numpy()].reset_index(drop=True)
+
+    def flush(self) -> pd.DataFrame | None:
+        """Return the datapoint held back from the last chunk, once there are no more chunks."""
+        carry, self._carry = self._carry, None
+        if carry is None or carry[self.deleted_at].notna().any():
+            return None
+        return carry.reset_index(drop=True)
+
+
+def latest_versions(chunks: Iterator[pd.DataFrame], key: list[str]) -> Iterator[pd.DataFrame]:
+    """
+    Reduce a stream of chunks, ordered by `key` then `updated_at`, to the latest versions.
+
+    Args:
+        chunks: DataFrames of consecutive rows of one query
+        key: Result columns identifying a datapoint, all of the same model
+
+    Yields:
+        DataFrames with the latest version of each datapoint whose latest version is not
+        deleted, each in exactly one of them. An empty result yields a single empty DataFrame.
+    """
+    model_name = key[0].split(".", 1)[0]
+    dedup = LatestVersions(key, f"{model_name}.updated_at", f"{model_name}.deleted_at")
+    reduced = None
+    yielded = False
+    for chunk in chunks:
+        reduced = dedup.feed(chunk)
+        if not reduced.empty:
+            yield reduced
+            yielded = True
+    rest = dedup.flush()
+    if rest is not None:
+        yield rest
+    elif not yielded and reduced is not None:
+        yield reduced
@@ -0,0 +1,191 @@
+"""Explicit dtypes for query results, chosen from the table schemas.
+
+`typed_array` (pandas) and `polars_series` (polars) convert the values of one column, as they
+come off the wire, straight into the array its schema field calls for, so no object column is
+built and parsed again afterwards.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+_OFFSET = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
+# The offsets the fast path of `parse_datetimes` splits off: "Z" and "+HH:MM"/"-HH:MM".
+_SPLIT_OFFSET = re.compile(r"^(Z|[+-]\d{2}:\d{2})$")
+# What a date-time value looks like, to pick date-time columns out of an untyped result.
+DATETIME_VALUE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+
+
+def typed_array(values: list, field: dict | None, timezone: str | None = None):
+    """Convert the values of one column to the dtype of its schema field.
+
+    Args:
+        values: The column's values as decoded from JSON
+        field: The column's field in `Client.get_schema`, or None if it is not known
+        timezone: Timezone date-time values are shown in (the query's output timezone)
+
+    Returns:
+        A pandas array or Categorical, or None when the field has no dtype mapping or the values
+        do not fit it (e.g. an average of an integer column), leaving the column to pandas'
+        inference.
+    """
+    if field is None:
+        return None
+
+    field_type = field.get("type")
+    field_format = field.get("format")
+    try:
+        if field_type == "enum":
+            return _categorical(values, field["enum_values"])
+        if field_format == "date-time":
+            return parse_datetimes(values, timezone)
+        if field_format == "date":
+            return pd.to_datetime(pd.Series(values, dtype=object), format="ISO8601").array
+        if field_type == "integer":
+            try:
+                return pd.array(values, dtype="Int64")
+            except (TypeError, ValueError):
+                return pd.array(values, dtype="Float64")
+        if field_type == "number":
+            return pd.array(values, dtype="Float64")
+        if field_type == "boolean":
+            return pd.array(values, dtype="boolean")
+        if field_type == "string":
+            return _strings(values)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return None
+
+
+def _categorical(values: list, categories: list):
+    """Categories fixed to the enum's values, so chunks of one result concatenate as categories."""
+    # A value outside the enum would be lost as NaN; keep such a column as text instead.
+    known = set(categories)
+    if any(value is not None and value not in known for value in values):
+        return _strings(values)
+    return pd.Categorical(values, categories=categories)
+
+
+def parse_datetimes(values: list, timezone: str | None = None):
+    """Parse ISO 8601 date-times into a tz-aware array in `timezone`.
+
+    Args:
+        values: Date-time strings, with None (or NaN) for missing values
+        timezone: Timezone of the result (the query's output timezone); UTC if not given
+
+    Returns:
+        A datetime64 array in `timezone`. Values without an offset are taken to be in it
+        already.
+    """
+    first = next((value for value in values if isinstance(value, str)), None)
+    if first is not None and not _OFFSET.search(first):
+        # Local times without an offset are already in the output timezone.
+        parsed = pd.to_datetime(pd.Series(values, dtype=object), format="ISO8601")
+        return (parsed.dt.tz_localize(timezone) if timezone else parsed).array
+
+    parsed = _parse_offsets_apart(values) if first is not None else None
+    if parsed is None:
+        # Parsed through UTC, as a window across a DST change holds more than one offset.
+        parsed = pd.to_datetime(pd.Series(values, dtype=object), format="ISO8601", utc=True)
+    return (parsed.dt.tz_convert(timezone) if timezone else parsed).array
+
+
+def _parse_offsets_apart(values: list):
+    """Parse date-times with offsets as local times and offsets apart, or return None if they do not split.
+
+    pandas parses "2024-01-01T00:00:00-03:00" around ten times slower than the same time without
+    its offset. A result holds only a handful of distinct offsets, so each is parsed once and
+    subtracted from the local times, all parsed on the fast path together.
+    """
+    local = []
+    offsets = []
+    for value in values:
+        if not isinstance(value, str):
+            local.append(None)
+            offsets.append("Z")
+        elif value.endswith("Z"):
+            local.append(value[:-1])
+            offsets.append("Z")
+        else:
+            local.append(value[:-6])
+            offsets.append(value[-6:])
+
+    codes, distinct = pd.factorize(np.array(offsets, dtype=object))
+    if not all(_SPLIT_OFFSET.match(offset) for offset in distinct):
+        return None
+    minutes = np.array(
+        [
+            0 if offset == "Z" else int(offset[0] + "1") * (int(offset[1:3]) * 60 + int(offset[4:6]))
+            for offset in distinct
+        ]
+    )
+    try:
+        parsed = pd.to_datetime(pd.Series(local, dtype=object), format="ISO8601")
+    except (TypeError, ValueError):
+        return None
+    if parsed.dt.tz is not None:
+        return None
+    return (parsed - pd.to_timedelta(minutes[codes], unit="min")).dt.tz_localize("UTC")
+
+
+def _strings(values: list):
+    """Text as Arrow-backed strings when pyarrow is installed, and pandas' own otherwise."""
+    try:
+        return pd.array(values, dtype="string[pyarrow]")
+    except ImportError:
+        return pd.array(values, dtype="string")
+
+
+def polars_series(name: str, values: list, field: dict | None, timezone: str | None = None):
+    """Build the polars Series of one column with the dtype of its schema field.
+
+    The counterpart of `typed_array` for `backend="polars"`: integers become Int64 (Float64 when
+    fractional), numbers Float64, enums `pl.Enum` over the enum's values, date-times tz-aware
+    Datetime in `timezone` and text String. Columns without a mapping, or whose values do not
+    fit it, are inferred by polars; reference date columns among them are still parsed.
+    """
+    import polars as pl
+
+    field = field or {}
+    field_type = field.get("type")
+    field_format = field.get("format")
+    if field_format is None and field_type is None and name.endswith("reference_date"):
+        field_format = "date-time"
+
+    try:
+        if field_format == "date-time":
+            return _polars_datetimes(pl.Series(name, values, dtype=pl.String), timezone)
+        if field_format == "date":
+            return pl.Series(name, values, dtype=pl.String).str.to_date()
+        if field_type == "enum":
+            known = set(field["enum_values"])
+            if all(value is None or value in known for value in values):
+                return pl.Series(name, values, dtype=pl.Enum(field["enum_values"]))
+            return pl.Series(name, values, dtype=pl.String)
+        if field_type == "integer":
+            try:
+                return pl.Series(name, values, dtype=pl.Int64)
+            except TypeError:
+                return pl.Series(name, values, dtype=pl.Float64)
+        if field_type == "number":
+            return pl.Series(name, values, dtype=pl.Float64)
+        if field_type == "boolean":
+            return pl.Series(name, values, dtype=pl.Boolean)
+        if field_type == "string":
+            return pl.Series(name, values, dtype=pl.String)
+    except (TypeError, ValueError, OverflowError, pl.exceptions.PolarsError):
+        pass
+    return pl.Series(name, values, strict=False)
+
+
+def _polars_datetimes(strings, timezone: str | None):
+    """Parse ISO 8601 date-times in polars into a tz-aware Series in `timezone`."""
+    first = strings.drop_nulls().head(1).to_list()
+    if first and not _OFFSET.search(first[0]):
+        # Local times without an offset are already in the output timezone.
+        parsed = strings.str.to_datetime(time_unit="us")
+        return parsed.dt.replace_time_zone(timezone) if timezone else parsed
+
+    parsed = strings.str.to_datetime(time_unit="us", time_zone="UTC")
+    return parsed.dt.convert_time_zone(timezone) if timezone else parsed
@@ -40,3 +40,20 @@ class LakehouseGroupByFunctionError(LakehouseError):
 
     def __str__(self):
         return f"LakehouseGroupByFunctionError: {self.message}"
+
+
+class LakehouseBatchError(LakehouseError):
+    """Exception for a batch of queries of which at least one failed.
+
+    `errors` maps the name of every failed query to its exception, and `results` the name of
+    every query that succeeded to its DataFrame, so a partial batch is not lost.
+    """
+
+    def __init__(self, errors: dict, results: dict):
+        failed = ", ".join(f"{name} ({error})" for name, error in errors.items())
+        super().__init__(f"{len(errors)} of {len(errors) + len(results)} queries failed: {failed}")
+        self.errors = errors
+        self.results = results
+
+    def __str__(self):
+        return f"LakehouseBatchError: {self.message}"
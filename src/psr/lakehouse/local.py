@@ -0,0 +1,484 @@
+"""Local mirror of tables in DuckDB, answering `fetch_dataframe` queries without the network.
+
+Analyses that query the same tables over and over pay for every `fetch_dataframe` with a round
+trip, even for years of data that will never change again. `local_mirror` copies selected
+tables — whole or by reference-date window — into a DuckDB database file, and answers queries
+with the arguments of `fetch_dataframe` by translating them into SQL run over that copy.
+
+The mirror records which days of each table it holds. A query reaching past them fetches only
+the missing days from the API and runs the same SQL over the local rows and those together, so
+filters, aggregations and ordering behave the same whichever side a row came from. Rows are
+mirrored as `latest_only` returns them.
+
+Rows are fetched in UTC, so the days held are UTC days, and a window mirrored again is cut at
+UTC midnight. A query compares and truncates dates in its own output timezone; the UTC days it
+needs are those its window spans in that timezone, so a São Paulo day also needs the first
+hours of the next UTC day.
+"""
+
+import os
+import threading
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from psr.lakehouse.client import client
+from psr.lakehouse.exceptions import LakehouseError
+from psr.lakehouse.metadata import get_model_name
+
+_AGGREGATIONS = ("sum", "avg", "min", "max")
+
+_GRANULARITIES = ("hour", "day", "week", "month", "year")
+
+# Days held of each table; NULL bounds stand for a table mirrored whole.
+_COVERAGE = "_lakehouse_coverage"
+
+
+def _import_duckdb():
+    try:
+        import duckdb
+    except ImportError as e:
+        raise LakehouseError(
+            "The local mirror needs duckdb. Install it with: pip install 'psr-lakehouse[duckdb]'"
+        ) from e
+    return duckdb
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _merge(intervals: list[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Merge overlapping or adjacent day intervals."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and (start - merged[-1][1]).days <= 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _gaps(intervals: list[tuple[date, date]], start: date, end: date) -> list[tuple[date, date]]:
+    """The intervals of [start, end] (inclusive) not covered by `intervals`, in order."""
+    gaps = []
+    cursor = start
+    for lo, hi in _merge(intervals):
+        if hi < cursor:
+            continue
+        if lo > end:
+            break
+        if lo > cursor:
+            gaps.append((cursor, lo - timedelta(days=1)))
+        if hi >= end:
+            return gaps
+        cursor = hi + timedelta(days=1)
+    gaps.append((cursor, end))
+    return gaps
+
+
+def _utc_days(start: date, end: date, timezone: str) -> tuple[date, date]:
+    """The UTC days holding the instants of the days [start, end] (inclusive) of `timezone`."""
+    zone = ZoneInfo(timezone)
+    if start != date.min:
+        start = datetime.combine(start, time(), zone).astimezone(UTC).date()
+    if end != date.max:
+        end = (datetime.combine(end + timedelta(days=1), time(), zone).astimezone(UTC) - timedelta.resolution).date()
+    return start, end
+
+
+def _bound(day: date) -> str | None:
+    """A reference date argument, None for the unbounded ends date.min and date.max."""
+    return None if day in (date.min, date.max) else day.isoformat()
+
+
+def _local_frame(df: pd.DataFrame, model_name: str) -> pd.DataFrame:
+    """A fetched DataFrame as stored in the mirror: plain column names, enums as text."""
+    df = df.rename(columns=lambda column: column.removeprefix(f"{model_name}."))
+    for column in df.columns:
+        # DuckDB makes a category an ENUM of the values seen so far, which a later insert of a
+        # new value would violate.
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("string")
+    return df
+
+
+class LocalMirror:
+    _instance = None
+
+    _path: Path | None = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def configure(self, path: str | os.PathLike | None = None) -> None:
+        """
+        Configure where the mirror is kept.
+
+        Args:
+            path: DuckDB database file. Defaults to LAKEHOUSE_MIRROR_PATH, then to
+                ~/.psr-lakehouse/mirror.duckdb.
+        """
+        self._path = Path(path).expanduser() if path is not None else None
+
+    @property
+    def path(self) -> Path:
+        if self._path is not None:
+            return self._path
+        override = os.getenv("LAKEHOUSE_MIRROR_PATH")
+        if override:
+            return Path(override).expanduser()
+        return Path.home() / ".psr-lakehouse" / "mirror.duckdb"
+
+    def _connect(self, timezone: str = "UTC"):
+        duckdb = _import_duckdb()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        con = duckdb.connect(str(self.path))
+        # Dates compared against and truncated to are those of this timezone.
+        con.execute(f"SET TimeZone = '{timezone.replace("'", "''")}'")
+        con.execute(f"CREATE TABLE IF NOT EXISTS {_COVERAGE} (table_name VARCHAR, start_date DATE, end_date DATE)")
+        return con
+
+    def _intervals(self, con, table_name: str) -> list[tuple[date, date]]:
+        rows = con.execute(
+            f"SELECT start_date, end_date FROM {_COVERAGE} WHERE table_name = ?", [table_name]
+        ).fetchall()
+        return [(start or date.min, end or date.max) for start, end in rows]
+
+    def tables(self) -> list[str]:
+        """The tables held in the mirror."""
+        if not self.path.exists():
+            return []
+        with self._lock, self._connect() as con:
+            return [row[0] for row in con.execute(f"SELECT DISTINCT table_name FROM {_COVERAGE} ORDER BY 1").fetchall()]
+
+    def coverage(self, table_name: str) -> list[tuple[date | None, date | None]]:
+        """The reference-date intervals of a table held in the mirror, None for an open end."""
+        if not self.path.exists():
+            return []
+        with self._lock, self._connect() as con:
+            intervals = _merge(self._intervals(con, table_name))
+        return [(None if start == date.min else start, None if end == date.max else end) for start, end in intervals]
+
+    def mirror(
+        self,
+        table_name: str,
+        start_reference_date: str | None = None,
+        end_reference_date: str | None = None,
+        page_size: int | str = 10000,
+        timeout: int = 600,
+        max_workers: int = 1,
+    ) -> int:
+        """
+        Copy a table, or a reference-date window of it, into the mirror.
+
+        The window is of UTC days. Rows the mirror already holds in it are replaced, so
+        mirroring a window again refreshes it. The rows are written as they arrive and committed together, so a failed
+        fetch leaves the mirror as it was.
+
+        Args:
+            table_name: Name of the table to mirror (e.g., "ccee_spot_price")
+            start_reference_date: Optional start of the window (inclusive), a UTC day. Without
+                either date the whole table is mirrored; without one, the window is open at that end.
+            end_reference_date: Optional end of the window (inclusive), a UTC day
+            page_size: Number of records per page for API pagination (default: 10000), or "auto"
+            timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1)
+
+        Returns:
+            Number of rows mirrored
+        """
+        start = date.fromisoformat(start_reference_date) if start_reference_date else date.min
+        end = date.fromisoformat(end_reference_date) if end_reference_date else date.max
+        if start > end:
+            raise LakehouseError("'start_reference_date' must not be after 'end_reference_date'.")
+
+        model_name = get_model_name(table_name)
+        table = _quote(table_name)
+        chunks = client.iter_dataframes(
+            table_name,
+            start_reference_date=_bound(start),
+            end_reference_date=_bound(end),
+            output_timezone="UTC",
+            page_size=page_size,
+            timeout=timeout,
+            max_workers=max_workers,
+            typed=True,
+        )
+
+        rows = 0
+        with self._lock, self._connect() as con:
+            con.execute("BEGIN TRANSACTION")
+            try:
+                exists = bool(self._intervals(con, table_name))
+                if exists and (start, end) == (date.min, date.max):
+                    con.execute(f"DROP TABLE {table}")
+                    exists = False
+                elif exists:
+                    conditions, params = [], []
+                    if start != date.min:
+                        conditions.append("reference_date >= CAST(? AS DATE)")
+                        params.append(start.isoformat())
+                    if end != date.max:
+                        conditions.append("reference_date < CAST(? AS DATE)")
+                        params.append((end + timedelta(days=1)).isoformat())
+                    con.execute(f"DELETE FROM {table} WHERE {' AND '.join(conditions)}", params)
+
+                for chunk in chunks:
+                    con.register("chunk", _local_frame(chunk, model_name))
+                    if exists:
+                        con.execute(f"INSERT INTO {table} BY NAME SELECT * FROM chunk")
+                    else:
+                        con.execute(f"CREATE TABLE {table} AS SELECT * FROM chunk")
+                        exists = True
+                    con.unregister("chunk")
+                    rows += len(chunk)
+
+                intervals = _merge([*self._intervals(con, table_name), (start, end)])
+                con.execute(f"DELETE FROM {_COVERAGE} WHERE table_name = ?", [table_name])
+                con.executemany(
+                    f"INSERT INTO {_COVERAGE} VALUES (?, ?, ?)",
+                    [(table_name, _bound(lo), _bound(hi)) for lo, hi in intervals],
+                )
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+        return rows
+
+    def fetch_dataframe(
+        self,
+        table_name: str,
+        data_columns: list[str] | None = None,
+        filters: dict | None = None,
+        start_reference_date: str | None = None,
+        end_reference_date: str | None = None,
+        group_by: list[str] | None = None,
+        datetime_granularity: str | None = None,
+        order_by: list[dict] | None = None,
+        aggregation_method: str | None = None,
+        output_timezone: str = "America/Sao_Paulo",
+        fallback: bool = True,
+        page_size: int | str = 10000,
+        timeout: int = 600,
+        max_workers: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Answer a `fetch_dataframe` query from the mirror.
+
+        The days of the window the mirror does not hold are fetched from the API and queried
+        together with the local rows. The window is of days in `output_timezone`; on a table of
+        date-times it needs the UTC days those span, see `mirror`. A table that is not mirrored at all is fetched from the
+        API with `client.fetch_dataframe`.
+
+        Args:
+            table_name: Name of the table to query (e.g., "ccee_spot_price")
+            data_columns: Optional columns to return. If not provided, all columns are.
+            filters: Optional dict of column: value filters; a list of values matches any of them
+            start_reference_date: Optional start date filter (inclusive)
+            end_reference_date: Optional end date filter (inclusive)
+            group_by: Optional list of columns to group by
+            datetime_granularity: Optional "hour", "day", "week", "month" or "year" that datetime
+                columns of group_by are truncated to
+            order_by: Optional list of dicts with "column" and "direction" keys
+            aggregation_method: Aggregation method (sum, avg, min, max) - required if group_by is set
+            output_timezone: Timezone for datetime output and date comparisons (default:
+                "America/Sao_Paulo")
+            fallback: If True (default), fetch what the mirror lacks from the API; if False,
+                raise instead
+            page_size: Number of records per page when fetching from the API (default: 10000)
+            timeout: Timeout in seconds for API requests (default: 600)
+            max_workers: Number of pages fetched concurrently (default: 1)
+
+        Returns:
+            pandas DataFrame with the query results, with columns named as the API names them
+        """
+        if bool(group_by) ^ bool(aggregation_method is not None):
+            raise LakehouseError("Both 'group_by' and 'aggregation_method' must be provided together.")
+        if aggregation_method is not None and aggregation_method not in _AGGREGATIONS:
+            supported = ", ".join(f"'{method}'" for method in _AGGREGATIONS)
+            raise LakehouseError(f"Unsupported aggregation method '{aggregation_method}'. Supported: {supported}.")
+        if datetime_granularity is not None and datetime_granularity not in _GRANULARITIES:
+            supported = ", ".join(f"'{granularity}'" for granularity in _GRANULARITIES)
+            raise LakehouseError(f"Unsupported datetime granularity '{datetime_granularity}'. Supported: {supported}.")
+
+        start = date.fromisoformat(start_reference_date) if start_reference_date else date.min
+        end = date.fromisoformat(end_reference_date) if end_reference_date else date.max
+        remote = {"output_timezone": "UTC", "page_size": page_size, "timeout": timeout, "max_workers": max_workers}
+
+        intervals, stored = [], {}
+        if self.path.exists():
+            with self._lock, self._connect() as con:
+                intervals = self._intervals(con, table_name)
+                if intervals:
+                    stored = dict(
+                        con.execute(f"SELECT column_name, column_type FROM (DESCRIBE {_quote(table_name)})").fetchall()
+                    )
+        if not intervals:
+            if not fallback:
+                raise LakehouseError(f"Table '{table_name}' is not in the local mirror.")
+            return client.fetch_dataframe(
+                table_name,
+                data_columns=data_columns,
+                filters=filters,
+                start_reference_date=start_reference_date,
+                end_reference_date=end_reference_date,
+                group_by=group_by,
+                datetime_granularity=datetime_granularity,
+                order_by=order_by,
+                aggregation_method=aggregation_method,
+                output_timezone=output_timezone,
+                page_size=page_size,
+                timeout=timeout,
+                max_workers=max_workers,
+            )
+
+        # Plain dates are the same day in every timezone; date-times are held by UTC day.
+        if stored.get("reference_date", "").startswith("TIMESTAMP WITH TIME ZONE"):
+            gaps = _gaps(intervals, *_utc_days(start, end, output_timezone))
+        else:
+            gaps = _gaps(intervals, start, end)
+        if gaps and not fallback:
+            missing = ", ".join(f"{_bound(lo) or '...'} to {_bound(hi) or '...'}" for lo, hi in gaps)
+            raise LakehouseError(f"The local mirror of '{table_name}' does not cover the UTC days {missing}.")
+
+        model_name = get_model_name(table_name)
+        fetched = [
+            _local_frame(
+                client.fetch_dataframe(
+                    table_name,
+                    filters=filters,
+                    start_reference_date=_bound(lo),
+                    end_reference_date=_bound(hi),
+                    typed=True,
+                    **remote,
+                ),
+                model_name,
+            )
+            for lo, hi in gaps
+        ]
+
+        with self._lock, self._connect(output_timezone) as con:
+            source = _quote(table_name)
+            if fetched:
+                con.register("fetched", pd.concat(fetched, ignore_index=True) if len(fetched) > 1 else fetched[0])
+                source = f"(SELECT * FROM {source} UNION ALL BY NAME SELECT * FROM fetched)"
+            types = dict(
+                con.execute(f"SELECT column_name, column_type FROM (DESCRIBE SELECT * FROM {source})").fetchall()
+            )
+            sql, params = self._build_sql(
+                table_name,
+                source,
+                types,
+                data_columns=data_columns,
+                filters=filters,
+                start=start,
+                end=end,
+                group_by=group_by,
+                datetime_granularity=datetime_granularity,
+                order_by=order_by,
+                aggregation_method=aggregation_method,
+            )
+            df = con.execute(sql, params).df()
+        return df.rename(columns=lambda column: f"{model_name}.{column}")
+
+    def _build_sql(
+        self,
+        table_name: str,
+        source: str,
+        types: dict[str, str],
+        data_columns: list[str] | None,
+        filters: dict | None,
+        start: date,
+        end: date,
+        group_by: list[str] | None,
+        datetime_granularity: str | None,
+        order_by: list[dict] | None,
+        aggregation_method: str | None,
+    ) -> tuple[str, list]:
+        """Translate `fetch_dataframe` arguments into a query over `source`, and its parameters."""
+
+        def column(name: str) -> str:
+            if name not in types:
+                raise LakehouseError(f"Column '{name}' is not in the local mirror of '{table_name}'.")
+            return _quote(name)
+
+        conditions, params = [], []
+        for name, value in (filters or {}).items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                if not value:
+                    raise LakehouseError(f"Filter for column '{name}' received an empty list.")
+                conditions.append(f"{column(name)} IN ({', '.join('?' * len(value))})")
+                params.extend(value)
+            else:
+                conditions.append(f"{column(name)} = ?")
+                params.append(value)
+        if start != date.min:
+            conditions.append(f"{column('reference_date')} >= CAST(? AS DATE)")
+            params.append(start.isoformat())
+        if end != date.max:
+            conditions.append(f"{column('reference_date')} < CAST(? AS DATE)")
+            params.append((end + timedelta(days=1)).isoformat())
+
+        if group_by:
+            keys = []
+            for name in group_by:
+                expression = column(name)
+                if datetime_granularity and types[name].startswith("TIMESTAMP"):
+                    expression = f"date_trunc('{datetime_granularity}', {expression})"
+                keys.append(f"{expression} AS {column(name)}")
+            values = [
+                f"{aggregation_method}({column(name)}) AS {column(name)}"
+                for name in data_columns or []
+                if name not in group_by
+            ]
+            select = [*keys, *values]
+        else:
+            select = [column(name) for name in data_columns] if data_columns else ["*"]
+
+        if order_by:
+            ordering = []
+            for item in order_by:
+                direction = item["direction"].upper()
+                if direction not in ("ASC", "DESC"):
+                    raise LakehouseError(
+                        f"Unsupported order direction '{item['direction']}'. Supported: 'asc', 'desc'."
+                    )
+                ordering.append(f"{column(item['column'])} {direction}")
+        elif group_by:
+            ordering = [str(position) for position in range(1, len(group_by) + 1)]
+        else:
+            ordering = [_quote("reference_date")] if "reference_date" in types else []
+
+        sql = f"SELECT {', '.join(select)} FROM {source}"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        if group_by:
+            sql += f" GROUP BY {', '.join(str(position) for position in range(1, len(group_by) + 1))}"
+        if ordering:
+            sql += f" ORDER BY {', '.join(ordering)}"
+        return sql, params
+
+    def drop(self, table_name: str) -> None:
+        """Remove a table from the mirror."""
+        if not self.path.exists():
+            return
+        with self._lock, self._connect() as con:
+            con.execute(f"DROP TABLE IF EXISTS {_quote(table_name)}")
+            con.execute(f"DELETE FROM {_COVERAGE} WHERE table_name = ?", [table_name])
+
+    def clear(self) -> None:
+        """Remove every mirrored table, deleting the database file."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self.path.with_name(f"{self.path.name}.wal").unlink(missing_ok=True)
+
+
+local_mirror = LocalMirror()
@@ -1,3 +1,27 @@
+import re
+
+# Bookkeeping columns every table has, left out of the columns its alias fetches.
+INTERNAL_COLUMNS = {"id", "updated_at", "deleted_at"}
+
+# Tables that get no alias.
+SKIP_TABLES = {"ceg", "ceg_data", "generator", "generator_generator_unit", "generator_unit"}
+
+
+def to_snake(model_name: str) -> str:
+    """
+    Convert an API model name to the corresponding table name.
+
+    Args:
+        model_name: CamelCase model name (e.g., "CCEESpotPrice")
+
+    Returns:
+        Snake_case table name (e.g., "ccee_spot_price")
+    """
+    model_name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", model_name)
+    model_name = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", model_name)
+    return model_name.lower()
+
+
 def get_model_name(table_name: str) -> str:
     """
     Convert a table name to the corresponding API model name.
@@ -0,0 +1,129 @@
+"""The API's OpenAPI document, fetched once per process and revalidated with its ETag.
+
+Everything the client knows about tables — their names, columns, types and enum values —
+comes from `/openapi.json`, a document that is large and changes only when the server is
+deployed. So it is held in memory, keyed by API URL, and after `max_age` seconds it is
+revalidated with `If-None-Match`, which costs a `304` and no body while it is unchanged.
+
+It can also be kept on disk, which spares a new process the download too: the copy found there
+is revalidated the same way on first use, and stands in for the API when that revalidation
+fails — enough to look up schemas offline.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from psr.lakehouse.connector import connector
+from psr.lakehouse.exceptions import LakehouseError
+
+_DEFAULT_MAX_AGE = 300
+
+
+class OpenAPISpec:
+    _instance = None
+
+    _directory: Path | None = None
+    _max_age: float | None = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._entries = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def configure(self, directory: str | os.PathLike | None = None, max_age: float | None = None) -> None:
+        """
+        Configure how the OpenAPI document is kept.
+
+        Args:
+            directory: Directory for an on-disk copy of the document. Defaults to
+                LAKEHOUSE_SPEC_DIR; with neither, the document is only kept in memory.
+            max_age: Seconds the document is used before it is revalidated with the server.
+                Defaults to LAKEHOUSE_SPEC_MAX_AGE, then to five minutes.
+        """
+        self._directory = Path(directory).expanduser() if directory is not None else None
+        self._max_age = max_age
+
+    @property
+    def directory(self) -> Path | None:
+        if self._directory is not None:
+            return self._directory
+        override = os.getenv("LAKEHOUSE_SPEC_DIR")
+        return Path(override).expanduser() if override else None
+
+    @property
+    def max_age(self) -> float:
+        if self._max_age is not None:
+            return self._max_age
+        return float(os.getenv("LAKEHOUSE_SPEC_MAX_AGE", _DEFAULT_MAX_AGE))
+
+    def document(self) -> dict:
+        """Return the OpenAPI document of the API the connector points at."""
+        base_url = connector.base_url
+
+        # Held across the request, so threads asking at the same time share one download.
+        with self._lock:
+            entry = self._entries.get(base_url) or self._read_copy(base_url)
+            if entry and time.time() - entry["checked_at"] < self.max_age:
+                return entry["document"]
+
+            try:
+                document, etag = connector.get_if_changed("/openapi.json", entry["etag"] if entry else None)
+            except LakehouseError:
+                if entry is None:
+                    raise
+                # An outdated description of the API beats none at all; the next call tries again.
+                return entry["document"]
+
+            if document is None:
+                document = entry["document"]
+            else:
+                self._write_copy(base_url, document, etag)
+
+            self._entries[base_url] = {"document": document, "etag": etag, "checked_at": time.time()}
+            return document
+
+    def schemas(self) -> dict:
+        """Return the component schemas of the OpenAPI document."""
+        return self.document()["components"]["schemas"]
+
+    def clear(self) -> None:
+        """Forget the documents held in memory, so the next use fetches or revalidates again."""
+        with self._lock:
+            self._entries.clear()
+
+    def _copy_path(self, base_url: str) -> Path | None:
+        if self.directory is None:
+            return None
+        digest = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"openapi-{digest}.json"
+
+    def _read_copy(self, base_url: str) -> dict | None:
+        """Load the on-disk copy, marked as due for revalidation."""
+        path = self._copy_path(base_url)
+        if path is None:
+            return None
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(stored, dict) or stored.get("base_url") != base_url or "document" not in stored:
+            return None
+        return {"document": stored["document"], "etag": stored.get("etag"), "checked_at": 0.0}
+
+    def _write_copy(self, base_url: str, document: dict, etag: str | None) -> None:
+        path = self._copy_path(base_url)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"base_url": base_url, "etag": etag, "document": document}), encoding="utf-8")
+        tmp.replace(path)
+
+
+openapi_spec = OpenAPISpec()
@@ -0,0 +1,65 @@
+"""Coalescing of identical queries that are in flight at the same time.
+
+When several threads ask for the same result at once, only the first one fetches it; the others
+wait for that fetch and receive its result, or its exception, instead of sending the same pages
+to the server again. Nothing is kept once the fetch finishes: a query asked after that is fetched
+again (or served by the result cache), so coalescing never serves a stale result.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, sharing its outcome with concurrent callers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        Run `fn`, unless a call with the same key is already running, and wait for that one instead.
+
+        Args:
+            key: Identifies calls whose outcome is interchangeable
+            fn: The call to run
+
+        Returns:
+            The call's result, and whether it came from another caller's call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
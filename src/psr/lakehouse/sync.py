@@ -0,0 +1,146 @@
+"""Local columnar mirrors of tables, kept up to date from their change feed.
+
+Every table records when each row last changed (`updated_at`) and soft-deletes rows by setting
+`deleted_at`. `Client.sync` asks only for the rows changed since the latest `updated_at` it has
+seen — the table's watermark — with `latest_only=False` so that deletions come through too,
+and hands them to a `TableStore`.
+
+A store keeps each table as a directory of Parquet parts, one per sync, listed in a
+`state.json` with the watermark. Reading a table merges its parts by row `id`, the most recent
+change of a row winning and a soft-deleted row dropping out, so a sync only ever writes what
+changed. Once a table has more than `max_parts` parts they are merged into one, which bounds
+both the files read and the deleted rows carried along.
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from psr.lakehouse.exceptions import LakehouseError
+from psr.lakehouse.metadata import get_model_name
+
+_DEFAULT_MAX_PARTS = 16
+
+
+class TableStore:
+    """A directory of table mirrors maintained by `Client.sync`."""
+
+    def __init__(self, directory: str | os.PathLike, max_parts: int = _DEFAULT_MAX_PARTS):
+        """
+        Args:
+            directory: Directory holding the mirrors, one subdirectory per table
+            max_parts: Number of parts a table may have before they are merged into one
+        """
+        self.directory = Path(directory).expanduser()
+        self.max_parts = max_parts
+        self._lock = threading.Lock()
+
+    def _table_directory(self, table_name: str) -> Path:
+        return self.directory / table_name
+
+    def _state(self, table_name: str) -> dict | None:
+        try:
+            return json.loads((self._table_directory(table_name) / "state.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write_state(self, table_name: str, state: dict) -> None:
+        path = self._table_directory(table_name) / "state.json"
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        tmp.replace(path)
+
+    def _write_part(self, table_name: str, number: int, df: pd.DataFrame) -> str:
+        name = f"part-{number:06d}.parquet"
+        try:
+            df.to_parquet(self._table_directory(table_name) / name, index=False)
+        except ImportError as e:
+            raise LakehouseError(
+                "Syncing tables needs pyarrow. Install it with: pip install 'psr-lakehouse[arrow]'"
+            ) from e
+        return name
+
+    def tables(self) -> list[str]:
+        """The tables mirrored in this store."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(path.parent.name for path in self.directory.glob("*/state.json"))
+
+    def watermark(self, table_name: str) -> str | None:
+        """The latest `updated_at` synced for a table, or None if it was never synced."""
+        state = self._state(table_name)
+        return state["watermark"] if state else None
+
+    def query(self, table_name: str) -> str | None:
+        """The key of the query a table is mirrored with, or None if it was never synced."""
+        state = self._state(table_name)
+        return state["query"] if state else None
+
+    def apply(self, table_name: str, changes: pd.DataFrame, query: str) -> int:
+        """
+        Apply the rows changed since the last sync to a table's mirror.
+
+        Args:
+            table_name: Table the changes belong to
+            changes: Changed rows, with the table's `id`, `updated_at` and `deleted_at` columns
+            query: Key of the query the changes were fetched with
+
+        Returns:
+            Number of changes applied
+        """
+        model_name = get_model_name(table_name)
+        with self._lock:
+            state = self._state(table_name) or {"query": query, "watermark": None, "parts": [], "next_part": 0}
+
+            # Nothing changed, unless this is the first sync: even an empty table is recorded,
+            # so that reading it gives its columns.
+            if changes.empty and state["parts"]:
+                return 0
+
+            self._table_directory(table_name).mkdir(parents=True, exist_ok=True)
+            state["parts"].append(self._write_part(table_name, state["next_part"], changes))
+            state["next_part"] += 1
+            if not changes.empty:
+                state["watermark"] = changes[f"{model_name}.updated_at"].max().isoformat()
+
+            replaced = []
+            if len(state["parts"]) > self.max_parts:
+                merged = self._merge(table_name, state["parts"])
+                replaced = state["parts"]
+                state["parts"] = [self._write_part(table_name, state["next_part"], merged)]
+                state["next_part"] += 1
+            self._write_state(table_name, state)
+            for name in replaced:
+                (self._table_directory(table_name) / name).unlink(missing_ok=True)
+            return len(changes)
+
+    def read(self, table_name: str) -> pd.DataFrame:
+        """Return the current rows of a mirrored table."""
+        state = self._state(table_name)
+        if state is None:
+            raise LakehouseError(f"Table '{table_name}' has not been synced to {self.directory}.")
+        return self._merge(table_name, state["parts"])
+
+    def _merge(self, table_name: str, parts: list[str]) -> pd.DataFrame:
+        """Reduce the parts of a table to the latest change of each row, without deleted rows."""
+        model_name = get_model_name(table_name)
+        frames = [pd.read_parquet(self._table_directory(table_name) / name) for name in parts]
+        non_empty = [df for df in frames if not df.empty]
+        if not non_empty:
+            return frames[0]
+        df = non_empty[0] if len(non_empty) == 1 else pd.concat(non_empty, ignore_index=True)
+
+        # Parts are in sync order, so a stable sort leaves a row's latest change last.
+        df = df.sort_values(f"{model_name}.updated_at", kind="stable")
+        df = df.drop_duplicates(f"{model_name}.id", keep="last")
+        return df[df[f"{model_name}.deleted_at"].isna().to_numpy()].reset_index(drop=True)
+
+    def clear(self, table_name: str | None = None) -> None:
+        """Remove the mirror of a table, or of every table."""
+        with self._lock:
+            target = self._table_directory(table_name) if table_name is not None else self.directory
+            shutil.rmtree(target, ignore_errors=True)
@@ -0,0 +1,101 @@
+"""Content-encoding negotiation and byte accounting for API responses.
+
+Result pages are JSON text that compresses tenfold or more, so on a slow link the encoding the
+server picks matters more than anything done with the body afterwards. The connectors advertise
+every coding their HTTP library can decode here, best first, and count each response both as it
+came over the wire and once decoded, so the saving can be checked rather than assumed.
+"""
+
+import threading
+from typing import NamedTuple
+
+# Best first: zstd and brotli both beat gzip on JSON, and decode at least as fast.
+_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+
+def accept_encoding(available: set[str]) -> str:
+    """
+    Build an Accept-Encoding header ranking the available content codings.
+
+    Args:
+        available: Codings the HTTP library can decode, e.g. {"gzip", "deflate", "br"}
+
+    Returns:
+        The header value, e.g. "zstd, br;q=0.9, gzip;q=0.8, deflate;q=0.7"
+    """
+    codings = [coding for coding in _PREFERENCE if coding in available]
+    return ", ".join(coding if i == 0 else f"{coding};q={1 - i / 10:.1f}" for i, coding in enumerate(codings))
+
+
+def requests_accept_encoding() -> str:
+    """Accept-Encoding for `requests`: urllib3 decodes br and zstd once their packages are installed."""
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    return accept_encoding(set(ACCEPT_ENCODING.split(",")))
+
+
+def httpx_accept_encoding() -> str:
+    """Accept-Encoding for httpx, whose decoders depend on the same kind of optional packages."""
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:
+        # The registry is private to httpx; gzip and deflate are always there.
+        return accept_encoding({"gzip", "deflate"})
+    return accept_encoding(set(SUPPORTED_DECODERS))
+
+
+class Transfer(NamedTuple):
+    """The size of one response body, as transferred and as decoded."""
+
+    url: str
+    encoding: str | None
+    wire_bytes: int
+    body_bytes: int
+
+
+class TransferStats:
+    """Running totals of the response bytes a connector has received.
+
+    `wire_bytes` counts the bodies as they came over the network, `body_bytes` once decoded; the
+    ratio of the two is the compression actually achieved. `last` is the most recent response
+    received by the calling thread, so concurrent page fetches do not overwrite each other's.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start counting from zero."""
+        with self._lock:
+            self.requests = 0
+            self.wire_bytes = 0
+            self.body_bytes = 0
+            self.by_encoding: dict[str, int] = {}
+
+    def record(self, transfer: Transfer) -> None:
+        """Add one response to the totals."""
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += transfer.wire_bytes
+            self.body_bytes += transfer.body_bytes
+            encoding = transfer.encoding or "identity"
+            self.by_encoding[encoding] = self.by_encoding.get(encoding, 0) + 1
+        self._local.last = transfer
+
+    @property
+    def last(self) -> Transfer | None:
+        """The last response received by this thread, or None before the first."""
+        return getattr(self._local, "last", None)
+
+    @property
+    def ratio(self) -> float:
+        """Decoded bytes per byte transferred; 1.0 means nothing was compressed."""
+        return self.body_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    def __repr__(self) -> str:
+        return (
+            f"TransferStats(requests={self.requests}, wire_bytes={self.wire_bytes}, "
+            f"body_bytes={self.body_bytes}, ratio={self.ratio:.1f})"
+        )
@@ -7,15 +7,23 @@ import responses
 @pytest.fixture(autouse=True)
 def setup_unit_test():
     """Set mock API URL and reset connector state for unit tests."""
+    from psr.lakehouse.client import Client
     from psr.lakehouse.connector import connector
+    from psr.lakehouse.openapi import openapi_spec
 
     original_url = os.environ.get("LAKEHOUSE_API_URL")
     os.environ["LAKEHOUSE_API_URL"] = "https://test-api.example.com"
 
     connector._is_initialized = True
+    connector._reachable = True
     connector._base_url = "https://test-api.example.com"
     connector._session = connector._create_session()
 
+    # Each test serves its own OpenAPI document, so none may be remembered from the last one.
+    openapi_spec.clear()
+    Client._spec_aliases = (None, {})
+    Client._spec_failure = None
+
     yield
 
     # Restore original env
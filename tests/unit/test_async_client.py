@@ -0,0 +1,166 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+import responses
+
+httpx = pytest.importorskip("httpx")
+
+import psr.lakehouse  # noqa: E402
+from psr.lakehouse import AsyncClient, AsyncConnector  # noqa: E402
+
+from .test_client import make_query_response  # noqa: E402
+
+BASE_URL = "https://test-api.example.com"
+
+PAGES = [
+    [
+        {
+            "CCEESpotPrice.reference_date": "2023-05-01T00:00:00-03:00",
+            "CCEESpotPrice.subsystem": "NORTH",
+            "CCEESpotPrice.spot_price": 69.04,
+        }
+    ],
+    [
+        {
+            "CCEESpotPrice.reference_date": "2023-05-01T00:00:00-03:00",
+            "CCEESpotPrice.subsystem": "SOUTH",
+            "CCEESpotPrice.spot_price": 70.00,
+        }
+    ],
+]
+
+OPENAPI = {
+    "components": {
+        "schemas": {
+            "CCEESpotPrice": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "reference_date": {"type": "string", "format": "date-time"},
+                    "subsystem": {"anyOf": [{"$ref": "#/components/schemas/Subsystem"}, {"type": "null"}]},
+                    "spot_price": {"type": "number"},
+                    "updated_at": {"type": "string", "format": "date-time"},
+                },
+            },
+            "Subsystem": {"enum": ["NORTE", "SUL"]},
+        }
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def session_file(tmp_path, monkeypatch):
+    """Keep every test off the real ~/.psr-lakehouse/session.json."""
+    monkeypatch.setenv("LAKEHOUSE_SESSION_FILE", str(tmp_path / "session.json"))
+
+
+def lakehouse(calls: list):
+    """An httpx transport standing in for the lakehouse API."""
+
+    def handler(request):
+        calls.append(request)
+        if request.url.path == "/health-check":
+            return httpx.Response(200, json=True)
+        if request.url.path == "/openapi.json":
+            return httpx.Response(200, json=OPENAPI)
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=make_query_response(PAGES[page - 1], page=page, has_next=page < len(PAGES)))
+
+    return httpx.MockTransport(handler)
+
+
+def make_client(calls: list) -> AsyncClient:
+    return AsyncClient(connector=AsyncConnector(BASE_URL, transport=lakehouse(calls)))
+
+
+class TestAsyncFetchDataframe:
+    def test_fetch_dataframe_pages(self):
+        """Test that every page is fetched and assembled in order."""
+        calls = []
+
+        async def run():
+            async with make_client(calls) as client:
+                return await client.fetch_dataframe(
+                    "ccee_spot_price",
+                    data_columns=["reference_date", "subsystem", "spot_price"],
+                    start_reference_date="2023-05-01",
+                    end_reference_date="2023-05-01",
+                )
+
+        df = asyncio.run(run())
+
+        assert df["CCEESpotPrice.subsystem"].tolist() == ["NORTH", "SOUTH"]
+        queries = [call for call in calls if call.url.path == "/query/"]
+        assert [call.url.params["page"] for call in queries] == ["1", "2"]
+        assert queries[0].url.params["response_format"] == "columnar"
+
+    @responses.activate
+    def test_matches_synchronous_client(self):
+        """Test that the async client sends the same body and returns the same DataFrame."""
+        for page, data in enumerate(PAGES, start=1):
+            responses.add(
+                responses.POST,
+                f"{BASE_URL}/query/",
+                json=make_query_response(data, page=page, has_next=page < len(PAGES)),
+            )
+        arguments = dict(
+            table_name="ccee_spot_price",
+            data_columns=["reference_date", "subsystem", "spot_price"],
+            filters={"subsystem": ["NORTH", "SOUTH"]},
+            start_reference_date="2023-05-01",
+            end_reference_date="2023-05-01",
+        )
+        expected = psr.lakehouse.client.fetch_dataframe(**arguments)
+
+        calls = []
+
+        async def run():
+            async with make_client(calls) as client:
+                return await client.fetch_dataframe(**arguments)
+
+        df = asyncio.run(run())
+
+        pd.testing.assert_frame_equal(df, expected)
+        sync_body = json.loads(responses.calls[0].request.body)
+        async_body = json.loads(next(call for call in calls if call.url.path == "/query/").content)
+        assert async_body == sync_body
+
+    def test_concurrent_queries(self):
+        """Test that many queries can be awaited together over one client."""
+        calls = []
+
+        async def run():
+            async with make_client(calls) as client:
+                return await asyncio.gather(*(client.fetch_dataframe("ccee_spot_price") for _ in range(10)))
+
+        frames = asyncio.run(run())
+
+        assert all(len(df) == 2 for df in frames)
+        assert len([call for call in calls if call.url.path == "/health-check"]) == 1
+
+
+class TestAsyncSchemaEndpoints:
+    def test_get_schema_resolves_enums(self):
+        """Test that get_schema parses the spec like the synchronous client."""
+        calls = []
+
+        async def run():
+            async with make_client(calls) as client:
+                return await client.get_schema("ccee_spot_price")
+
+        schema = asyncio.run(run())
+
+        assert schema["subsystem"]["type"] == "enum"
+        assert schema["subsystem"]["enum_values"] == ["NORTE", "SUL"]
+        assert len([call for call in calls if call.url.path == "/openapi.json"]) == 1
+
+    def test_list_tables(self):
+        """Test that list_tables skips enums."""
+
+        async def run():
+            async with make_client([]) as client:
+                return await client.list_tables()
+
+        assert asyncio.run(run()) == ["CCEESpotPrice"]
@@ -0,0 +1,227 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from psr.lakehouse import auth  # noqa: E402
+from psr.lakehouse.async_connector import AsyncConnector  # noqa: E402
+from psr.lakehouse.exceptions import LakehouseAuthError, LakehouseError  # noqa: E402
+
+BASE_URL = "https://test-api.example.com"
+
+
+@pytest.fixture(autouse=True)
+def session_file(tmp_path, monkeypatch):
+    """Keep every test off the real ~/.psr-lakehouse/session.json."""
+    monkeypatch.setenv("LAKEHOUSE_SESSION_FILE", str(tmp_path / "session.json"))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry without actually waiting."""
+
+    async def sleep(seconds):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+
+def serve(routes: dict):
+    """An httpx transport answering each path with the next response queued for it."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        queued = routes[request.url.path]
+        return queued.pop(0) if len(queued) > 1 else queued[0]
+
+    return httpx.MockTransport(handler), calls
+
+
+def healthy():
+    return [httpx.Response(200, json=True)]
+
+
+class TestAsyncConnectorInitialization:
+    def test_initialize_runs_health_check(self):
+        """Test that initialization checks the API's health and strips a trailing slash."""
+        transport, calls = serve({"/health-check": healthy()})
+
+        async def run():
+            async with AsyncConnector(f"{BASE_URL}/", transport=transport) as connector:
+                await connector.initialize()
+                return connector._base_url, connector._is_initialized
+
+        base_url, initialized = asyncio.run(run())
+
+        assert base_url == BASE_URL
+        assert initialized is True
+        assert calls[0].url.path == "/health-check"
+
+    def test_initialize_health_check_failure_non_truthy(self):
+        """Test that initialization fails when health check returns non-truthy response."""
+        transport, _ = serve({"/health-check": [httpx.Response(200, json=False)]})
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=transport) as connector:
+                await connector.initialize()
+
+        with pytest.raises(LakehouseError, match="Health check failed"):
+            asyncio.run(run())
+
+    def test_initialize_raises_error_without_url(self, monkeypatch):
+        """Test that initialization raises error when no URL is provided."""
+        monkeypatch.delenv("LAKEHOUSE_API_URL", raising=False)
+
+        async def run():
+            async with AsyncConnector() as connector:
+                await connector.initialize()
+
+        with pytest.raises(LakehouseError, match="API base URL not provided"):
+            asyncio.run(run())
+
+    def test_initialize_without_health_check(self, monkeypatch):
+        """Test that LAKEHOUSE_SKIP_HEALTHCHECK defers contacting the API to the first request."""
+        monkeypatch.setenv("LAKEHOUSE_SKIP_HEALTHCHECK", "1")
+        transport, calls = serve({"/query/schema": [httpx.Response(200, json={"tables": []})]})
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=transport) as connector:
+                return await connector.get("/query/schema")
+
+        assert asyncio.run(run()) == {"tables": []}
+        assert [call.url.path for call in calls] == ["/query/schema"]
+
+    def test_unreachable_api_is_reported_by_the_first_request(self):
+        """Test that without a health check the first request says the API cannot be reached."""
+
+        def refuse(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=httpx.MockTransport(refuse)) as connector:
+                await connector.initialize(check=False)
+                await connector.get("/query/schema")
+
+        with pytest.raises(LakehouseError, match=f"Unable to connect to API at {BASE_URL}"):
+            asyncio.run(run())
+
+
+class TestAsyncConnectorRequests:
+    def test_post_auto_initializes(self):
+        """Test that the first request initializes the connector."""
+        transport, calls = serve(
+            {"/health-check": healthy(), "/query/": [httpx.Response(200, json={"data": [], "pagination": {}})]}
+        )
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=transport) as connector:
+                return await connector.post("/query/", {"query_data": []}, params={"page": 1})
+
+        assert asyncio.run(run()) == {"data": [], "pagination": {}}
+        assert [call.url.path for call in calls] == ["/health-check", "/query/"]
+        assert calls[1].url.params["page"] == "1"
+
+    def test_transient_errors_are_retried(self):
+        """Test that 502/503/504 responses are retried like the synchronous session does."""
+        transport, calls = serve(
+            {
+                "/health-check": healthy(),
+                "/query/": [httpx.Response(502), httpx.Response(503), httpx.Response(200, json={"ok": True})],
+            }
+        )
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=transport) as connector:
+                return await connector.post("/query/", {})
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert len([call for call in calls if call.url.path == "/query/"]) == 3
+
+    def test_http_error_is_formatted(self):
+        """Test that an HTTP error surfaces as a LakehouseError carrying the server's detail."""
+        transport, _ = serve(
+            {"/health-check": healthy(), "/query/": [httpx.Response(400, json={"detail": "Invalid model"})]}
+        )
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=transport) as connector:
+                await connector.post("/query/", {})
+
+        with pytest.raises(LakehouseError, match="HTTP 400 Bad Request .*Invalid model"):
+            asyncio.run(run())
+
+    def test_bounce_logs_in_once_for_concurrent_requests(self, monkeypatch):
+        """Test that concurrent requests bounced to the login page share a single login."""
+        logins = []
+
+        def ensure_login(session, base_url):
+            logins.append(base_url)
+            session.cookies.set("AWSELBAuthSessionCookie-0", "fresh", domain="test-api.example.com")
+
+        monkeypatch.setattr(auth, "ensure_login", ensure_login)
+
+        def handler(request):
+            if request.url.host == "accounts.example.com":
+                return httpx.Response(200, text="<html>login</html>")
+            if request.url.path == "/health-check":
+                return httpx.Response(200, json=True)
+            if "AWSELBAuthSessionCookie-0=fresh" in request.headers.get("cookie", ""):
+                return httpx.Response(200, json={"ok": True})
+            return httpx.Response(302, headers={"Location": "https://accounts.example.com/login"})
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=httpx.MockTransport(handler)) as connector:
+                await connector.initialize()
+                return await asyncio.gather(*(connector.get("/openapi.json") for _ in range(5)))
+
+        assert asyncio.run(run()) == [{"ok": True}] * 5
+        assert logins == [BASE_URL]
+
+    def test_still_bounced_after_login_raises(self, monkeypatch):
+        """Test that a login that does not take raises LakehouseAuthError."""
+        monkeypatch.setattr(auth, "ensure_login", lambda session, base_url: None)
+
+        def handler(request):
+            if request.url.path == "/health-check":
+                return httpx.Response(200, json=True)
+            if request.url.host == "accounts.example.com":
+                return httpx.Response(200, text="<html>login</html>")
+            return httpx.Response(302, headers={"Location": "https://accounts.example.com/login"})
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=httpx.MockTransport(handler)) as connector:
+                await connector.get("/openapi.json")
+
+        with pytest.raises(LakehouseAuthError, match="Still being redirected"):
+            asyncio.run(run())
+
+
+class TestAsyncCompression:
+    def test_compressed_response_is_decoded_and_counted(self):
+        """Test that Accept-Encoding is sent and a gzip body is counted compressed and decoded."""
+        import gzip
+        import json
+
+        body = json.dumps({"rows": [[i] for i in range(2000)]}).encode()
+        compressed = gzip.compress(body)
+        transport, calls = serve(
+            {
+                "/health-check": healthy(),
+                "/query/": [
+                    httpx.Response(200, stream=httpx.ByteStream(compressed), headers={"Content-Encoding": "gzip"})
+                ],
+            }
+        )
+
+        async def run():
+            async with AsyncConnector(BASE_URL, transport=transport) as connector:
+                result = await connector.post("/query/", {})
+                return result, connector.transfer_stats
+
+        result, stats = asyncio.run(run())
+
+        assert result == json.loads(body)
+        assert "gzip" in calls[-1].headers["Accept-Encoding"]
+        assert (stats.wire_bytes, stats.body_bytes) == (len(compressed), len(body))
@@ -0,0 +1,303 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+import responses
+
+pytest.importorskip("pyarrow")
+
+import psr.lakehouse  # noqa: E402
+from psr.lakehouse.cache import query_key, result_cache  # noqa: E402
+from psr.lakehouse.exceptions import LakehouseError  # noqa: E402
+
+from .test_client import make_query_response  # noqa: E402
+
+MOCK_DATA = [
+    {
+        "CCEESpotPrice.reference_date": "2023-05-01T00:00:00-03:00",
+        "CCEESpotPrice.subsystem": "NORTH",
+        "CCEESpotPrice.spot_price": 69.04,
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path):
+    """Point the result cache at a temporary directory for the duration of a test."""
+    result_cache.configure(directory=tmp_path / "cache")
+    yield tmp_path / "cache"
+    result_cache.configure()
+
+
+def fetch(cache: str) -> pd.DataFrame:
+    return psr.lakehouse.client.fetch_dataframe(
+        table_name="ccee_spot_price",
+        data_columns=["reference_date", "subsystem", "spot_price"],
+        start_reference_date="2023-05-01",
+        end_reference_date="2023-05-01",
+        cache=cache,
+    )
+
+
+class TestQueryKey:
+    def test_key_ignores_key_order(self):
+        """Test that equivalent bodies hash the same regardless of key order."""
+        assert query_key({"a": 1, "b": [1, 2]}) == query_key({"b": [1, 2], "a": 1})
+
+    def test_key_depends_on_values(self):
+        """Test that any difference in the body changes the key."""
+        assert query_key({"latest_only": True}) != query_key({"latest_only": False})
+
+
+class TestResultCache:
+    def test_round_trip(self):
+        """Test that a stored result reads back identically, tz-aware dates included."""
+        df = pd.DataFrame(
+            {
+                "when": pd.to_datetime(["2023-05-01T00:00:00-03:00"], format="ISO8601"),
+                "value": [1.5],
+            }
+        )
+        result_cache.put("key", df)
+
+        pd.testing.assert_frame_equal(result_cache.get("key"), df)
+
+    def test_expired_result_is_a_miss(self, cache_dir):
+        """Test that a result older than the TTL is dropped."""
+        result_cache.configure(directory=cache_dir, ttl=60)
+        result_cache.put("key", pd.DataFrame({"value": [1]}))
+        path = cache_dir / "key.parquet"
+        stale = time.time() - 120
+        os.utime(path, (stale, stale))
+
+        assert result_cache.get("key") is None
+        assert not path.exists()
+
+    def test_least_recently_used_is_evicted(self, cache_dir):
+        """Test that the size budget evicts the result read least recently."""
+        result_cache.put("old", pd.DataFrame({"value": range(100)}))
+        result_cache.put("new", pd.DataFrame({"value": range(100)}))
+        now = time.time()
+        os.utime(cache_dir / "old.parquet", (now - 100, now))
+        os.utime(cache_dir / "new.parquet", (now - 200, now))
+        result_cache.get("old")  # bumps its access time past "new"
+
+        size = (cache_dir / "old.parquet").stat().st_size
+        result_cache.configure(directory=cache_dir, max_bytes=2 * size + size // 2)
+        result_cache.put("newest", pd.DataFrame({"value": range(100)}))
+
+        assert sorted(path.stem for path in cache_dir.glob("*.parquet")) == ["newest", "old"]
+
+    def test_corrupt_file_is_a_miss(self, cache_dir):
+        """Test that an unreadable file is treated as absent."""
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "key.parquet").write_bytes(b"not parquet")
+
+        assert result_cache.get("key") is None
+
+
+class TestClientCacheModes:
+    @responses.activate
+    def test_use_serves_repeat_queries_from_disk(self):
+        """Test that cache="use" only goes to the API the first time."""
+        responses.add(responses.POST, "https://test-api.example.com/query/", json=make_query_response(MOCK_DATA))
+
+        first = fetch("use")
+        second = fetch("use")
+
+        assert len(responses.calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    @responses.activate
+    def test_refresh_fetches_and_replaces(self):
+        """Test that cache="refresh" always fetches and stores what it fetched."""
+        responses.add(responses.POST, "https://test-api.example.com/query/", json=make_query_response(MOCK_DATA))
+
+        fetch("refresh")
+        fetch("refresh")
+        fetch("use")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_bypass_leaves_cache_alone(self, cache_dir):
+        """Test that the default mode neither reads nor writes the cache."""
+        responses.add(responses.POST, "https://test-api.example.com/query/", json=make_query_response(MOCK_DATA))
+
+        fetch("bypass")
+        fetch("bypass")
+
+        assert len(responses.calls) == 2
+        assert not cache_dir.exists()
+
+    @responses.activate
+    def test_other_api_is_a_miss(self, monkeypatch):
+        """Test that a result cached from one API is not served after switching to another."""
+        from psr.lakehouse.connector import connector
+
+        for url in ("https://test-api.example.com", "https://staging-api.example.com"):
+            responses.add(responses.POST, f"{url}/query/", json=make_query_response(MOCK_DATA))
+
+        fetch("use")
+        monkeypatch.setattr(connector, "_base_url", "https://staging-api.example.com")
+        fetch("use")
+
+        assert [call.request.url.split("/query/")[0] for call in responses.calls] == [
+            "https://test-api.example.com",
+            "https://staging-api.example.com",
+        ]
+
+    def test_unknown_mode_raises_error(self):
+        """Test that an unsupported cache mode is rejected."""
+        with pytest.raises(LakehouseError, match="Unsupported cache mode"):
+            fetch("sometimes")
+
+
+class TestIncrementalCache:
+    @staticmethod
+    def _daily_rows(requests_seen: list):
+        """A stand-in for connector.post returning one row per day of the requested window."""
+        from datetime import date, timedelta
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            bounds = {f["operator"]: f["value"] for f in json_body["query_filters"] if "reference_date" in f["column"]}
+            requests_seen.append((bounds[">="], bounds["<"]))
+            day, stop = date.fromisoformat(bounds[">="]), date.fromisoformat(bounds["<"])
+            data = []
+            while day < stop:
+                data.append(
+                    {
+                        "CCEESpotPrice.reference_date": f"{day.isoformat()}T00:00:00-03:00",
+                        "CCEESpotPrice.spot_price": float(day.day),
+                    }
+                )
+                day += timedelta(days=1)
+            return make_query_response(data)
+
+        return mock_post
+
+    def _fetch(self, start: str, end: str) -> pd.DataFrame:
+        return psr.lakehouse.client.fetch_dataframe(
+            table_name="ccee_spot_price",
+            data_columns=["reference_date", "spot_price"],
+            start_reference_date=start,
+            end_reference_date=end,
+            cache="incremental",
+        )
+
+    def test_sliding_window_fetches_only_new_days(self):
+        """Test that moving the window forward only downloads the days not seen before."""
+        from unittest.mock import patch
+
+        seen = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._daily_rows(seen)):
+            first = self._fetch("2023-05-01", "2023-05-10")
+            second = self._fetch("2023-05-02", "2023-05-11")
+
+        assert seen == [("2023-05-01", "2023-05-11"), ("2023-05-11", "2023-05-12")]
+        assert len(first) == 10
+        assert second["CCEESpotPrice.spot_price"].tolist() == [float(day) for day in range(2, 12)]
+
+    def test_gaps_on_both_sides_are_filled(self):
+        """Test that a wider window fetches the missing days before and after the cached ones."""
+        from unittest.mock import patch
+
+        seen = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._daily_rows(seen)):
+            self._fetch("2023-05-05", "2023-05-06")
+            df = self._fetch("2023-05-01", "2023-05-10")
+
+        assert seen[1:] == [("2023-05-01", "2023-05-05"), ("2023-05-07", "2023-05-11")]
+        assert df["CCEESpotPrice.spot_price"].tolist() == [float(day) for day in range(1, 11)]
+
+    def test_other_api_does_not_share_days(self, monkeypatch):
+        """Test that the days cached from one API are fetched again from another."""
+        from unittest.mock import patch
+
+        from psr.lakehouse.connector import connector
+
+        seen = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._daily_rows(seen)):
+            self._fetch("2023-05-01", "2023-05-05")
+            monkeypatch.setattr(connector, "_base_url", "https://staging-api.example.com")
+            self._fetch("2023-05-01", "2023-05-05")
+
+        assert seen == [("2023-05-01", "2023-05-06"), ("2023-05-01", "2023-05-06")]
+
+    def test_adjacent_segments_are_merged(self, cache_dir):
+        """Test that consecutive refreshes extend one segment instead of adding files."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._daily_rows([])):
+            self._fetch("2023-05-01", "2023-05-03")
+            self._fetch("2023-05-01", "2023-05-04")
+            self._fetch("2023-05-01", "2023-05-05")
+
+        assert len(list(cache_dir.glob("ranges/*/*.parquet"))) == 1
+
+    def test_ranges_share_the_size_budget(self, cache_dir):
+        """Test that range segments count towards max_bytes, the least recently used key going whole."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._daily_rows([])):
+            self._fetch("2023-05-01", "2023-05-03")
+        (index,) = cache_dir.glob("ranges/*/index.json")
+        now = time.time()
+        os.utime(index, (now - 100, now))
+
+        result_cache.put("result", pd.DataFrame({"value": range(100)}))
+        size = (cache_dir / "result.parquet").stat().st_size
+        result_cache.configure(directory=cache_dir, max_bytes=size * 3 // 2)
+        result_cache.put("newer", pd.DataFrame({"value": range(100)}))
+
+        assert not list(cache_dir.glob("ranges/*"))
+        assert [path.stem for path in cache_dir.glob("*.parquet")] == ["newer"]
+
+    def test_clear_removes_ranges(self, cache_dir):
+        """Test that result_cache.clear() empties the incremental cache as well."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._daily_rows([])):
+            self._fetch("2023-05-01", "2023-05-03")
+
+        result_cache.clear()
+
+        assert not (cache_dir / "ranges").exists()
+
+    def test_recent_days_are_not_cached(self):
+        """Test that days still within the settling period are fetched every time."""
+        from datetime import date, timedelta
+        from unittest.mock import patch
+
+        today = date.today()
+        start, end = (today - timedelta(days=10)).isoformat(), today.isoformat()
+        seen = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._daily_rows(seen)):
+            self._fetch(start, end)
+            self._fetch(start, end)
+
+        settled = (today - timedelta(days=3) + timedelta(days=1)).isoformat()
+        assert seen[1] == (settled, (today + timedelta(days=1)).isoformat())
+
+    def test_incremental_rejects_aggregation(self):
+        """Test that an aggregated query cannot be cached by date intervals."""
+        with pytest.raises(LakehouseError, match="cannot be combined with group_by"):
+            psr.lakehouse.client.fetch_dataframe(
+                table_name="ccee_spot_price",
+                data_columns=["reference_date", "spot_price"],
+                start_reference_date="2023-05-01",
+                end_reference_date="2023-05-02",
+                group_by=["subsystem"],
+                aggregation_method="avg",
+                cache="incremental",
+            )
+
+    def test_incremental_needs_a_closed_window(self):
+        """Test that an open-ended window is rejected."""
+        with pytest.raises(LakehouseError, match="needs both"):
+            psr.lakehouse.client.fetch_dataframe(
+                table_name="ccee_spot_price",
+                start_reference_date="2023-05-01",
+                cache="incremental",
+            )
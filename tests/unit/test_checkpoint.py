@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+import pytest
+
+import psr.lakehouse
+from psr.lakehouse.checkpoint import page_checkpoints
+from psr.lakehouse.exceptions import LakehouseError
+
+from .test_client import make_query_response
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path):
+    """Keep checkpoints in a temporary directory."""
+    page_checkpoints.configure(directory=tmp_path / "checkpoints")
+    yield tmp_path / "checkpoints"
+    page_checkpoints.configure()
+
+
+def serve_pages(pages: int, fail_on: int | None = None):
+    """A stand-in for connector.post serving `pages` pages of two rows, failing once on `fail_on`."""
+    requested = []
+    failed = []
+
+    def mock_post(url, json_body, params=None, timeout=None):
+        page = params["page"]
+        requested.append(page)
+        if page == fail_on and not failed:
+            failed.append(page)
+            raise LakehouseError("HTTP 504 Gateway Timeout for https://test-api.example.com/query/")
+        return make_query_response(
+            [{"ONSEnergyLoadDaily.value": (page - 1) * 2 + i} for i in range(2)],
+            page=page,
+            page_size=2,
+            has_next=page < pages,
+        )
+
+    return mock_post, requested
+
+
+def fetch(mock_post, **kwargs):
+    with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+        return psr.lakehouse.client.fetch_dataframe(
+            table_name="ons_energy_load_daily", data_columns=["value"], page_size=2, checkpoint=True, **kwargs
+        )
+
+
+class TestCheckpoint:
+    def test_rerun_resumes_from_first_missing_page(self, checkpoint_dir):
+        """Test that a re-run after a failure only fetches the pages that were not saved."""
+        mock_post, requested = serve_pages(4, fail_on=3)
+
+        with pytest.raises(LakehouseError, match="504"):
+            fetch(mock_post)
+        assert requested == [1, 2, 3]
+
+        df = fetch(mock_post)
+
+        assert requested == [1, 2, 3, 3, 4]
+        assert df["ONSEnergyLoadDaily.value"].tolist() == list(range(8))
+
+    def test_other_api_starts_over(self, monkeypatch):
+        """Test that pages saved from one API are not resumed against another."""
+        from psr.lakehouse.connector import connector
+
+        mock_post, requested = serve_pages(3, fail_on=2)
+        with pytest.raises(LakehouseError, match="504"):
+            fetch(mock_post)
+
+        monkeypatch.setattr(connector, "_base_url", "https://staging-api.example.com")
+        fetch(mock_post)
+
+        assert requested == [1, 2, 1, 2, 3]
+
+    def test_checkpoint_is_removed_once_complete(self, checkpoint_dir):
+        """Test that nothing is left in the spill directory after a successful fetch."""
+        mock_post, _ = serve_pages(3)
+
+        fetch(mock_post)
+
+        assert list(checkpoint_dir.iterdir()) == []
+
+    def test_concurrent_pages_are_checkpointed(self):
+        """Test that pages fetched by several workers are saved and resumed as well."""
+        mock_post, requested = serve_pages(6, fail_on=5)
+
+        with pytest.raises(LakehouseError):
+            fetch(mock_post, max_workers=2)
+        saved = set(requested) - {5}
+        requested.clear()
+        df = fetch(mock_post, max_workers=2)
+
+        assert 5 in requested
+        assert not saved & set(requested)
+        assert df["ONSEnergyLoadDaily.value"].tolist() == list(range(12))
+
+    def test_stale_checkpoint_is_started_over(self):
+        """Test that a checkpoint older than max_age is not resumed."""
+        page_checkpoints.configure(directory=page_checkpoints.directory, max_age=0)
+        mock_post, requested = serve_pages(3, fail_on=2)
+
+        with pytest.raises(LakehouseError):
+            fetch(mock_post)
+        fetch(mock_post)
+
+        assert requested == [1, 2, 1, 2, 3]
+
+    def test_checkpoint_with_auto_page_size_raises_error(self):
+        """Test that checkpoints, being saved page by page, refuse page_size='auto'."""
+        with pytest.raises(LakehouseError, match="fixed page_size"):
+            psr.lakehouse.client.iter_dataframes(table_name="ons_energy_load_daily", page_size="auto", checkpoint=True)
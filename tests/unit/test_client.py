@@ -1214,3 +1214,1281 @@ class TestSchemaEndpoints:
         assert "spot_price" in columns
         assert "id" in columns
         assert "updated_at" in columns
+
+
+class TestConcurrentPageFetching:
+    @staticmethod
+    def _paged_post(total_pages: int, requested: list):
+        """A stand-in for connector.post serving `total_pages` one-row pages, then empty ones."""
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            page = params["page"]
+            requested.append(page)
+            if page > total_pages:
+                return make_query_response([], page=page, page_size=1)
+            return make_query_response(
+                [{"ONSEnergyLoadDaily.value": page}], page=page, page_size=1, has_next=page < total_pages
+            )
+
+        return mock_post
+
+    def test_pages_are_reassembled_in_order(self):
+        """Test that pages fetched by a pool of workers still come back in page order."""
+        from unittest.mock import patch
+
+        requested = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._paged_post(7, requested)):
+            df = psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_energy_load_daily",
+                data_columns=["value"],
+                max_workers=3,
+            )
+
+        assert df["ONSEnergyLoadDaily.value"].tolist() == [1, 2, 3, 4, 5, 6, 7]
+        assert set(range(1, 8)) <= set(requested)
+        # Speculation past the last page is bounded by the number of workers.
+        assert max(requested) <= 7 + 3
+
+    def test_single_worker_fetches_serially(self):
+        """Test that the default of one worker requests exactly the pages that exist."""
+        from unittest.mock import patch
+
+        requested = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._paged_post(3, requested)):
+            df = psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_energy_load_daily",
+                data_columns=["value"],
+            )
+
+        assert df["ONSEnergyLoadDaily.value"].tolist() == [1, 2, 3]
+        assert requested == [1, 2, 3]
+
+    def test_failure_in_a_worker_raises_error(self):
+        """Test that a page failing in a worker raises instead of returning partial data."""
+        from unittest.mock import patch
+
+        serve = self._paged_post(5, [])
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            if params["page"] == 3:
+                raise LakehouseError("Request timed out")
+            return serve(url, json_body, params=params, timeout=timeout)
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+            with pytest.raises(LakehouseError, match="Request timed out"):
+                psr.lakehouse.client.fetch_dataframe(
+                    table_name="ons_energy_load_daily",
+                    data_columns=["value"],
+                    max_workers=4,
+                )
+
+    def test_invalid_max_workers_raises_error(self):
+        """Test that fewer than one worker is rejected."""
+        with pytest.raises(LakehouseError, match="max_workers"):
+            psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_energy_load_daily",
+                data_columns=["value"],
+                max_workers=0,
+            )
+
+
+class TestIterDataframes:
+    @staticmethod
+    def _serve_pages(pages: list[list[int]]):
+        """A stand-in for connector.post serving the given pages of values."""
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            page = params["page"]
+            values = pages[page - 1] if page <= len(pages) else []
+            return make_query_response(
+                [
+                    {"ONSEnergyLoadDaily.reference_date": "2023-05-01T00:00:00-03:00", "ONSEnergyLoadDaily.value": v}
+                    for v in values
+                ],
+                page=page,
+                has_next=page < len(pages),
+            )
+
+        return mock_post
+
+    def test_yields_one_dataframe_per_page(self):
+        """Test that without chunk_rows each page becomes its own DataFrame."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([[1, 2], [3, 4], [5]])):
+            chunks = list(
+                psr.lakehouse.client.iter_dataframes(
+                    table_name="ons_energy_load_daily",
+                    data_columns=["reference_date", "value"],
+                )
+            )
+
+        assert [chunk["ONSEnergyLoadDaily.value"].tolist() for chunk in chunks] == [[1, 2], [3, 4], [5]]
+        assert all(pd.api.types.is_datetime64_any_dtype(chunk["ONSEnergyLoadDaily.reference_date"]) for chunk in chunks)
+
+    def test_chunk_rows_regroups_pages(self):
+        """Test that chunk_rows yields DataFrames of that many rows across page boundaries."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([[1, 2], [3, 4], [5]])):
+            chunks = list(
+                psr.lakehouse.client.iter_dataframes(
+                    table_name="ons_energy_load_daily",
+                    data_columns=["reference_date", "value"],
+                    chunk_rows=3,
+                )
+            )
+
+        assert [chunk["ONSEnergyLoadDaily.value"].tolist() for chunk in chunks] == [[1, 2, 3], [4, 5]]
+
+    def test_empty_result_yields_one_empty_dataframe(self):
+        """Test that an empty result still yields a single (empty) DataFrame."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([[]])):
+            chunks = list(psr.lakehouse.client.iter_dataframes(table_name="ons_energy_load_daily"))
+
+        assert len(chunks) == 1
+        assert chunks[0].empty
+
+    def test_fetch_dataframe_concatenates_chunks(self):
+        """Test that fetch_dataframe returns the chunks concatenated with a fresh index."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([[1, 2], [3]])):
+            df = psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_energy_load_daily",
+                data_columns=["reference_date", "value"],
+            )
+
+        assert df["ONSEnergyLoadDaily.value"].tolist() == [1, 2, 3]
+        assert df.index.tolist() == [0, 1, 2]
+
+    def test_invalid_chunk_rows_raises_on_call(self):
+        """Test that an invalid chunk_rows is rejected before any request is made."""
+        with pytest.raises(LakehouseError, match="chunk_rows"):
+            psr.lakehouse.client.iter_dataframes(table_name="ons_energy_load_daily", chunk_rows=0)
+
+
+class TestFetchArrow:
+    @staticmethod
+    def _serve_pages(pages: list[list]):
+        """A stand-in for connector.post serving the given pages of (date, value) rows."""
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            page = params["page"]
+            rows = pages[page - 1] if page <= len(pages) else []
+            return make_query_response(
+                [{"ONSEnergyLoadDaily.reference_date": d, "ONSEnergyLoadDaily.value": v} for d, v in rows],
+                page=page,
+                has_next=page < len(pages),
+            )
+
+        return mock_post
+
+    PAGES = [
+        [("2023-05-01T00:00:00-03:00", 1.5), ("2023-05-02T00:00:00-03:00", None)],
+        [("2023-05-03T00:00:00-03:00", 3.5)],
+    ]
+
+    def test_fetch_arrow_builds_typed_columns(self):
+        """Test that pages become one Arrow table with timestamp and numeric columns."""
+        pa = pytest.importorskip("pyarrow")
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(self.PAGES)):
+            table = psr.lakehouse.client.fetch_arrow(
+                table_name="ons_energy_load_daily",
+                data_columns=["reference_date", "value"],
+            )
+
+        assert table.num_rows == 3
+        assert table.schema.field("ONSEnergyLoadDaily.value").type == pa.float64()
+        assert table.schema.field("ONSEnergyLoadDaily.reference_date").type == pa.timestamp(
+            "us", tz="America/Sao_Paulo"
+        )
+        assert table.column("ONSEnergyLoadDaily.value").to_pylist() == [1.5, None, 3.5]
+
+    def test_fetch_arrow_matches_fetch_dataframe(self):
+        """Test that the Arrow result holds the same values as the DataFrame result."""
+        pytest.importorskip("pyarrow")
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(self.PAGES)):
+            table = psr.lakehouse.client.fetch_arrow(table_name="ons_energy_load_daily")
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ons_energy_load_daily")
+
+        converted = table.to_pandas()
+        assert converted["ONSEnergyLoadDaily.value"].equals(df["ONSEnergyLoadDaily.value"])
+        assert (converted["ONSEnergyLoadDaily.reference_date"] == df["ONSEnergyLoadDaily.reference_date"]).all()
+
+    def test_every_date_time_column_becomes_a_timestamp(self):
+        """Test that date-time columns other than reference_date are parsed too, and text is not."""
+        pa = pytest.importorskip("pyarrow")
+        from unittest.mock import patch
+
+        data = [
+            {
+                "ONSEnergyLoadDaily.reference_date": "2024-01-01T00:00:00-03:00",
+                "ONSEnergyLoadDaily.updated_at": "2024-01-02T10:30:00-03:00",
+                "ONSEnergyLoadDaily.deleted_at": None,
+                "ONSEnergyLoadDaily.subsystem": "SUL",
+            },
+            {
+                "ONSEnergyLoadDaily.reference_date": "2024-01-02T00:00:00-03:00",
+                "ONSEnergyLoadDaily.updated_at": "2024-01-03T10:30:00-03:00",
+                "ONSEnergyLoadDaily.deleted_at": "2024-01-04T08:00:00-03:00",
+                "ONSEnergyLoadDaily.subsystem": "NORTE",
+            },
+        ]
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(data)):
+            table = psr.lakehouse.client.fetch_arrow(table_name="ons_energy_load_daily")
+
+        timestamp = pa.timestamp("us", tz="America/Sao_Paulo")
+        assert table.schema.field("ONSEnergyLoadDaily.updated_at").type == timestamp
+        assert table.schema.field("ONSEnergyLoadDaily.deleted_at").type == timestamp
+        assert table.schema.field("ONSEnergyLoadDaily.subsystem").type == pa.string()
+        assert table.column("ONSEnergyLoadDaily.deleted_at").null_count == 1
+
+    def test_all_null_page_is_promoted(self):
+        """Test that a column null on one page takes the type of the pages that have values."""
+        pa = pytest.importorskip("pyarrow")
+        from unittest.mock import patch
+
+        pages = [[("2023-05-01T00:00:00-03:00", None)], [("2023-05-02T00:00:00-03:00", 7)]]
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(pages)):
+            table = psr.lakehouse.client.fetch_arrow(table_name="ons_energy_load_daily")
+
+        assert table.schema.field("ONSEnergyLoadDaily.value").type == pa.int64()
+        assert table.column("ONSEnergyLoadDaily.value").to_pylist() == [None, 7]
+
+    def test_empty_result_gives_empty_table(self):
+        """Test that no rows give an empty table rather than an error."""
+        pytest.importorskip("pyarrow")
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([[]])):
+            table = psr.lakehouse.client.fetch_arrow(table_name="ons_energy_load_daily")
+
+        assert table.num_rows == 0
+
+    def test_fetch_parquet_writes_every_page(self, tmp_path):
+        """Test that fetch_parquet streams all pages into one file and reports the row count."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        from unittest.mock import patch
+
+        path = tmp_path / "load.parquet"
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(self.PAGES)):
+            rows = psr.lakehouse.client.fetch_parquet("ons_energy_load_daily", path)
+
+        assert rows == 3
+        assert pq.read_table(path).column("ONSEnergyLoadDaily.value").to_pylist() == [1.5, None, 3.5]
+
+    def test_fetch_parquet_casts_pages_to_the_given_schema(self, tmp_path):
+        """Test that an explicit schema lets a leading all-null page through."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        from unittest.mock import patch
+
+        schema = pa.schema(
+            [
+                ("ONSEnergyLoadDaily.reference_date", pa.timestamp("us", tz="America/Sao_Paulo")),
+                ("ONSEnergyLoadDaily.value", pa.float64()),
+            ]
+        )
+        pages = [[("2023-05-01T00:00:00-03:00", None)], [("2023-05-02T00:00:00-03:00", 7)]]
+        path = tmp_path / "load.parquet"
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(pages)):
+            psr.lakehouse.client.fetch_parquet("ons_energy_load_daily", path, schema=schema)
+
+        assert pq.read_table(path).column("ONSEnergyLoadDaily.value").to_pylist() == [None, 7.0]
+
+    def test_fetch_parquet_removes_file_on_failure(self, tmp_path):
+        """Test that a failed fetch leaves no partial file behind."""
+        pytest.importorskip("pyarrow")
+        from unittest.mock import patch
+
+        pages = [[("2023-05-01T00:00:00-03:00", None)], [("2023-05-02T00:00:00-03:00", 7)]]
+        path = tmp_path / "load.parquet"
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(pages)):
+            with pytest.raises(LakehouseError, match="pass 'schema'"):
+                psr.lakehouse.client.fetch_parquet("ons_energy_load_daily", path)
+
+        assert not path.exists()
+
+
+class TestTypedDataframe:
+    SCHEMAS = {
+        "CCEESpotPrice": {
+            "properties": {
+                "id": {"type": "integer"},
+                "reference_date": {"type": "string", "format": "date-time"},
+                "subsystem": {"$ref": "#/components/schemas/Subsystem"},
+                "spot_price": {"anyOf": [{"type": "number"}, {"type": "null"}]},
+                "updated_at": {"type": "string", "format": "date-time"},
+            },
+        },
+        "Subsystem": {"enum": ["NORTE", "NORDESTE", "SUDESTE", "SUL"]},
+    }
+
+    @staticmethod
+    def _serve_pages(pages: list[list[dict]]):
+        """A stand-in for connector.post serving the given pages of records."""
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            page = params["page"]
+            return make_query_response(
+                pages[page - 1] if page <= len(pages) else [], page=page, has_next=page < len(pages)
+            )
+
+        return mock_post
+
+    PAGES = [
+        [
+            {
+                "CCEESpotPrice.reference_date": "2023-05-01T00:00:00-03:00",
+                "CCEESpotPrice.subsystem": "SUL",
+                "CCEESpotPrice.spot_price": 69.04,
+                "CCEESpotPrice.updated_at": "2023-05-02T10:00:00-03:00",
+            }
+        ],
+        [
+            {
+                "CCEESpotPrice.reference_date": "2023-05-02T00:00:00-03:00",
+                "CCEESpotPrice.subsystem": "NORTE",
+                "CCEESpotPrice.spot_price": None,
+                "CCEESpotPrice.updated_at": "2023-05-03T10:00:00-03:00",
+            }
+        ],
+    ]
+
+    def test_columns_take_schema_dtypes(self):
+        """Test that typed=True builds every known column with its schema dtype."""
+        from unittest.mock import patch
+
+        with (
+            patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(self.PAGES)),
+            patch.object(psr.lakehouse.client, "_fetch_openapi_schema", return_value=self.SCHEMAS),
+        ):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ccee_spot_price", typed=True)
+
+        assert df["CCEESpotPrice.spot_price"].dtype == "Float64"
+        assert df["CCEESpotPrice.subsystem"].dtype == "category"
+        assert list(df["CCEESpotPrice.subsystem"].cat.categories) == ["NORTE", "NORDESTE", "SUDESTE", "SUL"]
+        assert str(df["CCEESpotPrice.reference_date"].dtype).endswith("America/Sao_Paulo]")
+        assert str(df["CCEESpotPrice.updated_at"].dtype).endswith("America/Sao_Paulo]")
+        assert df["CCEESpotPrice.spot_price"].isna().tolist() == [False, True]
+
+    def test_schema_is_fetched_once_per_query(self):
+        """Test that the schema is resolved once, not for every page."""
+        from unittest.mock import patch
+
+        with (
+            patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(self.PAGES)),
+            patch.object(psr.lakehouse.client, "_fetch_openapi_schema", return_value=self.SCHEMAS) as schema,
+        ):
+            psr.lakehouse.client.fetch_dataframe(table_name="ccee_spot_price", typed=True)
+
+        assert schema.call_count == 1
+
+    def test_untyped_by_default(self):
+        """Test that without typed=True no schema is fetched and dtypes are inferred."""
+        from unittest.mock import patch
+
+        with (
+            patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(self.PAGES)),
+            patch.object(psr.lakehouse.client, "_fetch_openapi_schema") as schema,
+        ):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ccee_spot_price")
+
+        schema.assert_not_called()
+        assert df["CCEESpotPrice.subsystem"].dtype != "category"
+
+    def test_unknown_columns_are_inferred(self):
+        """Test that columns missing from the schema are still built, by inference."""
+        from unittest.mock import patch
+
+        page = [{"CCEESpotPrice.reference_date": "2023-05-01T00:00:00-03:00", "avg_spot_price": 1.5}]
+        with (
+            patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([page])),
+            patch.object(psr.lakehouse.client, "_fetch_openapi_schema", return_value=self.SCHEMAS),
+        ):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ccee_spot_price", typed=True)
+
+        assert df["avg_spot_price"].tolist() == [1.5]
+
+
+class TestPolarsBackend:
+    def test_fetch_dataframe_builds_polars_frame(self):
+        """Test that backend="polars" returns a polars DataFrame typed from the schema."""
+        pl = pytest.importorskip("polars")
+        from unittest.mock import patch
+
+        with (
+            patch.object(
+                psr.lakehouse.connector, "post", side_effect=TestTypedDataframe._serve_pages(TestTypedDataframe.PAGES)
+            ),
+            patch.object(psr.lakehouse.client, "_fetch_openapi_schema", return_value=TestTypedDataframe.SCHEMAS),
+        ):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ccee_spot_price", backend="polars")
+
+        assert isinstance(df, pl.DataFrame)
+        assert df.height == 2
+        assert df.schema["CCEESpotPrice.spot_price"] == pl.Float64
+        assert df.schema["CCEESpotPrice.subsystem"] == pl.Enum(["NORTE", "NORDESTE", "SUDESTE", "SUL"])
+        assert df.schema["CCEESpotPrice.reference_date"] == pl.Datetime("us", "America/Sao_Paulo")
+        assert df["CCEESpotPrice.spot_price"].to_list() == [69.04, None]
+
+    def test_fetch_dataframe_from_query_builds_polars_frame(self):
+        """Test that the custom-query path offers the polars backend too."""
+        pl = pytest.importorskip("polars")
+        from unittest.mock import patch
+
+        page = [{"CCEESpotPrice.reference_date": "2023-05-01T00:00:00-03:00", "avg_spot_price": 1.5}]
+        with (
+            patch.object(psr.lakehouse.connector, "post", side_effect=TestTypedDataframe._serve_pages([page])),
+            patch.object(psr.lakehouse.client, "_fetch_openapi_schema", return_value=TestTypedDataframe.SCHEMAS),
+        ):
+            df = psr.lakehouse.client.fetch_dataframe_from_query(
+                {"query_data": ["CCEESpotPrice.reference_date"]}, backend="polars"
+            )
+
+        assert isinstance(df, pl.DataFrame)
+        assert df["avg_spot_price"].to_list() == [1.5]
+
+    def test_polars_result_is_cached(self, tmp_path):
+        """Test that a polars result is stored and read back as polars."""
+        pl = pytest.importorskip("polars")
+        from unittest.mock import patch
+
+        psr.lakehouse.result_cache.configure(directory=tmp_path)
+        try:
+            with (
+                patch.object(
+                    psr.lakehouse.connector,
+                    "post",
+                    side_effect=TestTypedDataframe._serve_pages(TestTypedDataframe.PAGES),
+                ) as post,
+                patch.object(psr.lakehouse.client, "_fetch_openapi_schema", return_value=TestTypedDataframe.SCHEMAS),
+            ):
+                first = psr.lakehouse.client.fetch_dataframe("ccee_spot_price", backend="polars", cache="use")
+                second = psr.lakehouse.client.fetch_dataframe("ccee_spot_price", backend="polars", cache="use")
+        finally:
+            psr.lakehouse.result_cache.configure()
+
+        assert post.call_count == 2
+        assert isinstance(second, pl.DataFrame)
+        assert second.equals(first)
+
+    def test_unknown_backend_raises_error(self):
+        """Test that an unsupported backend is rejected before any request is made."""
+        with pytest.raises(LakehouseError, match="Unsupported backend"):
+            psr.lakehouse.client.fetch_dataframe(table_name="ccee_spot_price", backend="arrow")
+
+
+class TestAdaptivePageSize:
+    @staticmethod
+    def _serve_table(total_rows: int, cap: int | None = None, fail_above: int | None = None):
+        """A stand-in for connector.post paginating `total_rows` rows by offset.
+
+        `cap` limits the rows returned per page, as a server-side maximum would; pages larger than
+        `fail_above` time out.
+        """
+        import requests
+
+        calls = []
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            page, size = params["page"], params["page_size"]
+            calls.append(size)
+            if fail_above is not None and size > fail_above:
+                raise LakehouseError("Request timed out") from requests.exceptions.ReadTimeout()
+            start = (page - 1) * size
+            stop = min(start + min(size, cap or size), total_rows)
+            return make_query_response(
+                [{"ONSEnergyLoadDaily.value": i} for i in range(start, stop)],
+                page=page,
+                page_size=size,
+                has_next=stop < total_rows,
+            )
+
+        return mock_post, calls
+
+    def _fetch(self, mock_post):
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+            return psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_energy_load_daily", data_columns=["value"], page_size="auto"
+            )
+
+    def test_fast_small_pages_grow(self):
+        """Test that quick, small responses lead to larger pages and every row arrives once."""
+        mock_post, calls = self._serve_table(500_000)
+
+        df = self._fetch(mock_post)
+
+        assert df["ONSEnergyLoadDaily.value"].tolist() == list(range(500_000))
+        assert calls[0] == 8192
+        assert calls[2] > calls[1]
+        assert max(calls) <= 262144
+
+    def test_growing_pages_fetch_no_row_twice(self):
+        """Test that larger pages start at the offset reached instead of fetching page 1 again."""
+        mock_post, calls = self._serve_table(600_000)
+        served = []
+
+        def counting_post(*args, **kwargs):
+            response = mock_post(*args, **kwargs)
+            served.append((kwargs["params"]["page"], len(response["data"]["rows"])))
+            return response
+
+        df = self._fetch(counting_post)
+
+        assert len(df) == 600_000
+        assert sum(rows for _, rows in served) == 600_000
+        assert [page for page, _ in served].count(1) == 1
+        assert max(calls) > calls[0]
+
+    def test_large_responses_shrink_pages(self):
+        """Test that a page far over the byte budget makes the next one smaller."""
+        from psr.lakehouse.client import _next_page_size
+
+        assert _next_page_size(8192, 8192, 64 * 1024**2, 1.0, 262144) == 2048
+        assert _next_page_size(8192, 8192, 1024**2, 1.0, 262144) == 32768
+        assert _next_page_size(8192, 8192, 1024**2, 60.0, 262144) == 2048
+        assert _next_page_size(8192, 8192, 1024, 0.01, 16384) == 16384
+
+    def test_timeouts_shrink_and_cap_pages(self):
+        """Test that a timed-out page is fetched again smaller, and pages stay under the failed size."""
+        mock_post, calls = self._serve_table(100_000, fail_above=4096)
+
+        df = self._fetch(mock_post)
+
+        assert df["ONSEnergyLoadDaily.value"].tolist() == list(range(100_000))
+        assert calls[:2] == [8192, 2048]
+        assert max(calls[1:]) <= 4096
+
+    def test_server_page_cap_loses_no_rows(self):
+        """Test that a server returning fewer rows than asked for still yields every row once."""
+        mock_post, calls = self._serve_table(60_000, cap=5000)
+
+        df = self._fetch(mock_post)
+
+        assert df["ONSEnergyLoadDaily.value"].tolist() == list(range(60_000))
+
+    def test_auto_with_several_workers_raises_error(self):
+        """Test that page_size='auto' cannot be combined with concurrent page fetching."""
+        with pytest.raises(LakehouseError, match="max_workers=1"):
+            psr.lakehouse.client.iter_dataframes(table_name="ons_energy_load_daily", page_size="auto", max_workers=4)
+
+    def test_invalid_page_size_raises_error(self):
+        """Test that a page size that is neither a positive number nor 'auto' is rejected."""
+        with pytest.raises(LakehouseError, match="page_size"):
+            psr.lakehouse.client.iter_dataframes(table_name="ons_energy_load_daily", page_size="big")
+
+
+class TestShardedFetch:
+    @staticmethod
+    def _serve_days(fail_first: set | None = None):
+        """A stand-in for connector.post returning one row per day of the requested window.
+
+        Windows starting on a date in `fail_first` time out the first time they are requested.
+        """
+        from datetime import date, timedelta
+
+        import requests
+
+        windows = []
+        failed = set()
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            bounds = {f["operator"]: f["value"] for f in json_body["query_filters"] if "reference_date" in f["column"]}
+            windows.append((bounds[">="], bounds["<"]))
+            if fail_first and bounds[">="] in fail_first and bounds[">="] not in failed:
+                failed.add(bounds[">="])
+                raise LakehouseError("Request timed out") from requests.exceptions.ReadTimeout()
+            day, stop = date.fromisoformat(bounds[">="]), date.fromisoformat(bounds["<"])
+            data = []
+            while day < stop:
+                data.append(
+                    {"ONSEnergyLoadDaily.reference_date": f"{day}T00:00:00-03:00", "ONSEnergyLoadDaily.value": 1}
+                )
+                day += timedelta(days=1)
+            return make_query_response(data)
+
+        return mock_post, windows
+
+    def _fetch(self, mock_post, **kwargs):
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+            return psr.lakehouse.client.fetch_dataframe(table_name="ons_energy_load_daily", **kwargs)
+
+    def test_month_shards_cover_the_window_in_order(self):
+        """Test that each calendar month is queried on its own and the rows come back in order."""
+        mock_post, windows = self._serve_days()
+
+        df = self._fetch(
+            mock_post,
+            start_reference_date="2023-01-15",
+            end_reference_date="2023-03-10",
+            shard_by="month",
+            max_workers=3,
+        )
+
+        assert sorted(windows) == [
+            ("2023-01-15", "2023-02-01"),
+            ("2023-02-01", "2023-03-01"),
+            ("2023-03-01", "2023-03-11"),
+        ]
+        dates = df["ONSEnergyLoadDaily.reference_date"]
+        assert len(df) == 55
+        assert dates.is_monotonic_increasing
+
+    def test_week_and_year_shards(self):
+        """Test that weeks start on Monday and years on January 1st."""
+        from datetime import date
+
+        from psr.lakehouse.client import _shard_dates
+
+        assert _shard_dates(date(2024, 1, 3), date(2024, 1, 15), "week") == [
+            (date(2024, 1, 3), date(2024, 1, 7)),
+            (date(2024, 1, 8), date(2024, 1, 14)),
+            (date(2024, 1, 15), date(2024, 1, 15)),
+        ]
+        assert _shard_dates(date(2022, 6, 1), date(2023, 2, 1), "year") == [
+            (date(2022, 6, 1), date(2022, 12, 31)),
+            (date(2023, 1, 1), date(2023, 2, 1)),
+        ]
+
+    def test_failed_shard_is_retried_alone(self, monkeypatch):
+        """Test that a shard that timed out is fetched again without refetching the others."""
+        import time
+
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        mock_post, windows = self._serve_days(fail_first={"2023-02-01"})
+
+        df = self._fetch(
+            mock_post, start_reference_date="2023-01-01", end_reference_date="2023-03-31", shard_by="month"
+        )
+
+        assert len(df) == 90
+        assert [start for start, _ in windows].count("2023-02-01") == 2
+        assert [start for start, _ in windows].count("2023-01-01") == 1
+
+    def test_descending_order_is_restored_across_shards(self):
+        """Test that an order_by is applied over the whole result, not only within shards."""
+        mock_post, _ = self._serve_days()
+
+        df = self._fetch(
+            mock_post,
+            start_reference_date="2023-01-01",
+            end_reference_date="2023-02-28",
+            shard_by="month",
+            order_by=[{"column": "reference_date", "direction": "desc"}],
+        )
+
+        assert df["ONSEnergyLoadDaily.reference_date"].is_monotonic_decreasing
+
+    def test_shards_are_cached_on_their_own(self, tmp_path):
+        """Test that a wider sharded window reuses the shards cached by a narrower one."""
+        mock_post, windows = self._serve_days()
+        psr.lakehouse.result_cache.configure(directory=tmp_path)
+        try:
+            self._fetch(
+                mock_post,
+                start_reference_date="2023-01-01",
+                end_reference_date="2023-01-31",
+                shard_by="month",
+                cache="use",
+            )
+            self._fetch(
+                mock_post,
+                start_reference_date="2023-01-01",
+                end_reference_date="2023-02-28",
+                shard_by="month",
+                cache="use",
+            )
+        finally:
+            psr.lakehouse.result_cache.configure()
+
+        assert windows == [("2023-01-01", "2023-02-01"), ("2023-02-01", "2023-03-01")]
+
+    def test_aggregation_across_shards_raises_error(self):
+        """Test that groups which would straddle shards are refused."""
+        with pytest.raises(LakehouseError, match="within one month"):
+            psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_energy_load_daily",
+                start_reference_date="2023-01-01",
+                end_reference_date="2023-12-31",
+                group_by=["reference_date"],
+                datetime_granularity="year",
+                aggregation_method="sum",
+                shard_by="month",
+            )
+
+    def test_grouping_without_reference_date_raises_error(self):
+        """Test that groups spanning the whole window are refused whatever the granularity."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post") as mock_post:
+            with pytest.raises(LakehouseError, match="group by reference_date"):
+                psr.lakehouse.client.fetch_dataframe(
+                    table_name="ons_energy_load_daily",
+                    start_reference_date="2023-01-01",
+                    end_reference_date="2023-03-31",
+                    group_by=["subsystem"],
+                    datetime_granularity="day",
+                    aggregation_method="sum",
+                    shard_by="month",
+                )
+
+        mock_post.assert_not_called()
+
+    def test_open_window_raises_error(self):
+        """Test that sharding needs both ends of the window."""
+        with pytest.raises(LakehouseError, match="needs both"):
+            psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_energy_load_daily", start_reference_date="2023-01-01", shard_by="month"
+            )
+
+
+# An OpenAPI document listing two tables, one of which has no generated alias.
+ALIAS_DOCUMENT = {
+    "components": {
+        "schemas": {
+            "CCEESpotPrice": {
+                "properties": {
+                    "id": {"type": "integer"},
+                    "reference_date": {"type": "string", "format": "date-time"},
+                    "spot_price": {"type": "number"},
+                    "updated_at": {"type": "string", "format": "date-time"},
+                }
+            },
+            "ONSEnergyLoadDaily": {
+                "properties": {"id": {"type": "integer"}, "reference_date": {"type": "string"}, "value": {}}
+            },
+            "BrandNewTable": {"properties": {"id": {"type": "integer"}, "value": {"type": "number"}}},
+        }
+    }
+}
+
+
+def _serve_alias_document(monkeypatch, document: dict | None = ALIAS_DOCUMENT):
+    """Serve `document` as the OpenAPI document, or fail to load one when it is None."""
+    from psr.lakehouse.openapi import openapi_spec
+
+    def load():
+        if document is None:
+            raise LakehouseError("Request to https://test-api.example.com/openapi.json failed")
+        return document
+
+    monkeypatch.setattr(openapi_spec, "document", load)
+
+
+class TestFetchMany:
+    @pytest.fixture(autouse=True)
+    def alias_document(self, monkeypatch):
+        _serve_alias_document(monkeypatch)
+
+    @staticmethod
+    def _serve_tables(delay: float = 0.0, fail: set | None = None):
+        """A stand-in for connector.post returning one row tagged with the queried table.
+
+        Queries of a model in `fail` raise LakehouseError.
+        """
+        import time
+
+        queried = []
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            model = json_body["query_data"][0].split(".")[0]
+            queried.append(model)
+            time.sleep(delay)
+            if fail and model in fail:
+                raise LakehouseError(f"{model} failed")
+            return make_query_response([{f"{model}.value": 1}])
+
+        return mock_post, queried
+
+    def test_runs_aliases_and_tables(self):
+        """Test that alias names run the alias, and other names are taken as table names."""
+        from unittest.mock import patch
+
+        mock_post, queried = self._serve_tables()
+        with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+            results = psr.lakehouse.client.fetch_many(
+                {
+                    "ccee_spot_price": {"start_reference_date": "2023-01-01"},
+                    "ons_energy_load_daily": {},
+                    "load": {"table_name": "ons_energy_load_daily", "data_columns": ["value"]},
+                }
+            )
+
+        assert list(results) == ["ccee_spot_price", "ons_energy_load_daily", "load"]
+        assert list(results["ccee_spot_price"].columns) == ["CCEESpotPrice.value"]
+        assert list(results["load"].columns) == ["ONSEnergyLoadDaily.value"]
+        assert sorted(queried) == ["CCEESpotPrice", "ONSEnergyLoadDaily", "ONSEnergyLoadDaily"]
+
+    def test_queries_run_concurrently(self):
+        """Test that the batch takes about as long as one query, not the sum."""
+        import time
+        from unittest.mock import patch
+
+        mock_post, _ = self._serve_tables(delay=0.2)
+        queries = {name: {} for name in ("ccee_spot_price", "ons_energy_load_daily", "brand_new_table")}
+        with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+            started = time.perf_counter()
+            psr.lakehouse.client.fetch_many(queries, max_concurrency=3)
+            elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.5
+
+    def test_failures_are_reported_per_query(self):
+        """Test that a failed query leaves the others' results on the raised error."""
+        from unittest.mock import patch
+
+        from psr.lakehouse.exceptions import LakehouseBatchError
+
+        mock_post, _ = self._serve_tables(fail={"ONSEnergyLoadDaily"})
+        reported = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+            with pytest.raises(LakehouseBatchError) as exc_info:
+                psr.lakehouse.client.fetch_many(
+                    {"ccee_spot_price": {}, "ons_energy_load_daily": {}},
+                    progress=lambda name, done, total: reported.append((done, total)),
+                )
+
+        assert list(exc_info.value.errors) == ["ons_energy_load_daily"]
+        assert list(exc_info.value.results) == ["ccee_spot_price"]
+        assert sorted(reported) == [(1, 2), (2, 2)]
+
+    def test_invalid_max_concurrency_raises_error(self):
+        """Test that max_concurrency must be at least 1."""
+        with pytest.raises(LakehouseError, match="max_concurrency"):
+            psr.lakehouse.client.fetch_many({"ccee_spot_price": {}}, max_concurrency=0)
+
+
+class TestQueryCoalescing:
+    def test_identical_concurrent_queries_share_one_fetch(self):
+        """Test that threads asking for the same query at once send its pages only once."""
+        import threading
+        import time
+        from unittest.mock import patch
+
+        calls = []
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            calls.append(params["page"])
+            time.sleep(0.2)
+            return make_query_response([{"CCEESpotPrice.spot_price": 100.0}])
+
+        frames = []
+        with patch.object(psr.lakehouse.connector, "post", side_effect=mock_post):
+            threads = [
+                threading.Thread(
+                    target=lambda: frames.append(psr.lakehouse.client.fetch_dataframe(table_name="ccee_spot_price"))
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert calls == [1]
+        assert len(frames) == 4
+        assert all(frame["CCEESpotPrice.spot_price"].tolist() == [100.0] for frame in frames)
+
+        # Each caller's frame is its own: changing one leaves the others alone.
+        frames[0].loc[0, "CCEESpotPrice.spot_price"] = 0.0
+        assert all(frame["CCEESpotPrice.spot_price"].tolist() == [100.0] for frame in frames[1:])
+
+
+class TestAliases:
+    def test_alias_is_resolved_from_the_openapi_document(self, monkeypatch):
+        """Test that an alias fetches the columns the OpenAPI document lists, less internal ones."""
+        from unittest.mock import patch
+
+        _serve_alias_document(monkeypatch)
+        with patch.object(psr.lakehouse.connector, "post") as mock_post:
+            mock_post.return_value = make_query_response([{"CCEESpotPrice.spot_price": 100.0}])
+            df = psr.lakehouse.client.ccee_spot_price(start_reference_date="2023-01-01")
+
+        assert df["CCEESpotPrice.spot_price"].tolist() == [100.0]
+        assert mock_post.call_args.args[1]["query_data"] == [
+            "CCEESpotPrice.reference_date",
+            "CCEESpotPrice.spot_price",
+        ]
+        assert "ccee_spot_price" in dir(psr.lakehouse.client)
+
+    def test_new_table_has_an_alias_at_once(self, monkeypatch):
+        """Test that a table missing from the generated aliases can be fetched through its alias."""
+        from unittest.mock import patch
+
+        _serve_alias_document(monkeypatch)
+        with patch.object(psr.lakehouse.connector, "post") as mock_post:
+            mock_post.return_value = make_query_response([{"BrandNewTable.value": 1.0}])
+            psr.lakehouse.client.brand_new_table()
+
+        assert mock_post.call_args.args[1]["query_data"] == ["BrandNewTable.value"]
+
+    def test_document_is_indexed_once(self, monkeypatch):
+        """Test that the tables are worked out once per document, not on every lookup."""
+        from unittest.mock import patch
+
+        from psr.lakehouse.client import Client
+
+        _serve_alias_document(monkeypatch, {"components": {"schemas": dict(ALIAS_DOCUMENT["components"]["schemas"])}})
+        with patch.object(Client, "_find_table_names", wraps=psr.lakehouse.client._find_table_names) as find:
+            for _ in range(3):
+                assert psr.lakehouse.client._resolve_alias("ons_energy_load_daily") is not None
+
+        assert find.call_count == 1
+
+    def test_generated_aliases_stand_in_offline(self, monkeypatch):
+        """Test that without the OpenAPI document the generated aliases are used."""
+        from unittest.mock import patch
+
+        _serve_alias_document(monkeypatch, None)
+        with patch.object(psr.lakehouse.connector, "post") as mock_post:
+            mock_post.return_value = make_query_response([{"CCEESpotPrice.spot_price": 100.0}])
+            psr.lakehouse.client.ccee_spot_price()
+
+        assert mock_post.call_args.args[1]["query_data"] == [
+            "CCEESpotPrice.spot_price",
+            "CCEESpotPrice.reference_date",
+            "CCEESpotPrice.subsystem",
+        ]
+
+    def test_failed_document_is_not_asked_for_again(self, monkeypatch):
+        """Test that once the OpenAPI document fails to load, aliases stop asking for it until max_age."""
+        from unittest.mock import patch
+
+        from psr.lakehouse.openapi import openapi_spec
+
+        loads = []
+
+        def load():
+            loads.append(1)
+            raise LakehouseError("Request to https://test-api.example.com/openapi.json failed")
+
+        monkeypatch.setattr(openapi_spec, "document", load)
+        with patch.object(psr.lakehouse.connector, "post") as mock_post:
+            mock_post.return_value = make_query_response([{"CCEESpotPrice.spot_price": 100.0}])
+            for _ in range(3):
+                psr.lakehouse.client.ccee_spot_price()
+
+        assert len(loads) == 1
+        assert mock_post.call_count == 3
+
+    def test_unreachable_api_is_not_tried_again(self, monkeypatch):
+        """Test that a connector failing to initialize is not set up again on every alias lookup."""
+        from psr.lakehouse.connector import connector
+
+        attempts = []
+
+        def initialize(*args, **kwargs):
+            attempts.append(1)
+            raise LakehouseError("API at https://test-api.example.com is not reachable")
+
+        monkeypatch.setattr(connector, "_is_initialized", False)
+        monkeypatch.setattr(connector, "initialize", initialize)
+        for _ in range(3):
+            assert psr.lakehouse.client._resolve_alias("ccee_spot_price") is not None
+
+        assert len(attempts) == 1
+
+    def test_names_that_are_no_table_make_no_request(self, monkeypatch):
+        """Test that hasattr on names no document or generated alias lists does not load the document."""
+        from psr.lakehouse.openapi import openapi_spec
+
+        loads = []
+
+        def load():
+            loads.append(1)
+            return ALIAS_DOCUMENT
+
+        monkeypatch.setattr(openapi_spec, "document", load)
+        assert not hasattr(psr.lakehouse.client, "isReady")
+        assert loads == []
+
+        assert not hasattr(psr.lakehouse.client, "no_such_table")
+        assert not hasattr(psr.lakehouse.client, "no_such_table_either")
+        assert len(loads) == 1
+
+    def test_unknown_attribute_raises_attribute_error(self, monkeypatch):
+        """Test that a name that is neither a method nor a table is an AttributeError."""
+        _serve_alias_document(monkeypatch)
+        with pytest.raises(AttributeError, match="no_such_table"):
+            psr.lakehouse.client.no_such_table  # noqa: B018
+
+
+class TestDateParsing:
+    def test_window_across_dst_change_is_parsed(self):
+        """Test that a result holding two UTC offsets parses into the output timezone."""
+        from unittest.mock import patch
+
+        data = [
+            {"ONSEnergyLoadDaily.reference_date": "2018-11-03T23:00:00-03:00", "ONSEnergyLoadDaily.value": 1},
+            {"ONSEnergyLoadDaily.reference_date": "2018-11-04T01:00:00-02:00", "ONSEnergyLoadDaily.value": 2},
+        ]
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(data)):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ons_energy_load_daily")
+
+        dates = df["ONSEnergyLoadDaily.reference_date"]
+        assert str(dates.dtype) == "datetime64[us, America/Sao_Paulo]"
+        assert (dates[1] - dates[0]) == pd.Timedelta(hours=1)
+
+    def test_every_date_time_column_is_parsed(self):
+        """Test that date-time columns other than reference_date are parsed too, and text is not."""
+        from unittest.mock import patch
+
+        data = [
+            {
+                "ONSEnergyLoadDaily.reference_date": "2024-01-01T00:00:00-03:00",
+                "ONSEnergyLoadDaily.updated_at": "2024-01-02T10:30:00-03:00",
+                "ONSEnergyLoadDaily.deleted_at": None,
+                "ONSEnergyLoadDaily.subsystem": "SUL",
+            },
+            {
+                "ONSEnergyLoadDaily.reference_date": "2024-01-02T00:00:00-03:00",
+                "ONSEnergyLoadDaily.updated_at": "2024-01-03T10:30:00-03:00",
+                "ONSEnergyLoadDaily.deleted_at": "2024-01-04T08:00:00-03:00",
+                "ONSEnergyLoadDaily.subsystem": "NORTE",
+            },
+        ]
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(data)):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ons_energy_load_daily")
+
+        for column in ("reference_date", "updated_at", "deleted_at"):
+            assert str(df[f"ONSEnergyLoadDaily.{column}"].dtype) == "datetime64[us, America/Sao_Paulo]"
+        assert df["ONSEnergyLoadDaily.deleted_at"].isna().tolist() == [True, False]
+        assert df["ONSEnergyLoadDaily.subsystem"].tolist() == ["SUL", "NORTE"]
+
+    @staticmethod
+    def _serve_pages(pages: list[list[tuple]]):
+        """A stand-in for connector.post serving pages of (reference_date, deleted_at, note) rows."""
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            page = params["page"]
+            return make_query_response(
+                [
+                    {
+                        "ONSEnergyLoadDaily.reference_date": reference_date,
+                        "ONSEnergyLoadDaily.deleted_at": deleted_at,
+                        "ONSEnergyLoadDaily.note": note,
+                    }
+                    for reference_date, deleted_at, note in pages[page - 1]
+                ],
+                page=page,
+                has_next=page < len(pages),
+            )
+
+        return mock_post
+
+    def test_columns_keep_one_dtype_across_pages(self):
+        """Test that a column null on the first page is still parsed, and text stays text on later pages."""
+        from unittest.mock import patch
+
+        pages = [
+            [("2024-01-01T00:00:00-03:00", None, "checked")],
+            [("2024-01-02T00:00:00-03:00", "2024-01-03T00:00:00-03:00", "2024-01-02T10:00:00-03:00")],
+        ]
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(pages)):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ons_energy_load_daily")
+
+        assert str(df["ONSEnergyLoadDaily.deleted_at"].dtype) == "datetime64[us, America/Sao_Paulo]"
+        assert df["ONSEnergyLoadDaily.note"].tolist() == ["checked", "2024-01-02T10:00:00-03:00"]
+
+    def test_text_that_only_starts_like_a_date_stays_text(self):
+        """Test that a column whose values do not parse as date-times is left as text, not an error."""
+        pytest.importorskip("pyarrow")
+        from unittest.mock import patch
+
+        pages = [[("2024-01-01T00:00:00-03:00", None, "2024-01-01T10:00 maintenance")]]
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(pages)):
+            df = psr.lakehouse.client.fetch_dataframe(table_name="ons_energy_load_daily")
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(pages)):
+            table = psr.lakehouse.client.fetch_arrow(table_name="ons_energy_load_daily")
+
+        assert df["ONSEnergyLoadDaily.note"].tolist() == ["2024-01-01T10:00 maintenance"]
+        assert table.column("ONSEnergyLoadDaily.note").to_pylist() == ["2024-01-01T10:00 maintenance"]
+
+
+class TestDeduplicate:
+    VERSIONS = [
+        ("G1", 100, "2024-01-01T00:00:00-03:00", None),
+        ("G1", 110, "2024-02-01T00:00:00-03:00", None),
+        ("G2", 50, "2024-01-01T00:00:00-03:00", None),
+        ("G2", 55, "2024-02-01T00:00:00-03:00", "2024-03-01T00:00:00-03:00"),
+        ("G3", 70, "2024-01-01T00:00:00-03:00", "2024-03-01T00:00:00-03:00"),
+    ]
+
+    @classmethod
+    def _serve_pages(cls, pages: list[slice]):
+        """A stand-in for connector.post serving VERSIONS in the given pages."""
+
+        def mock_post(url, json_body, params=None, timeout=None):
+            page = params["page"]
+            rows = cls.VERSIONS[pages[page - 1]]
+            return make_query_response(
+                [
+                    {
+                        "ONSGeneratorData.code": code,
+                        "ONSGeneratorData.capacity": capacity,
+                        "ONSGeneratorData.updated_at": updated_at,
+                        "ONSGeneratorData.deleted_at": deleted_at,
+                    }
+                    for code, capacity, updated_at, deleted_at in rows
+                ],
+                page=page,
+                has_next=page < len(pages),
+            )
+
+        return mock_post
+
+    def test_keeps_latest_non_deleted_version(self):
+        """Test that the result holds one current version per key, ordered by key then updated_at."""
+        from unittest.mock import patch
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([slice(None)])) as mock_post:
+            df = psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_generator_data",
+                data_columns=["code", "capacity"],
+                deduplicate=["code"],
+            )
+
+        json_body = mock_post.call_args.args[1]
+        # Deleted latest versions must come back for the reduction to drop their datapoint.
+        assert json_body["latest_only"] is False
+        assert json_body["query_data"] == [
+            "ONSGeneratorData.code",
+            "ONSGeneratorData.capacity",
+            "ONSGeneratorData.updated_at",
+            "ONSGeneratorData.deleted_at",
+        ]
+        assert json_body["order_by"] == [
+            {"column": "ONSGeneratorData.code", "direction": "asc"},
+            {"column": "ONSGeneratorData.updated_at", "direction": "asc"},
+        ]
+        assert list(df.columns) == ["ONSGeneratorData.code", "ONSGeneratorData.capacity"]
+        # G2's latest version is deleted, so it is gone rather than back at its older version.
+        assert df.to_dict("list") == {"ONSGeneratorData.code": ["G1"], "ONSGeneratorData.capacity": [110]}
+
+    def test_streaming_carries_a_key_across_pages(self):
+        """Test that versions of one datapoint split across pages are reduced together, deletions included."""
+        from unittest.mock import patch
+
+        pages = [slice(0, 1), slice(1, 3), slice(3, 5)]
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages(pages)) as mock_post:
+            chunks = list(
+                psr.lakehouse.client.iter_dataframes(
+                    table_name="ons_generator_data",
+                    data_columns=["code", "capacity", "updated_at"],
+                    deduplicate=["code"],
+                )
+            )
+
+        assert all(call.args[1]["latest_only"] is False for call in mock_post.call_args_list)
+        assert [chunk["ONSGeneratorData.capacity"].tolist() for chunk in chunks] == [[110]]
+        assert "ONSGeneratorData.updated_at" in chunks[0].columns
+        assert "ONSGeneratorData.deleted_at" not in chunks[0].columns
+
+    def test_natural_key_from_schema(self, monkeypatch):
+        """Test that deduplicate=True keys on the natural key the table schema declares."""
+        from unittest.mock import patch
+
+        document = {
+            "components": {
+                "schemas": {
+                    "ONSGeneratorData": {
+                        "x-natural-key": ["code"],
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "code": {"type": "string"},
+                            "capacity": {"type": "number"},
+                            "updated_at": {"type": "string", "format": "date-time"},
+                            "deleted_at": {"type": "string", "format": "date-time"},
+                        },
+                    }
+                }
+            }
+        }
+        _serve_alias_document(monkeypatch, document)
+
+        with patch.object(psr.lakehouse.connector, "post", side_effect=self._serve_pages([slice(None)])) as mock_post:
+            df = psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_generator_data", data_columns=["code", "capacity"], deduplicate=True
+            )
+
+        assert mock_post.call_args.args[1]["order_by"][0] == {"column": "ONSGeneratorData.code", "direction": "asc"}
+        assert df["ONSGeneratorData.capacity"].tolist() == [110]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"order_by": [{"column": "code", "direction": "desc"}]},
+            {"group_by": ["code"], "aggregation_method": "sum"},
+            {"backend": "polars"},
+            {"shard_by": "month", "start_reference_date": "2024-01-01", "end_reference_date": "2024-03-01"},
+        ],
+    )
+    def test_unsupported_combinations_raise(self, kwargs):
+        """Test that options the reduction cannot honour are rejected before any request."""
+        with pytest.raises(LakehouseError, match="deduplicate"):
+            psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_generator_data", data_columns=["code", "capacity"], deduplicate=["code"], **kwargs
+            )
+
+    def test_query_with_latest_only_raises(self):
+        """Test that a custom query still deduplicated server-side is rejected before any request."""
+        json_body = psr.lakehouse.client._build_query_body(
+            "ons_generator_data",
+            data_columns=["code", "capacity", "updated_at", "deleted_at"],
+            order_by=[{"column": "code", "direction": "asc"}, {"column": "updated_at", "direction": "asc"}],
+        )
+        with pytest.raises(LakehouseError, match="latest_only"):
+            psr.lakehouse.client.fetch_dataframe_from_query(json_body, deduplicate=["ONSGeneratorData.code"])
+
+    def test_default_key_spans_columns_not_fetched(self, monkeypatch):
+        """Test that without a declared key, rows differing only in a column not fetched stay apart."""
+        from unittest.mock import patch
+
+        document = {
+            "components": {
+                "schemas": {
+                    "ONSPlantGeneration": {
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "reference_date": {"type": "string", "format": "date-time"},
+                            "plant": {"type": "string"},
+                            "value": {"type": "number"},
+                            "updated_at": {"type": "string", "format": "date-time"},
+                            "deleted_at": {"type": "string", "format": "date-time"},
+                        },
+                    }
+                }
+            }
+        }
+        _serve_alias_document(monkeypatch, document)
+        data = [
+            {
+                "ONSPlantGeneration.reference_date": "2024-01-01T00:00:00-03:00",
+                "ONSPlantGeneration.value": 5.0,
+                "ONSPlantGeneration.plant": plant,
+                "ONSPlantGeneration.updated_at": "2024-01-02T00:00:00-03:00",
+                "ONSPlantGeneration.deleted_at": None,
+            }
+            for plant in ("P1", "P2")
+        ]
+
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(data)) as mock_post:
+            df = psr.lakehouse.client.fetch_dataframe(
+                table_name="ons_plant_generation", data_columns=["reference_date", "value"], deduplicate=True
+            )
+
+        assert "ONSPlantGeneration.plant" in mock_post.call_args.args[1]["query_data"]
+        assert list(df.columns) == ["ONSPlantGeneration.reference_date", "ONSPlantGeneration.value"]
+        assert df["ONSPlantGeneration.value"].tolist() == [5.0, 5.0]
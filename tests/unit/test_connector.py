@@ -305,3 +305,152 @@ class TestConnectorRequests:
 
         assert connector._is_initialized is True
         assert result == mock_response
+
+
+def _run_in_threads(fn, count: int) -> list:
+    """Run `fn` from `count` threads at once and collect what each returned or raised."""
+    import threading
+
+    outcomes = [None] * count
+    barrier = threading.Barrier(count)
+
+    def run(i):
+        barrier.wait()
+        try:
+            outcomes[i] = fn()
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+class TestConnectorThreadSafety:
+    @responses.activate
+    def test_initialize_sets_pool_sizes(self):
+        """Test that the connection pool of the session can be sized."""
+        connector = Connector.__new__(Connector)
+        connector._is_initialized = False
+
+        _mock_health_check("https://api.example.com")
+        connector.initialize(base_url="https://api.example.com", pool_connections=4, pool_maxsize=64)
+
+        adapter = connector._session.get_adapter("https://api.example.com")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
+
+    def test_pool_sizes_from_environment_variables(self, monkeypatch):
+        """Test that the pool sizes default to the environment variables."""
+        monkeypatch.setenv("LAKEHOUSE_POOL_MAXSIZE", "8")
+
+        session = Connector._create_session()
+
+        assert session.get_adapter("https://api.example.com")._pool_maxsize == 8
+
+    def test_invalid_pool_size_raises_error(self):
+        """Test that a pool must hold at least one connection."""
+        with pytest.raises(LakehouseError, match="pool_maxsize"):
+            Connector._create_session(pool_maxsize=0)
+
+    @responses.activate
+    def test_concurrent_first_requests_initialize_once(self, monkeypatch):
+        """Test that threads using an uninitialized connector at once run one health check."""
+        monkeypatch.setenv("LAKEHOUSE_API_URL", "https://api.example.com")
+        connector = Connector.__new__(Connector)
+        connector._is_initialized = False
+
+        _mock_health_check("https://api.example.com")
+        responses.add(responses.GET, "https://api.example.com/query/schema", json={"tables": []})
+
+        outcomes = _run_in_threads(lambda: connector.get("/query/schema"), count=8)
+
+        assert outcomes == [{"tables": []}] * 8
+        assert len([call for call in responses.calls if "health-check" in call.request.url]) == 1
+
+    @responses.activate
+    def test_concurrent_bounces_log_in_once(self, monkeypatch):
+        """Test that threads bounced by the same expired session wait for a single login."""
+        import time
+
+        from psr.lakehouse import auth
+
+        connector = Connector.__new__(Connector)
+        logins = []
+
+        def ensure_login(session, base_url):
+            time.sleep(0.1)
+            logins.append(base_url)
+            session.cookies.set("logged_in", "1")
+
+        monkeypatch.setattr(auth, "ensure_login", ensure_login)
+        monkeypatch.setattr(
+            auth, "bounced_to_idp", lambda response, base_url: response.request.headers.get("Cookie") is None
+        )
+        responses.add(responses.GET, "https://test-api.example.com/query/schema", json={"tables": []})
+
+        outcomes = _run_in_threads(lambda: connector.get("/query/schema"), count=8)
+
+        assert outcomes == [{"tables": []}] * 8
+        assert logins == ["https://test-api.example.com"]
+
+
+class TestConnectorWithoutHealthCheck:
+    @responses.activate
+    def test_initialize_without_check_sends_nothing(self):
+        """Test that initialize(check=False) does not contact the API."""
+        connector = Connector.__new__(Connector)
+        connector._is_initialized = False
+
+        connector.initialize(base_url="https://api.example.com", check=False)
+
+        assert connector._is_initialized is True
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_environment_variable_skips_health_check(self, monkeypatch):
+        """Test that LAKEHOUSE_SKIP_HEALTHCHECK defers contacting the API to the first request."""
+        monkeypatch.setenv("LAKEHOUSE_API_URL", "https://api.example.com")
+        monkeypatch.setenv("LAKEHOUSE_SKIP_HEALTHCHECK", "1")
+        connector = Connector.__new__(Connector)
+        connector._is_initialized = False
+
+        responses.add(responses.GET, "https://api.example.com/query/schema", json={"tables": []})
+
+        assert connector.get("/query/schema") == {"tables": []}
+        assert [call.request.url for call in responses.calls] == ["https://api.example.com/query/schema"]
+
+    @responses.activate
+    def test_unreachable_api_is_reported_by_the_first_request(self):
+        """Test that without a health check the first request says the API cannot be reached."""
+        connector = Connector.__new__(Connector)
+        connector.initialize(base_url="https://api.example.com", check=False)
+
+        responses.add(
+            responses.POST,
+            "https://api.example.com/query/",
+            body=requests.exceptions.ConnectionError("Connection refused"),
+        )
+
+        with pytest.raises(LakehouseError, match="Unable to connect to API at https://api.example.com"):
+            connector.post("/query/", {"query_data": []})
+
+    @responses.activate
+    def test_later_failures_name_the_request(self):
+        """Test that once the API has answered, a failed request is reported as such."""
+        connector = Connector.__new__(Connector)
+        connector.initialize(base_url="https://api.example.com", check=False)
+
+        responses.add(responses.GET, "https://api.example.com/query/schema", json={"tables": []})
+        responses.add(
+            responses.POST,
+            "https://api.example.com/query/",
+            body=requests.exceptions.ConnectionError("Connection reset"),
+        )
+
+        connector.get("/query/schema")
+        with pytest.raises(LakehouseError, match="Request to https://api.example.com/query/ failed"):
+            connector.post("/query/", {"query_data": []})
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+import responses
+
+import psr.lakehouse
+from psr.lakehouse import decoders
+from psr.lakehouse.exceptions import LakehouseError
+
+PAGE = {
+    "data": {"columns": ["Model.value", "Model.name"], "rows": [[1.5, "NORTE"], [None, "SUL"]]},
+    "pagination": {"page": 1, "page_size": 2, "has_next": False, "has_prev": False},
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_decoder():
+    """Go back to the default decoder after each test."""
+    yield
+    decoders.set_json_decoder(None)
+
+
+class TestJsonDecoders:
+    @pytest.mark.parametrize("name", decoders.JSON_DECODERS)
+    def test_every_decoder_returns_plain_objects(self, name):
+        """Test that each installed decoder reads a page into the same dicts and lists."""
+        pytest.importorskip(name)
+        assert decoders.get_json_decoder(name)(json.dumps(PAGE).encode()) == PAGE
+
+    def test_unsupported_decoder_raises_error(self):
+        """Test that an unknown decoder name is rejected."""
+        with pytest.raises(LakehouseError, match="Unsupported JSON decoder"):
+            decoders.get_json_decoder("simdjson")
+
+    @responses.activate
+    def test_connector_uses_chosen_decoder(self):
+        """Test that the connector decodes responses with the decoder set on it."""
+        responses.add(responses.POST, "https://test-api.example.com/query/", json=PAGE, status=200)
+        seen = []
+
+        def decode(content: bytes):
+            seen.append(content)
+            return json.loads(content)
+
+        psr.lakehouse.connector.set_json_decoder(decode)
+        assert psr.lakehouse.connector.post("/query/", {}) == PAGE
+        assert len(seen) == 1
+
+    @responses.activate
+    def test_invalid_json_raises_lakehouse_error(self):
+        """Test that a malformed body surfaces as a LakehouseError, whichever decoder is in use."""
+        responses.add(responses.POST, "https://test-api.example.com/query/", body=b'{"data": [', status=200)
+
+        with pytest.raises(LakehouseError, match="Invalid JSON"):
+            psr.lakehouse.connector.post("/query/", {})
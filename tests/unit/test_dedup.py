@@ -0,0 +1,110 @@
+import pandas as pd
+
+from psr.lakehouse.dedup import LatestVersions, latest_versions
+
+KEY = ["T.code"]
+
+
+def _frame(rows: list[tuple]) -> pd.DataFrame:
+    """Rows of (code, value, updated_at, deleted_at) as a result of model T."""
+    return pd.DataFrame(rows, columns=["T.code", "T.value", "T.updated_at", "T.deleted_at"])
+
+
+class TestLatestVersions:
+    def test_keeps_latest_version_per_key(self):
+        """Test that each key keeps the row with the greatest updated_at, whatever its position."""
+        dedup = LatestVersions(KEY, "T.updated_at", "T.deleted_at")
+        df = _frame(
+            [
+                ("A", 1, "2024-01-02", None),
+                ("A", 2, "2024-01-01", None),
+                ("B", 3, "2024-01-01", None),
+                ("B", 4, "2024-01-03", None),
+            ]
+        )
+
+        done = dedup.feed(df)
+        rest = dedup.flush()
+
+        assert done["T.value"].tolist() == [1]
+        assert rest["T.value"].tolist() == [4]
+
+    def test_deleted_latest_version_drops_the_datapoint(self):
+        """Test that a datapoint whose latest version is soft-deleted does not fall back to an older one."""
+        dedup = LatestVersions(KEY, "T.updated_at", "T.deleted_at")
+        df = _frame(
+            [
+                ("A", 1, "2024-01-01", None),
+                ("A", 2, "2024-02-01", "2024-02-01"),
+                ("B", 3, "2024-01-01", "2024-01-03"),
+                ("B", 4, "2024-01-02", None),
+                ("C", 5, "2024-01-01", None),
+            ]
+        )
+
+        out = pd.concat([dedup.feed(df), dedup.flush()], ignore_index=True)
+
+        assert out["T.code"].tolist() == ["B", "C"]
+        assert out["T.value"].tolist() == [4, 5]
+
+    def test_deletion_in_next_chunk_drops_carried_datapoint(self):
+        """Test that a deletion arriving in the next chunk still takes out the datapoint held back."""
+        dedup = LatestVersions(KEY, "T.updated_at", "T.deleted_at")
+
+        first = dedup.feed(_frame([("A", 1, "2024-01-01", None), ("B", 2, "2024-01-01", None)]))
+        second = dedup.feed(_frame([("B", 3, "2024-01-02", "2024-01-02")]))
+        rest = dedup.flush()
+
+        assert first["T.value"].tolist() == [1]
+        assert second.empty
+        assert rest is None
+
+    def test_key_spanning_chunks_is_carried_over(self):
+        """Test that a datapoint split across chunks is reduced as a whole."""
+        dedup = LatestVersions(KEY, "T.updated_at", "T.deleted_at")
+
+        first = dedup.feed(_frame([("A", 1, "2024-01-01", None), ("B", 2, "2024-01-01", None)]))
+        second = dedup.feed(_frame([("B", 3, "2024-01-02", None), ("C", 4, "2024-01-01", None)]))
+        rest = dedup.flush()
+
+        assert first["T.value"].tolist() == [1]
+        assert second["T.value"].tolist() == [3]
+        assert rest["T.value"].tolist() == [4]
+
+    def test_composite_key_with_missing_values(self):
+        """Test that a key over several columns groups missing values together."""
+        dedup = LatestVersions(["T.code", "T.value"], "T.updated_at", "T.deleted_at")
+        df = _frame(
+            [
+                ("A", None, "2024-01-01", None),
+                ("A", None, "2024-01-02", None),
+                ("A", 1, "2024-01-01", None),
+            ]
+        )
+
+        out = pd.concat([dedup.feed(df), dedup.flush()], ignore_index=True)
+
+        assert out["T.updated_at"].tolist() == ["2024-01-02", "2024-01-01"]
+
+
+class TestLatestVersionsStream:
+    def test_every_datapoint_comes_out_once(self):
+        """Test that the stream yields each datapoint in exactly one chunk."""
+        chunks = [
+            _frame([("A", 1, "2024-01-01", None), ("A", 2, "2024-01-02", None)]),
+            _frame([("A", 3, "2024-01-03", None), ("B", 4, "2024-01-01", None)]),
+        ]
+
+        out = list(latest_versions(iter(chunks), KEY))
+
+        assert [chunk["T.value"].tolist() for chunk in out] == [[3], [4]]
+
+    def test_empty_result_yields_one_empty_frame(self):
+        """Test that a result with nothing left still yields a frame with its columns."""
+        chunks = [_frame([("A", 1, "2024-01-01", "2024-01-02")])]
+
+        out = list(latest_versions(iter(chunks), KEY))
+
+        assert len(out) == 1
+        assert out[0].empty
+        assert list(out[0].columns) == ["T.code", "T.value", "T.updated_at", "T.deleted_at"]
@@ -0,0 +1,86 @@
+import pandas as pd
+
+from psr.lakehouse.dtypes import parse_datetimes, typed_array
+
+
+class TestTypedArray:
+    def test_integer_is_nullable_int64(self):
+        """Test that integer fields keep their nulls without turning into floats."""
+        array = typed_array([1, None, 3], {"type": "integer"})
+        assert array.dtype == "Int64"
+        assert array.isna().tolist() == [False, True, False]
+
+    def test_integer_with_fractions_falls_back_to_float64(self):
+        """Test that an aggregate of an integer column, such as an average, still converts."""
+        assert typed_array([1.5, 2], {"type": "integer"}).dtype == "Float64"
+
+    def test_number_is_float64(self):
+        """Test that number fields become nullable floats."""
+        assert typed_array([1.5, None], {"type": "number"}).dtype == "Float64"
+
+    def test_date_time_is_tz_aware_across_offsets(self):
+        """Test that date-times with different offsets are parsed into the output timezone."""
+        array = typed_array(
+            ["2018-11-03T23:00:00-03:00", "2018-11-04T23:00:00-02:00", None],
+            {"type": "string", "format": "date-time"},
+            "America/Sao_Paulo",
+        )
+        assert str(array.dtype).endswith("America/Sao_Paulo]")
+        assert array[0] == pd.Timestamp("2018-11-04T02:00:00Z")
+        assert pd.isna(array[2])
+
+    def test_date_time_without_offset_is_localized(self):
+        """Test that local date-times are taken to be in the output timezone."""
+        array = typed_array(["2023-05-01T00:00:00"], {"type": "string", "format": "date-time"}, "America/Sao_Paulo")
+        assert array[0] == pd.Timestamp("2023-05-01T03:00:00Z")
+
+    def test_enum_is_categorical_with_all_enum_values(self):
+        """Test that enums become categories over every enum value, whether present or not."""
+        array = typed_array(["NORTH", None], {"type": "enum", "enum_values": ["NORTH", "SOUTH"]})
+        assert isinstance(array, pd.Categorical)
+        assert list(array.categories) == ["NORTH", "SOUTH"]
+
+    def test_enum_with_unknown_value_stays_text(self):
+        """Test that a value missing from the schema's enum is kept rather than lost as NaN."""
+        array = typed_array(["NORTH", "NEW"], {"type": "enum", "enum_values": ["NORTH", "SOUTH"]})
+        assert isinstance(array.dtype, pd.StringDtype)
+        assert list(array) == ["NORTH", "NEW"]
+
+    def test_string_is_string_dtype(self):
+        """Test that text fields become string arrays rather than object arrays."""
+        assert isinstance(typed_array(["a", None], {"type": "string"}).dtype, pd.StringDtype)
+
+    def test_unknown_field_is_left_to_inference(self):
+        """Test that columns without a mapping are left to pandas."""
+        assert typed_array([[1], [2]], {"type": "array"}) is None
+        assert typed_array([1], None) is None
+
+
+class TestParseDatetimes:
+    VALUES = ["2023-10-14T23:00:00-03:00", None, "2023-10-15T01:00:00-02:00", "2023-10-15T04:00:00Z"]
+
+    def test_matches_parsing_through_utc(self):
+        """Test that splitting offsets off gives the same instants as pandas' own ISO 8601 parser."""
+        expected = pd.to_datetime(pd.Series(self.VALUES, dtype=object), format="ISO8601", utc=True)
+
+        array = parse_datetimes(self.VALUES, "America/Sao_Paulo")
+
+        assert str(array.dtype) == "datetime64[us, America/Sao_Paulo]"
+        pd.testing.assert_series_equal(
+            pd.Series(array).dt.tz_convert("UTC"), expected, check_dtype=False, check_names=False
+        )
+
+    def test_missing_values_are_nat(self):
+        """Test that None and NaN become NaT."""
+        array = parse_datetimes(["2024-01-01T00:00:00-03:00", None, float("nan")])
+        assert pd.Series(array).isna().tolist() == [False, True, True]
+
+    def test_other_offset_forms_fall_back(self):
+        """Test that offsets written without a colon are still parsed."""
+        array = parse_datetimes(["2024-01-01T00:00:00-0300", "2024-01-01T03:00:00+0000"], "UTC")
+        assert pd.Series(array).tolist() == [pd.Timestamp("2024-01-01T03:00:00Z")] * 2
+
+    def test_fractional_seconds(self):
+        """Test that fractional seconds are kept."""
+        array = parse_datetimes(["2024-01-01T00:00:00.250-03:00"], "UTC")
+        assert pd.Series(array)[0] == pd.Timestamp("2024-01-01T03:00:00.250Z")
@@ -0,0 +1,204 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+import psr.lakehouse
+from psr.lakehouse.exceptions import LakehouseError
+from psr.lakehouse.local import _gaps, local_mirror
+
+from .test_client import _serve_alias_document, make_query_response
+
+pytest.importorskip("duckdb")
+
+DOCUMENT = {
+    "components": {
+        "schemas": {
+            "CCEESpotPrice": {
+                "properties": {
+                    "id": {"type": "integer"},
+                    "reference_date": {"type": "string", "format": "date-time"},
+                    "subsystem": {"type": "string"},
+                    "spot_price": {"type": "number"},
+                }
+            }
+        }
+    }
+}
+
+
+def _prices(days: list[str]) -> list[dict]:
+    """Daily spot prices of two subsystems, in UTC as the mirror fetches them."""
+    return [
+        {
+            "CCEESpotPrice.id": i,
+            "CCEESpotPrice.reference_date": f"{day}T03:00:00+00:00",
+            "CCEESpotPrice.subsystem": subsystem,
+            "CCEESpotPrice.spot_price": price,
+        }
+        for i, (day, subsystem, price) in enumerate(
+            (day, subsystem, price) for day in days for subsystem, price in (("SUL", 10.0), ("NORTE", 30.0))
+        )
+    ]
+
+
+@pytest.fixture(autouse=True)
+def mirror(tmp_path, monkeypatch):
+    _serve_alias_document(monkeypatch, DOCUMENT)
+    local_mirror.configure(path=tmp_path / "mirror.duckdb")
+    yield local_mirror
+    local_mirror.configure()
+
+
+def _hourly_prices(day: str) -> list[dict]:
+    """Hourly SUL spot prices through one UTC day, the price being the hour."""
+    return [
+        {
+            "CCEESpotPrice.id": hour,
+            "CCEESpotPrice.reference_date": f"{day}T{hour:02d}:00:00+00:00",
+            "CCEESpotPrice.subsystem": "SUL",
+            "CCEESpotPrice.spot_price": float(hour),
+        }
+        for hour in range(24)
+    ]
+
+
+class TestGaps:
+    def test_uncovered_days_around_and_between_intervals(self):
+        """Test that the gaps are the days of the window no interval covers."""
+        intervals = [(date(2024, 1, 5), date(2024, 1, 10)), (date(2024, 1, 15), date(2024, 1, 20))]
+
+        gaps = _gaps(intervals, date(2024, 1, 1), date(2024, 1, 31))
+
+        assert gaps == [
+            (date(2024, 1, 1), date(2024, 1, 4)),
+            (date(2024, 1, 11), date(2024, 1, 14)),
+            (date(2024, 1, 21), date(2024, 1, 31)),
+        ]
+
+    def test_whole_table_covers_everything(self):
+        """Test that an interval with open ends leaves no gap."""
+        assert _gaps([(date.min, date.max)], date.min, date.max) == []
+
+
+class TestLocalMirror:
+    def test_covered_query_runs_locally(self, mirror):
+        """Test that filters, grouping and aggregation are answered from the mirror alone."""
+        days = ["2024-01-01", "2024-01-02", "2024-02-01"]
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(_prices(days))):
+            # Through March 1 UTC, where the last São Paulo day of February ends.
+            assert mirror.mirror("ccee_spot_price", "2024-01-01", "2024-03-01") == 6
+
+        with patch.object(psr.lakehouse.connector, "post") as mock_post:
+            df = mirror.fetch_dataframe(
+                "ccee_spot_price",
+                data_columns=["spot_price"],
+                filters={"subsystem": ["SUL", "NORTE"]},
+                start_reference_date="2024-01-01",
+                end_reference_date="2024-02-29",
+                group_by=["reference_date", "subsystem"],
+                datetime_granularity="month",
+                aggregation_method="sum",
+                order_by=[
+                    {"column": "subsystem", "direction": "desc"},
+                    {"column": "reference_date", "direction": "asc"},
+                ],
+            )
+
+        mock_post.assert_not_called()
+        assert list(df.columns) == [
+            "CCEESpotPrice.reference_date",
+            "CCEESpotPrice.subsystem",
+            "CCEESpotPrice.spot_price",
+        ]
+        assert df["CCEESpotPrice.subsystem"].tolist() == ["SUL", "SUL", "NORTE", "NORTE"]
+        assert df["CCEESpotPrice.spot_price"].tolist() == [20.0, 10.0, 60.0, 30.0]
+        assert str(df["CCEESpotPrice.reference_date"].dtype) == "datetime64[us, America/Sao_Paulo]"
+        assert df["CCEESpotPrice.reference_date"].dt.day.unique().tolist() == [1]
+
+    def test_uncovered_days_come_from_the_api(self, mirror):
+        """Test that only the days the mirror lacks are fetched, and queried with the local rows."""
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(_prices(["2024-01-01"]))):
+            mirror.mirror("ccee_spot_price", "2024-01-01", "2024-01-01")
+
+        with patch.object(
+            psr.lakehouse.connector, "post", return_value=make_query_response(_prices(["2024-01-02"]))
+        ) as mock_post:
+            df = mirror.fetch_dataframe(
+                "ccee_spot_price",
+                data_columns=["reference_date", "spot_price"],
+                filters={"subsystem": "SUL"},
+                start_reference_date="2024-01-01",
+                end_reference_date="2024-01-02",
+            )
+
+        assert mock_post.call_count == 1
+        filters = mock_post.call_args.args[1]["query_filters"]
+        assert {"column": "CCEESpotPrice.reference_date", "value": "2024-01-02", "operator": ">="} in filters
+        assert {"column": "CCEESpotPrice.subsystem", "value": "SUL", "operator": "="} in filters
+        assert df["CCEESpotPrice.reference_date"].dt.day.tolist() == [1, 2]
+        assert df["CCEESpotPrice.spot_price"].tolist() == [10.0, 10.0]
+
+    def test_without_fallback_uncovered_days_raise(self, mirror):
+        """Test that fallback=False refuses to go to the API."""
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(_prices(["2024-01-01"]))):
+            mirror.mirror("ccee_spot_price", "2024-01-01", "2024-01-01")
+
+        with pytest.raises(LakehouseError, match="UTC days 2024-01-02 to 2024-01-06"):
+            mirror.fetch_dataframe(
+                "ccee_spot_price", start_reference_date="2024-01-01", end_reference_date="2024-01-05", fallback=False
+            )
+
+    def test_table_not_mirrored_is_fetched_remotely(self, mirror):
+        """Test that a query on a table the mirror does not hold goes to the API as a whole."""
+        with patch.object(psr.lakehouse.client, "fetch_dataframe", return_value="remote") as mock_fetch:
+            assert mirror.fetch_dataframe("ccee_spot_price", data_columns=["spot_price"]) == "remote"
+
+        assert mock_fetch.call_args.kwargs["data_columns"] == ["spot_price"]
+
+    def test_mirroring_a_window_again_replaces_it(self, mirror):
+        """Test that re-mirroring a window refreshes its rows and merges the coverage."""
+        with patch.object(
+            psr.lakehouse.connector, "post", return_value=make_query_response(_prices(["2024-01-01", "2024-01-02"]))
+        ):
+            mirror.mirror("ccee_spot_price", "2024-01-01", "2024-01-02")
+        with patch.object(
+            psr.lakehouse.connector, "post", return_value=make_query_response(_prices(["2024-01-02", "2024-01-03"]))
+        ):
+            mirror.mirror("ccee_spot_price", "2024-01-02", "2024-01-03")
+
+        df = mirror.fetch_dataframe(
+            "ccee_spot_price", start_reference_date="2024-01-01", end_reference_date="2024-01-03", output_timezone="UTC"
+        )
+
+        assert len(df) == 6
+        assert mirror.coverage("ccee_spot_price") == [(date(2024, 1, 1), date(2024, 1, 3))]
+        assert mirror.tables() == ["ccee_spot_price"]
+
+    def test_hourly_rows_keep_to_utc_days(self, mirror):
+        """Test that mirroring a window again and querying another timezone agree on the days held."""
+        for _ in range(2):
+            with patch.object(
+                psr.lakehouse.connector, "post", return_value=make_query_response(_hourly_prices("2024-01-01"))
+            ):
+                mirror.mirror("ccee_spot_price", "2024-01-01", "2024-01-01")
+
+        held = mirror.fetch_dataframe(
+            "ccee_spot_price", start_reference_date="2024-01-01", end_reference_date="2024-01-01", output_timezone="UTC"
+        )
+        assert len(held) == 24
+        with pytest.raises(LakehouseError, match="UTC days 2024-01-02 to 2024-01-02"):
+            mirror.fetch_dataframe(
+                "ccee_spot_price", start_reference_date="2024-01-01", end_reference_date="2024-01-01", fallback=False
+            )
+
+        # A São Paulo day runs from 03:00 UTC to 03:00 UTC of the next day.
+        with patch.object(
+            psr.lakehouse.connector, "post", return_value=make_query_response(_hourly_prices("2024-01-02"))
+        ):
+            df = mirror.fetch_dataframe(
+                "ccee_spot_price", start_reference_date="2024-01-01", end_reference_date="2024-01-01"
+            )
+
+        assert len(df) == 24
+        assert df["CCEESpotPrice.spot_price"].tolist() == [*range(3, 24), 0.0, 1.0, 2.0]
@@ -1,4 +1,4 @@
-from psr.lakehouse.metadata import get_model_name
+from psr.lakehouse.metadata import get_model_name, to_snake
 
 
 class TestGetModelName:
@@ -41,3 +41,14 @@ class TestGetModelName:
     def test_camel_case_input(self):
         """Test that CamelCase input remains unchanged."""
         assert get_model_name("ONSEnergyLoadDaily") == "ONSEnergyLoadDaily"
+
+
+class TestToSnake:
+    def test_acronym_prefix(self):
+        """Test that an uppercase prefix becomes one word."""
+        assert to_snake("CCEESpotPrice") == "ccee_spot_price"
+
+    def test_round_trips_with_get_model_name(self):
+        """Test that the table name maps back to the model name."""
+        for model_name in ("ONSEnergyLoadDaily", "EPEEnergyConsumptionMonthly", "ANEELDistributedGenerationProjects"):
+            assert get_model_name(to_snake(model_name)) == model_name
@@ -0,0 +1,129 @@
+import time
+
+import pytest
+import requests
+import responses
+
+import psr.lakehouse
+from psr.lakehouse.exceptions import LakehouseError
+from psr.lakehouse.openapi import openapi_spec
+
+SPEC_URL = "https://test-api.example.com/openapi.json"
+
+MOCK_OPENAPI = {
+    "components": {
+        "schemas": {
+            "ONSEnergyLoadDaily": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "reference_date": {"type": "string", "format": "date-time"},
+                    "subsystem": {"$ref": "#/components/schemas/Subsystem"},
+                    "region": {"anyOf": [{"$ref": "#/components/schemas/Region"}, {"type": "null"}]},
+                    "load_block": {"allOf": [{"$ref": "#/components/schemas/LoadBlock"}]},
+                    "updated_at": {"type": "string", "format": "date-time"},
+                },
+            },
+            "Subsystem": {"enum": ["NORTE", "SUL"]},
+            "Region": {"enum": ["N", "S"]},
+            "LoadBlock": {"enum": ["HEAVY", "LIGHT"]},
+        }
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_spec():
+    yield
+    openapi_spec.configure()
+    openapi_spec.clear()
+
+
+class TestOpenAPISpecMemo:
+    @responses.activate
+    def test_introspection_downloads_spec_once(self):
+        """Test that schema calls, enum references included, share a single download."""
+        responses.add(responses.GET, SPEC_URL, json=MOCK_OPENAPI, headers={"ETag": '"v1"'})
+
+        schema = psr.lakehouse.client.get_schema("ons_energy_load_daily")
+        psr.lakehouse.client.list_tables()
+        psr.lakehouse.client.get_table_columns("ons_energy_load_daily")
+
+        assert schema["subsystem"]["enum_values"] == ["NORTE", "SUL"]
+        assert schema["region"]["enum_values"] == ["N", "S"]
+        assert schema["load_block"]["enum_values"] == ["HEAVY", "LIGHT"]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_stale_copy_is_revalidated_with_etag(self):
+        """Test that an expired memo is revalidated with If-None-Match and kept on a 304."""
+        responses.add(responses.GET, SPEC_URL, json=MOCK_OPENAPI, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, SPEC_URL, status=304, headers={"ETag": '"v1"'})
+        openapi_spec.configure(max_age=0)
+
+        first = openapi_spec.document()
+        second = openapi_spec.document()
+
+        assert second == first
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @responses.activate
+    def test_changed_spec_replaces_memo(self):
+        """Test that a revalidation answered with a new document replaces the old one."""
+        changed = {"components": {"schemas": {"Other": {"properties": {"id": {}}}}}}
+        responses.add(responses.GET, SPEC_URL, json=MOCK_OPENAPI, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, SPEC_URL, json=changed, headers={"ETag": '"v2"'})
+        openapi_spec.configure(max_age=0)
+
+        openapi_spec.document()
+
+        assert psr.lakehouse.client.list_tables() == ["Other"]
+
+
+class TestOpenAPISpecOnDisk:
+    @responses.activate
+    def test_disk_copy_spares_a_new_process_the_download(self, tmp_path):
+        """Test that a copy on disk is revalidated instead of downloaded again."""
+        openapi_spec.configure(directory=tmp_path)
+        responses.add(responses.GET, SPEC_URL, json=MOCK_OPENAPI, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, SPEC_URL, status=304, headers={"ETag": '"v1"'})
+
+        openapi_spec.document()
+        openapi_spec.clear()  # what a new process would start from
+        document = openapi_spec.document()
+
+        assert document == MOCK_OPENAPI
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert len(list(tmp_path.glob("openapi-*.json"))) == 1
+
+    @responses.activate
+    def test_disk_copy_is_used_when_api_is_unreachable(self, tmp_path):
+        """Test that the disk copy stands in for the API when revalidation fails."""
+        openapi_spec.configure(directory=tmp_path)
+        responses.add(responses.GET, SPEC_URL, json=MOCK_OPENAPI, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, SPEC_URL, body=requests.exceptions.ConnectionError("offline"))
+
+        openapi_spec.document()
+        openapi_spec.clear()
+
+        assert openapi_spec.document() == MOCK_OPENAPI
+
+    @responses.activate
+    def test_unreachable_api_without_copy_raises_error(self):
+        """Test that with nothing held the failure is reported."""
+        responses.add(responses.GET, SPEC_URL, body=requests.exceptions.ConnectionError("offline"))
+
+        with pytest.raises(LakehouseError, match="failed"):
+            openapi_spec.document()
+
+    def test_fresh_memo_needs_no_request(self, tmp_path):
+        """Test that within max_age the memo is served without touching the network."""
+        openapi_spec._entries["https://test-api.example.com"] = {
+            "document": MOCK_OPENAPI,
+            "etag": None,
+            "checked_at": time.time(),
+        }
+
+        with responses.RequestsMock():  # any request would raise
+            assert openapi_spec.document() == MOCK_OPENAPI
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import psr.lakehouse
+
+
+def _run(code: str) -> str:
+    """Run `code` in a fresh interpreter, where nothing is imported yet."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+class TestLazyImports:
+    def test_package_import_does_not_load_pandas(self):
+        """Test that importing the package and the command line leaves pandas unloaded."""
+        assert _run("import sys, psr.lakehouse.__main__; print('pandas' in sys.modules)") == "False"
+
+    def test_client_is_loaded_on_first_access(self):
+        """Test that touching `client` imports it, as the Client instance."""
+        output = _run(
+            "import sys, psr.lakehouse; c = psr.lakehouse.client; print(type(c).__name__, 'pandas' in sys.modules)"
+        )
+        assert output == "Client True"
+
+    def test_client_submodule_import_keeps_the_instance(self):
+        """Test that importing the `client` submodule does not replace the package's `client` instance."""
+        output = _run("import psr.lakehouse.client; from psr.lakehouse import client; print(type(client).__name__)")
+        assert output == "Client"
+
+    def test_lazy_attributes_are_listed(self):
+        """Test that lazy attributes show up in dir() and resolve like eager ones."""
+        assert {"client", "result_cache", "AsyncClient"} <= set(dir(psr.lakehouse))
+        assert psr.lakehouse.result_cache is psr.lakehouse.cache.result_cache
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from psr.lakehouse.singleflight import SingleFlight
+
+
+def _run_concurrently(flight: SingleFlight, key: str, fn, callers: int) -> list:
+    """Call flight.do from `callers` threads at once and collect what each got back."""
+    outcomes = [None] * callers
+
+    def call(i):
+        try:
+            outcomes[i] = flight.do(key, fn)
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_run(self):
+        """Test that callers arriving while a call runs wait for it instead of running their own."""
+        flight = SingleFlight()
+        release = threading.Event()
+        runs = []
+
+        def fn():
+            runs.append(1)
+            release.wait(5)
+            return "result"
+
+        threading.Timer(0.2, release.set).start()
+        outcomes = _run_concurrently(flight, "key", fn, callers=4)
+
+        assert len(runs) == 1
+        assert all(result == "result" for result, _ in outcomes)
+        assert sorted(shared for _, shared in outcomes) == [False, True, True, True]
+        assert flight.in_flight() == 0
+
+    def test_error_is_shared(self):
+        """Test that every waiting caller receives the running call's exception."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait(5)
+            raise ValueError("boom")
+
+        threading.Timer(0.2, release.set).start()
+        outcomes = _run_concurrently(flight, "key", fn, callers=3)
+
+        assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+        assert flight.in_flight() == 0
+
+    def test_finished_calls_are_not_reused(self):
+        """Test that a call made after another finished runs again."""
+        flight = SingleFlight()
+        results = iter([1, 2])
+
+        assert flight.do("key", lambda: next(results)) == (1, False)
+        assert flight.do("key", lambda: next(results)) == (2, False)
+
+    def test_different_keys_run_separately(self):
+        """Test that calls with different keys do not wait for each other."""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: "a") == ("a", False)
+        assert flight.do("b", lambda: "b") == ("b", False)
+        with pytest.raises(KeyError):
+            flight.do("c", lambda: {}["missing"])
+        assert flight.in_flight() == 0
@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import psr.lakehouse
+from psr.lakehouse.exceptions import LakehouseError
+from psr.lakehouse.sync import TableStore
+
+from .test_client import make_query_response
+
+TABLE = "ons_generator_data"
+
+
+def _changes(rows: list[tuple]) -> pd.DataFrame:
+    """Rows of (id, capacity, updated_at, deleted_at) as fetched by a sync."""
+    df = pd.DataFrame(
+        rows,
+        columns=[
+            "ONSGeneratorData.id",
+            "ONSGeneratorData.capacity",
+            "ONSGeneratorData.updated_at",
+            "ONSGeneratorData.deleted_at",
+        ],
+    )
+    for column in ("ONSGeneratorData.updated_at", "ONSGeneratorData.deleted_at"):
+        df[column] = pd.to_datetime(df[column]).dt.tz_localize("America/Sao_Paulo")
+    return df
+
+
+def _records(rows: list[tuple]) -> list[dict]:
+    """Rows of (id, capacity, updated_at, deleted_at) as the API returns them."""
+    return [
+        {
+            "ONSGeneratorData.id": id,
+            "ONSGeneratorData.capacity": capacity,
+            "ONSGeneratorData.updated_at": updated_at,
+            "ONSGeneratorData.deleted_at": deleted_at,
+        }
+        for id, capacity, updated_at, deleted_at in rows
+    ]
+
+
+class TestTableStore:
+    def test_changes_replace_rows_by_id(self, tmp_path):
+        """Test that a later change of a row replaces it and a soft-deleted row drops out."""
+        store = TableStore(tmp_path)
+        store.apply(TABLE, _changes([(1, 100, "2024-01-01", None), (2, 50, "2024-01-01", None)]), "q")
+        store.apply(TABLE, _changes([(1, 110, "2024-02-01", None), (2, 50, "2024-02-01", "2024-02-01")]), "q")
+
+        df = store.read(TABLE)
+
+        assert df["ONSGeneratorData.id"].tolist() == [1]
+        assert df["ONSGeneratorData.capacity"].tolist() == [110]
+        assert store.watermark(TABLE) == "2024-02-01T00:00:00-03:00"
+        assert store.tables() == [TABLE]
+
+    def test_parts_are_compacted(self, tmp_path):
+        """Test that going past max_parts merges the parts into one, without deleted rows."""
+        store = TableStore(tmp_path, max_parts=2)
+        store.apply(TABLE, _changes([(1, 100, "2024-01-01", None), (2, 50, "2024-01-01", None)]), "q")
+        store.apply(TABLE, _changes([(2, 50, "2024-01-02", "2024-01-02")]), "q")
+        store.apply(TABLE, _changes([(3, 70, "2024-01-03", None)]), "q")
+
+        parts = list((tmp_path / TABLE).glob("part-*.parquet"))
+        assert len(parts) == 1
+        assert len(pd.read_parquet(parts[0])) == 2
+        assert store.read(TABLE)["ONSGeneratorData.id"].tolist() == [1, 3]
+
+    def test_unsynced_table_raises(self, tmp_path):
+        """Test that reading a table never synced is an error."""
+        with pytest.raises(LakehouseError, match="has not been synced"):
+            TableStore(tmp_path).read(TABLE)
+
+
+class TestClientSync:
+    def test_first_sync_fetches_history_then_only_changes(self, tmp_path):
+        """Test that later syncs ask only for rows past the watermark, with latest_only off."""
+        responses = [
+            make_query_response(
+                _records(
+                    [
+                        (1, 100, "2024-01-01T00:00:00-03:00", None),
+                        (2, 50, "2024-01-02T00:00:00-03:00", None),
+                    ]
+                )
+            ),
+            make_query_response(
+                _records(
+                    [
+                        (1, 100, "2024-01-03T00:00:00-03:00", "2024-01-03T00:00:00-03:00"),
+                        (3, 70, "2024-01-03T00:00:00-03:00", None),
+                    ]
+                )
+            ),
+        ]
+        with patch.object(psr.lakehouse.connector, "post", side_effect=responses) as mock_post:
+            first = psr.lakehouse.client.sync(TABLE, store=tmp_path, data_columns=["capacity"])
+            second = psr.lakehouse.client.sync(TABLE, store=tmp_path, data_columns=["capacity"])
+
+        first_body = mock_post.call_args_list[0].args[1]
+        second_body = mock_post.call_args_list[1].args[1]
+        assert first_body["latest_only"] is False
+        assert "query_filters" not in first_body
+        assert second_body["query_filters"] == [
+            {"column": "ONSGeneratorData.updated_at", "value": "2024-01-02T00:00:00-03:00", "operator": ">"}
+        ]
+        assert (first, second) == (2, 2)
+
+        df = TableStore(tmp_path).read(TABLE)
+        assert df["ONSGeneratorData.id"].tolist() == [2, 3]
+
+    def test_other_columns_need_full_sync(self, tmp_path):
+        """Test that a mirror is not fed changes of a different query unless rebuilt."""
+        data = _records([(1, 100, "2024-01-01T00:00:00-03:00", None)])
+        with patch.object(psr.lakehouse.connector, "post", return_value=make_query_response(data)):
+            psr.lakehouse.client.sync(TABLE, store=tmp_path, data_columns=["capacity"])
+
+            with pytest.raises(LakehouseError, match="full=True"):
+                psr.lakehouse.client.sync(TABLE, store=tmp_path, data_columns=["capacity", "name"])
+
+            applied = psr.lakehouse.client.sync(TABLE, store=tmp_path, data_columns=["capacity"], full=True)
+
+        assert applied == 1
@@ -0,0 +1,79 @@
+import gzip
+import json
+
+import pytest
+import responses
+
+import psr.lakehouse
+from psr.lakehouse.transfer import Transfer, TransferStats, accept_encoding
+
+PAGE = {"data": {"columns": ["Model.value"], "rows": [[i] for i in range(2000)]}, "pagination": {"has_next": False}}
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    psr.lakehouse.connector.transfer_stats.reset()
+    yield
+    psr.lakehouse.connector.transfer_stats.reset()
+
+
+class TestAcceptEncoding:
+    def test_codings_are_ranked_best_first(self):
+        """Test that zstd and brotli are preferred over gzip when they can be decoded."""
+        assert accept_encoding({"gzip", "deflate", "br", "zstd"}) == "zstd, br;q=0.9, gzip;q=0.8, deflate;q=0.7"
+
+    def test_only_decodable_codings_are_offered(self):
+        """Test that codings whose package is missing are not advertised."""
+        assert accept_encoding({"gzip", "deflate"}) == "gzip, deflate;q=0.9"
+
+    def test_session_advertises_codings(self):
+        """Test that the connector's session sends the ranked Accept-Encoding header."""
+        session = psr.lakehouse.connector._create_session()
+        assert session.headers["Accept-Encoding"].startswith(("zstd", "br", "gzip"))
+
+
+class TestTransferStats:
+    @responses.activate
+    def test_compressed_response_is_decoded_and_counted(self):
+        """Test that a gzip body is decompressed and counted both compressed and decompressed."""
+        body = json.dumps(PAGE).encode()
+        responses.add(
+            responses.POST,
+            "https://test-api.example.com/query/",
+            body=gzip.compress(body),
+            headers={"Content-Encoding": "gzip"},
+            status=200,
+        )
+
+        assert psr.lakehouse.connector.post("/query/", {}) == PAGE
+
+        stats = psr.lakehouse.connector.transfer_stats
+        assert stats.requests == 1
+        assert stats.body_bytes == len(body)
+        assert stats.wire_bytes == len(gzip.compress(body))
+        assert stats.ratio > 3
+        assert stats.by_encoding == {"gzip": 1}
+        assert stats.last.encoding == "gzip"
+
+    @responses.activate
+    def test_uncompressed_response_counts_the_same_twice(self):
+        """Test that an identity-encoded body has equal wire and decoded sizes."""
+        responses.add(responses.POST, "https://test-api.example.com/query/", json=PAGE, status=200)
+
+        psr.lakehouse.connector.post("/query/", {})
+
+        last = psr.lakehouse.connector.transfer_stats.last
+        assert last.encoding is None
+        assert last.wire_bytes == last.body_bytes
+
+    def test_last_is_per_thread(self):
+        """Test that a transfer recorded by another thread is not this thread's last."""
+        import threading
+
+        stats = TransferStats()
+        worker = threading.Thread(target=stats.record, args=(Transfer("u", "gzip", 10, 100),))
+        worker.start()
+        worker.join()
+
+        assert stats.requests == 1
+        assert stats.last is None